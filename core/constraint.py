@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import List
+from typing import List, Tuple
+import numpy as np
 from core.aliases import NumericValue
 
 
@@ -33,3 +34,101 @@ class Constraint:
         self.A = A
         self.relation = relation
         self.b = b
+
+
+class ConstraintSet:
+    """
+    The ConstraintSet class represents a list of constraints compiled into
+    matrices: A_eq x = b_eq for equality constraints and A_ub x <= b_ub for
+    inequality constraints (GEQ constraints are multiplied by -1), so all
+    of them can be checked at once for many solutions.
+    """
+    def __init__(self, constraints: List[Constraint], n: int):
+        """
+        :param constraints: list of constraints
+        :param n: number of components
+        """
+        self.n = n
+        rows = {Relation.EQ: [], Relation.LEQ: [], Relation.GEQ: []}
+        right_sides = {Relation.EQ: [], Relation.LEQ: [], Relation.GEQ: []}
+        for constraint in constraints:
+            if constraint.relation not in rows:
+                raise ValueError("Wrong relation operator")
+            if len(constraint.A) != n:
+                raise ValueError("Number of multipliers should be equal to "
+                                 "number of components")
+            rows[constraint.relation].append(constraint.A)
+            right_sides[constraint.relation].append(constraint.b)
+
+        self.A_eq = np.array(rows[Relation.EQ], dtype=float).reshape(-1, n)
+        self.b_eq = np.array(right_sides[Relation.EQ], dtype=float)
+        self.A_ub = np.concatenate([
+            np.array(rows[Relation.LEQ], dtype=float).reshape(-1, n),
+            -np.array(rows[Relation.GEQ], dtype=float).reshape(-1, n)])
+        self.b_ub = np.concatenate([
+            np.array(right_sides[Relation.LEQ], dtype=float),
+            -np.array(right_sides[Relation.GEQ], dtype=float)])
+
+    def leq_rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns all constraints as rows A x <= b (equality gives two rows).
+
+        :return: 2D np.ndarray with multipliers and np.ndarray with right
+         sides
+        """
+        return np.concatenate([self.A_ub, self.A_eq, -self.A_eq]), \
+            np.concatenate([self.b_ub, self.b_eq, -self.b_eq])
+
+    def is_satisfied(self, combinations: np.ndarray,
+                     tolerance: NumericValue = 1e-9) -> np.ndarray:
+        """
+        Checks which combinations satisfy all constraints.
+
+        :param combinations: 2D np.ndarray with combinations in rows
+        :param tolerance: absolute tolerance of comparisons
+        :return: np.ndarray of booleans
+        """
+        combinations = np.asarray(combinations, dtype=float)
+        return (combinations @ self.A_ub.T <= self.b_ub + tolerance
+                ).all(axis=1) & \
+            (np.abs(combinations @ self.A_eq.T - self.b_eq) <= tolerance
+             ).all(axis=1)
+
+
+def cardinality_constraint(n: int, relation: Relation, k: int
+                           ) -> Constraint:
+    """
+    Creates constraint on number of chosen components.
+
+    :param n: number of components
+    :param relation: relation between number of chosen components and k
+    :param k: number of chosen components
+    :return: Constraint object
+    """
+    return Constraint([1] * n, relation, k)
+
+
+def budget_constraint(costs: List[NumericValue], budget: NumericValue
+                      ) -> Constraint:
+    """
+    Creates constraint limiting total cost of chosen components.
+
+    :param costs: list of costs of components
+    :param budget: maximal total cost
+    :return: Constraint object
+    """
+    return Constraint(list(costs), Relation.LEQ, budget)
+
+
+def group_constraint(n: int, group: List[int]) -> Constraint:
+    """
+    Creates constraint allowing at most one of components from the group.
+
+    :param n: number of components
+    :param group: list of positions of components in the group
+    :return: Constraint object
+    """
+    A = [0] * n
+    for position in group:
+        A[position] = 1
+    return Constraint(A, Relation.LEQ, 1)
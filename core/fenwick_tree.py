@@ -0,0 +1,54 @@
+import operator
+from typing import Callable
+from core.aliases import NumericValue
+
+
+class FenwickTree:
+    """
+    The FenwickTree class represents a binary indexed tree which supports
+    point updates and prefix queries (positions 0..i) of an associative
+    operation (e.g. sum or max) in O(log n).
+    """
+    def __init__(self, size: int,
+                 operation: Callable[[NumericValue, NumericValue],
+                                     NumericValue] = operator.add,
+                 neutral: NumericValue = 0):
+        """
+        :param size: number of positions in the tree
+        :param operation: associative operation combining values
+        :param neutral: neutral element of the operation
+        """
+        self.size = size
+        self.operation = operation
+        self.neutral = neutral
+        self.tree = [neutral] * (size + 1)
+
+    def update(self, i: int, value: NumericValue):
+        """
+        Combines value at position i with given value.
+
+        :param i: position (0-based)
+        :param value: value combined with position i
+        """
+        i += 1
+        tree = self.tree
+        operation = self.operation
+        while i <= self.size:
+            tree[i] = operation(tree[i], value)
+            i += i & -i
+
+    def query(self, i: int) -> NumericValue:
+        """
+        Combines values at positions 0..i.
+
+        :param i: last position (0-based), -1 returns neutral element
+        :return: combined value
+        """
+        i += 1
+        tree = self.tree
+        operation = self.operation
+        result = self.neutral
+        while i > 0:
+            result = operation(result, tree[i])
+            i -= i & -i
+        return result
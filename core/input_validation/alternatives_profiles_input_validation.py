@@ -1,9 +1,17 @@
 import pandas as pd
 
-__all__ = ["alternatives_profiles_validation"]
+__all__ = ["alternatives_profiles_validation",
+           "alternatives_profiles_from_performances_validation",
+           "gaia_validation", "gaia_chunk_validation",
+           "gaia_axes_validation"]
 
 from typing import Tuple, Union
 
+from core.input_validation.preference_input_validation import \
+    _check_performances_with_criteria, _check_preference_thresholds, \
+    _check_indifference_thresholds, _check_standard_deviations, \
+    _check_generalized_criteria, _check_directions
+
 
 def _check_weights(weights: pd.Series):
     """
@@ -86,6 +94,49 @@ def _check_partial_preferences(
                 "the same number of alternatives")
 
 
+def _check_single_criterion_net_flows(
+        single_criterion_net_flows: pd.DataFrame, criteria: pd.Index):
+    """
+    Check if single criterion net flows are valid.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria: pd.Index with criteria names
+    :raises ValueError: if single criterion net flows are not valid
+    """
+
+    # Check if single criterion net flows are passed as a DataFrame
+    if not isinstance(single_criterion_net_flows, pd.DataFrame):
+        raise ValueError("Single criterion net flows should be passed as a "
+                         "DataFrame object")
+
+    # Check if single criterion net flows are numeric
+    if not single_criterion_net_flows.dtypes.values.all() in ['int32',
+                                                              'int64',
+                                                              'float32',
+                                                              'float64']:
+        raise ValueError("Single criterion net flows should be a numeric "
+                         "values")
+
+    # Check if single criterion net flows have all criteria
+    if not set(criteria).issubset(single_criterion_net_flows.columns):
+        raise ValueError("Single criterion net flows should have all "
+                         "criteria as columns")
+
+
+def _check_chunk_size(chunk_size: int):
+    """
+    Check if chunk size is valid.
+
+    :param chunk_size: number of alternatives processed at once
+    :raises ValueError: if chunk size is not valid
+    """
+
+    # Check if chunk size is a positive integer
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("Chunk size should be a positive integer")
+
+
 def _check_if_criteria_are_the_same(criteria_1: pd.Index,
                                     criteria_2: pd.Index):
     """
@@ -118,3 +169,87 @@ def alternatives_profiles_validation(criteria_weights: pd.Series,
     _check_weights(criteria_weights)
     _check_partial_preferences(partial_preferences)
     _check_if_criteria_are_the_same(criteria_from_series, criteria_from_df)
+
+
+def alternatives_profiles_from_performances_validation(
+        criteria_weights: pd.Series,
+        alternatives_performances: pd.DataFrame,
+        preference_thresholds: pd.Series,
+        indifference_thresholds: pd.Series,
+        standard_deviations: pd.Series,
+        generalized_criteria: pd.Series,
+        directions: pd.Series):
+    """
+    Check if input for PrometheeAlternativesProfiles calculated from
+    performances is valid.
+
+    :param criteria_weights: pd.Series with criteria as index and
+    weights as values
+    :param alternatives_performances: pd.DataFrame with alternatives as index
+    and criteria as columns
+    :param preference_thresholds: pd.Series with criteria as index and
+    preference thresholds as values
+    :param indifference_thresholds: pd.Series with criteria as index and
+    indifference thresholds as values
+    :param standard_deviations: pd.Series with criteria as index and
+    standard deviations as values
+    :param generalized_criteria: pd.Series with criteria as index and
+    General criterion enums as values
+    :param directions: pd.Series with criteria as index and Direction enums
+    as values
+    :raises ValueError: if input is not valid
+    """
+    _check_weights(criteria_weights)
+    criteria = criteria_weights.index
+    _check_performances_with_criteria(alternatives_performances, criteria)
+    _check_preference_thresholds(preference_thresholds, criteria)
+    _check_indifference_thresholds(indifference_thresholds, criteria)
+    _check_standard_deviations(standard_deviations, criteria)
+    _check_generalized_criteria(generalized_criteria, criteria)
+    _check_directions(directions, criteria)
+
+
+def gaia_axes_validation(criteria_weights: pd.Series):
+    """
+    Check if input for GAIA axes calculation is valid.
+
+    :param criteria_weights: pd.Series with criteria as index and
+    weights as values
+    :raises ValueError: if input is not valid
+    """
+    _check_weights(criteria_weights)
+
+    # Check if there are at least two criteria to span the plane
+    if len(criteria_weights) < 2:
+        raise ValueError("GAIA plane requires at least two criteria")
+
+
+def gaia_chunk_validation(single_criterion_net_flows: pd.DataFrame,
+                          criteria: pd.Index):
+    """
+    Check if a chunk of single criterion net flows used in GAIA is valid.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria: pd.Index with criteria names
+    :raises ValueError: if input is not valid
+    """
+    _check_single_criterion_net_flows(single_criterion_net_flows, criteria)
+
+
+def gaia_validation(single_criterion_net_flows: pd.DataFrame,
+                    criteria_weights: pd.Series, chunk_size: int):
+    """
+    Check if input for GAIA plane calculation is valid.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria_weights: pd.Series with criteria as index and
+    weights as values
+    :param chunk_size: number of alternatives processed at once
+    :raises ValueError: if input is not valid
+    """
+    gaia_axes_validation(criteria_weights)
+    _check_single_criterion_net_flows(single_criterion_net_flows,
+                                      criteria_weights.index)
+    _check_chunk_size(chunk_size)
@@ -1,7 +1,8 @@
 import pandas as pd
-from typing import List
+from typing import List, Union
 
-from core.constraint import Constraint, Relation
+from core.aliases import NumericValue
+from core.constraint import Constraint, ConstraintSet, Relation
 
 __all__ = ["decision_validation"]
 
@@ -74,13 +75,37 @@ def _check_constraints(constraints: List[Constraint]):
         _check_constraint(constraint)
 
 
-def decision_validation(flows: pd.Series, constraints: List[Constraint]):
+def decision_validation(flows: pd.Series,
+                        constraints: Union[List[Constraint], ConstraintSet],
+                        exhaustive: bool = False, c_optimality: bool = False,
+                        c: NumericValue = None):
     """
     Check if flows and constraints in PrometheeV are valid.
 
     :param flows: pd.Series with alternatives as index and flows as values
-    :param constraints: list of Constraint objects
+    :param constraints: list of Constraint objects or ConstraintSet object
+    :param exhaustive: boolean which indicates if decisions are enumerated
+    :param c_optimality: boolean which indicates if c-optimality is used
+    :param c: constant added to net flows in c-optimality
     :raises ValueError: if any flow or constraint is not valid
     """
     _check_flows(flows)
-    _check_constraints(constraints)
+    if isinstance(constraints, ConstraintSet):
+        # Check if constraint set is compiled for all alternatives
+        if constraints.n != len(flows):
+            raise ValueError("Constraint set should be compiled for all "
+                             "alternatives")
+    else:
+        _check_constraints(constraints)
+
+    # Check if c-optimality is a boolean
+    if not isinstance(c_optimality, bool):
+        raise TypeError("C-optimality parameter should be a boolean value")
+
+    # Check if c is numeric
+    if c is not None and not isinstance(c, (int, float)):
+        raise TypeError("Constant c should be a numeric value")
+
+    # Check if exhaustive is a boolean
+    if not isinstance(exhaustive, bool):
+        raise TypeError("Exhaustive parameter should be a boolean value")
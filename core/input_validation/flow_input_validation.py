@@ -8,6 +8,7 @@ __all__ = ["net_flow_score_validation", "promethee_group_ranking_validation",
            "basic_outranking_flows_validation",
            "profile_based_outranking_flows_validation",
            "calculate_net_outranking_flows_validation",
+           "calculate_net_outranking_flows_batch_validation",
            "check_outranking_flows_type",
            "net_flows_for_multiple_DM_validation"]
 
@@ -185,6 +186,19 @@ def _check_partial_preferences(
                 "the same number of alternatives")
 
 
+def _check_inplace(inplace: bool):
+    """
+    Check if inplace is valid.
+
+    :param inplace: bool
+    :raises ValueError: if inplace is not valid
+    """
+
+    # Check if inplace type is bool
+    if not isinstance(inplace, bool):
+        raise ValueError("Inplace parameter should be a boolean value")
+
+
 def _check_flows_for_aggregated_flows(flows: pd.DataFrame):
     # Check if preferences are passed as a DataFrame
     if not isinstance(flows, pd.DataFrame):
@@ -571,15 +585,38 @@ def profile_based_outranking_flows_validation(
     _check_preferences(profiles_preferences)
 
 
-def calculate_net_outranking_flows_validation(flows: pd.DataFrame):
+def calculate_net_outranking_flows_validation(flows: pd.DataFrame,
+                                              inplace: bool = False):
     """
     Check if parameters for calculating Net outranking flows are valid.
 
     :param flows: pd.DataFrame with alternatives as index and 'positive' and
     'negative' columns
+    :param inplace: bool
     :raises ValueError: if any of the parameters is not valid
     """
     _check_flows(flows)
+    _check_inplace(inplace)
+
+
+def calculate_net_outranking_flows_batch_validation(
+        flows: List[pd.DataFrame]):
+    """
+    Check if parameters for calculating Net outranking flows of many flow
+    tables are valid.
+
+    :param flows: list of pd.DataFrame with alternatives as index and
+    'positive' and 'negative' columns
+    :raises ValueError: if any of the parameters is not valid
+    """
+
+    # Check if flows are passed as a non-empty list
+    if not isinstance(flows, list) or len(flows) == 0:
+        raise ValueError("Flows should be passed as a non-empty list of "
+                         "DataFrame objects")
+
+    for flows_table in flows:
+        _check_flows(flows_table)
 
 
 def check_outranking_flows_type(flow_type: FlowType):
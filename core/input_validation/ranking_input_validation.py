@@ -1,13 +1,24 @@
-from typing import Union, Tuple
+from typing import Union, Tuple, List
 
 from core.aliases import NumericValue
 from core.enums import ScoringFunction, ScoringFunctionDirection
 import pandas as pd
 
 __all__ = ["promethee_i_ranking_validation",
+           "promethee_i_dominance_validation",
+           "promethee_i_hasse_diagram_validation",
+           "promethee_iii_hasse_diagram_validation",
+           "hasse_diagram_export_validation",
            "promethee_iii_ranking_validation",
+           "promethee_iii_relation_counts_validation",
            "net_flow_score_iterative_validation",
-           "promethee_ii_ranking_validation"]
+           "promethee_ii_ranking_validation",
+           "promethee_ii_top_k_validation",
+           "promethee_ii_ranks_validation",
+           "promethee_ii_rank_reversal_validation",
+           "ranking_positions_validation",
+           "ranking_comparison_validation",
+           "rankings_comparison_validation"]
 
 
 from core.input_validation.flow_input_validation import \
@@ -148,6 +159,36 @@ def _check_net_flowsII(net_flows: pd.DataFrame):
         raise ValueError(f"Net Flow should be passed with numeric values")
 
 
+def _check_intervals(intervals: pd.DataFrame):
+    """
+    Check if intervals are valid.
+
+    :param intervals: pd.DataFrame with alternatives as index and 'x', 'y'
+    columns
+    :raise ValueError: if intervals are not valid
+    """
+
+    # Check if intervals are passed as a DataFrame
+    if not isinstance(intervals, pd.DataFrame):
+        raise ValueError("Intervals should be passed as a DataFrame object")
+
+    # Check if intervals dataframe have 'x' and 'y' columns
+    if 'x' not in intervals.columns or 'y' not in intervals.columns:
+        raise ValueError("Intervals dataframe should have 'x' and 'y' "
+                         "columns")
+
+    # Check if intervals are numeric values
+    if not intervals[['x', 'y']].dtypes.values.all() in ['int32', 'int64',
+                                                         'float32',
+                                                         'float64']:
+        raise ValueError("Intervals should be a numeric values")
+
+    # Check if intervals are not reversed
+    if (intervals['x'] > intervals['y']).any():
+        raise ValueError("Beginning of interval (x) should not be greater "
+                         "than its end (y)")
+
+
 def _check_alpha(alpha: NumericValue):
     if not isinstance(alpha, (int, float)):
         raise TypeError("Alpha must be a numeric value")
@@ -166,6 +207,69 @@ def promethee_ii_ranking_validation(net_flow: pd.DataFrame):
     _check_net_flowsII(net_flow)
 
 
+def promethee_ii_top_k_validation(net_flow: pd.DataFrame, k: int,
+                                  bottom: bool):
+    """
+    Check if all inputs are valid for Promethee II top-k ranking.
+
+    :param net_flow: pd.DataFrame with alternatives as index and
+    'net' column at least
+    :param k: number of alternatives in the ranking
+    :param bottom: boolean which indicates if worst alternatives are returned
+    :raise ValueError: if any input is not valid
+    """
+    _check_net_flowsII(net_flow)
+
+    # Check if k is a positive integer
+    if not isinstance(k, int) or isinstance(k, bool) or k <= 0:
+        raise ValueError("Number of alternatives k should be a positive "
+                         "integer")
+
+    # Check if bottom is a boolean
+    if not isinstance(bottom, bool):
+        raise ValueError("Bottom parameter should be a boolean value")
+
+
+def promethee_ii_ranks_validation(net_flow: pd.DataFrame,
+                                  alternatives: List[str]):
+    """
+    Check if all inputs are valid for Promethee II ranks of alternatives.
+
+    :param net_flow: pd.DataFrame with alternatives as index and
+    'net' column at least
+    :param alternatives: list of alternatives
+    :raise ValueError: if any input is not valid
+    """
+    _check_net_flowsII(net_flow)
+
+    # Check if all alternatives are in flows
+    if not isinstance(alternatives, list) or \
+            not set(alternatives).issubset(net_flow.index):
+        raise ValueError("Alternatives should be passed as a list of "
+                         "alternatives present in flows")
+
+
+def promethee_ii_rank_reversal_validation(preferences: pd.DataFrame,
+                                          n_jobs: int):
+    """
+    Check if all inputs are valid for Promethee II rank reversal analysis.
+
+    :param preferences: pd.DataFrame with alternatives as index and
+    alternatives as columns
+    :param n_jobs: number of threads
+    :raise ValueError: if any input is not valid
+    """
+    if isinstance(preferences, tuple):
+        raise ValueError("Preferences should be passed as a DataFrame "
+                         "object")
+    _check_preferences(preferences)
+
+    # Check if number of threads is a positive integer
+    if not isinstance(n_jobs, int) or isinstance(n_jobs, bool) or \
+            n_jobs <= 0:
+        raise ValueError("Number of jobs should be a positive integer")
+
+
 def net_flow_score_iterative_validation(alternative_preferences: pd.DataFrame,
                                         function: ScoringFunction,
                                         direction: ScoringFunctionDirection):
@@ -196,6 +300,21 @@ def promethee_i_ranking_validation(flows: pd.DataFrame,
     _check_weak_preference(weak_preference)
 
 
+def promethee_i_dominance_validation(flows: pd.DataFrame):
+    """
+    Check if all inputs are valid for Promethee I dominance structure.
+
+    :param flows: pd.DataFrame with alternatives as index and
+    'positive', 'negative' columns
+    :raise ValueError: if any input is not valid
+    """
+    _check_flows(flows)
+
+    # Check if there is at least one alternative
+    if len(flows) == 0:
+        raise ValueError("Flows should contain at least one alternative")
+
+
 def promethee_iii_ranking_validation(flows: pd.DataFrame,
                                      preferences: pd.DataFrame,
                                      alpha: NumericValue,
@@ -215,3 +334,158 @@ def promethee_iii_ranking_validation(flows: pd.DataFrame,
     _check_preferences(preferences)
     _check_alpha(alpha)
     _check_decimal_place(decimal_place)
+
+
+def promethee_iii_relation_counts_validation(flows: pd.DataFrame,
+                                             preferences: pd.DataFrame,
+                                             alphas: List[NumericValue],
+                                             decimal_place: NumericValue):
+    """
+    Check if all inputs are valid for PrometheeIII relation counts.
+
+    :param flows: pd.DataFrame with alternatives as index and
+    'positive', 'negative' columns
+    :param preferences: pd.DataFrame with alternatives as index and
+    alternatives as columns
+    :param alphas: list of numeric values used to calculate intervals
+    :param decimal_place: integer with decimal place
+    :raise ValueError: if any input is not valid
+    """
+    _check_flows(flows)
+    _check_preferences(preferences)
+    if not isinstance(alphas, list) or len(alphas) == 0:
+        raise ValueError("Alphas should be passed as a non-empty list")
+    for alpha in alphas:
+        _check_alpha(alpha)
+    _check_decimal_place(decimal_place)
+
+
+def promethee_i_hasse_diagram_validation(flows: pd.DataFrame):
+    """
+    Check if all inputs are valid for Promethee I Hasse diagram.
+
+    :param flows: pd.DataFrame with alternatives as index and
+    'positive', 'negative' columns
+    :raise ValueError: if any input is not valid
+    """
+    _check_flows(flows)
+
+
+def promethee_iii_hasse_diagram_validation(intervals: pd.DataFrame):
+    """
+    Check if all inputs are valid for Promethee III Hasse diagram.
+
+    :param intervals: pd.DataFrame with alternatives as index and 'x', 'y'
+    columns
+    :raise ValueError: if any input is not valid
+    """
+    _check_intervals(intervals)
+
+
+def hasse_diagram_export_validation(edges: pd.DataFrame):
+    """
+    Check if Hasse diagram edges can be exported.
+
+    :param edges: pd.DataFrame with categorical 'source' and 'target'
+    columns
+    :raise ValueError: if edges are not valid
+    """
+
+    # Check if edges are passed as a DataFrame
+    if not isinstance(edges, pd.DataFrame):
+        raise ValueError("Edges should be passed as a DataFrame object")
+
+    # Check if edges have categorical 'source' and 'target' columns
+    if 'source' not in edges.columns or 'target' not in edges.columns or \
+            not isinstance(edges['source'].dtype, pd.CategoricalDtype) or \
+            not isinstance(edges['target'].dtype, pd.CategoricalDtype):
+        raise ValueError("Edges should have categorical 'source' and "
+                         "'target' columns")
+
+
+def ranking_positions_validation(ranking: pd.Series):
+    """
+    Check if ranking with positions as index is valid.
+
+    :param ranking: pd.Series with positions as index and alternatives as
+    values
+    :raise ValueError: if any input is not valid
+    """
+    # Check if ranking is passed as a Series
+    if not isinstance(ranking, pd.Series):
+        raise ValueError("Ranking should be passed as a Series object")
+
+    # Check if every alternative appears only once
+    if not ranking.is_unique:
+        raise ValueError("Every alternative should appear in ranking once")
+
+
+def _check_ranking_positions(ranking: pd.Series):
+    """
+    Check if positions of alternatives are valid.
+
+    :param ranking: pd.Series with alternatives as index and positions as
+    values
+    :raise ValueError: if positions are not valid
+    """
+    # Check if ranking is passed as a Series
+    if not isinstance(ranking, pd.Series):
+        raise ValueError("Ranking should be passed as a Series object")
+
+    # Check if positions are numeric
+    if ranking.dtype not in ['int32', 'int64', 'float32', 'float64'] or \
+            ranking.isnull().any():
+        raise ValueError("Positions of alternatives should be numeric "
+                         "values")
+
+    # Check if every alternative appears only once
+    if not ranking.index.is_unique:
+        raise ValueError("Every alternative should appear in ranking once")
+
+
+def ranking_comparison_validation(ranking_a: pd.Series,
+                                  ranking_b: pd.Series):
+    """
+    Check if two compared rankings are valid.
+
+    :param ranking_a: pd.Series with alternatives as index and positions as
+    values
+    :param ranking_b: pd.Series with alternatives as index and positions as
+    values
+    :raise ValueError: if any input is not valid
+    """
+    _check_ranking_positions(ranking_a)
+    _check_ranking_positions(ranking_b)
+
+    # Check if both rankings contain the same alternatives
+    if set(ranking_a.index) != set(ranking_b.index):
+        raise ValueError("Compared rankings should contain the same "
+                         "alternatives")
+
+
+def rankings_comparison_validation(rankings: pd.DataFrame, k: int = None):
+    """
+    Check if compared rankings are valid.
+
+    :param rankings: pd.DataFrame with alternatives as index, rankings as
+    columns and positions as values
+    :param k: number of best positions, if it is used
+    :raise ValueError: if any input is not valid
+    """
+    # Check if rankings are passed as a DataFrame
+    if not isinstance(rankings, pd.DataFrame):
+        raise ValueError("Rankings should be passed as a DataFrame object")
+
+    for column in rankings.columns:
+        _check_ranking_positions(rankings[column])
+
+    # Check if there are at least two alternatives
+    if len(rankings) < 2:
+        raise ValueError("Rankings should contain at least two "
+                         "alternatives")
+
+    # Check if k is a positive integer
+    if k is not None and (not isinstance(k, int) or isinstance(k, bool) or
+                          k <= 0):
+        raise ValueError("Number of best positions k should be a positive "
+                         "integer")
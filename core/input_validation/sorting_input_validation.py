@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 from typing import List, Union, Tuple
 from core.enums import CompareProfiles, Direction
 
 __all__ = ["group_class_acceptabilities_validation", "prom_sort_validation",
+           "prom_sort_cut_points_validation",
            "promethee_tri_validation", "flow_sort_i_validation",
            "flow_sort_ii_validation", "flow_sort_gdss_validation"]
 
@@ -164,11 +166,10 @@ def _check_assignments(assignments: List[pd.DataFrame],
                              " should be named worse and better")
 
         # Check if assignments dataframe have only valid categories
-        for worse_cat, better_cat in zip(assignment['worse'],
-                                         assignment['better']):
-            if worse_cat not in categories or better_cat not in categories:
-                raise ValueError("Alternative can not be assign to category"
-                                 " that does not exist in categories list")
+        if not assignment['worse'].isin(categories).all() or \
+                not assignment['better'].isin(categories).all():
+            raise ValueError("Alternative can not be assign to category"
+                             " that does not exist in categories list")
 
 
 def _check_if_criteria_are_the_same(criteria_1: pd.Index,
@@ -382,16 +383,16 @@ def _check_profile_based_flows(profile_based_flows: pd.DataFrame,
             "columns: positive, negative, net")
 
     # Check if profile-based flows 'groups' have equal length
-    for index, profile_based_alternative_flows in profile_based_flows.groupby(
-            level=0):
-        if not len(profile_based_alternative_flows) == len(
-                category_profiles) + 1:
-            raise ValueError(
-                f"Number of alternative's group objects in profile-based"
-                f" flows should be equals to "
-                f"number of profiles in category profiles plus 1. "
-                f"Alternative's group {index} has "
-                f"{len(profile_based_alternative_flows)} object")
+    groups_sizes = profile_based_flows.index.get_level_values(
+        0).value_counts().sort_index()
+    invalid_groups = groups_sizes[groups_sizes != len(category_profiles) + 1]
+    if not invalid_groups.empty:
+        raise ValueError(
+            f"Number of alternative's group objects in profile-based"
+            f" flows should be equals to "
+            f"number of profiles in category profiles plus 1. "
+            f"Alternative's group {invalid_groups.index[0]} has "
+            f"{invalid_groups.iloc[0]} object")
 
 
 def _check_net_flows(net_flows: pd.Series):
@@ -460,6 +461,12 @@ def _check_profiles_general_net_flows(
                 f"number of profiles in profiles performances. Profiles group"
                 f" {index} has "
                 f"{len(profiles_general_net_flows_group)} profiles")
+        if sorted(profiles_general_net_flows_group.index.get_level_values(
+                1)) != sorted(profiles_performances[0].index):
+            raise ValueError(
+                f"Profiles in profiles general net flows should be the same "
+                f"as profiles in profiles performances. Profiles group "
+                f"{index} has unknown or duplicated profiles")
 
     # Check if profiles general net flows have numeric values
     if profiles_general_net_flows.dtypes.values.any() not in ['int32',
@@ -607,6 +614,52 @@ def prom_sort_validation(categories: List[str],
     _check_assign_to_better(assign_to_better_class)
 
 
+def prom_sort_cut_points_validation(categories: List[str],
+                                    alternatives_flows: pd.DataFrame,
+                                    category_profiles_flows: pd.DataFrame,
+                                    preference_thresholds: pd.Series,
+                                    category_profiles: pd.DataFrame,
+                                    criteria_directions: pd.Series,
+                                    cut_points: Union[List[Union[int, float]],
+                                                      np.ndarray],
+                                    assign_to_better_class: bool = True):
+    """
+    Check if parameters for Prom Sort with many cut points are valid.
+
+    :param categories: List of categories names as strings
+    :param alternatives_flows: pd.DataFrame with alternatives as index
+    and 'positive' and 'negative' columns
+    :param category_profiles_flows: pd.DataFrame with categories as index
+    and 'positive' and 'negative' columns
+    :param preference_thresholds: pd.Series with criteria as index and
+    preference thresholds as values
+    :param category_profiles: pd.DataFrame with profiles as index
+    and criteria as columns
+    :param criteria_directions: pd.Series with criteria as index and
+    Direction objects as values
+    :param cut_points: 1D sequence or np.ndarray of ints or floats, help in
+    ambiguous cases
+    :param assign_to_better_class: bool, helps in ambiguous cases
+    :raise ValueError: if any parameter is not valid
+    """
+
+    # Check if cut points are passed as a non-empty 1D sequence
+    cut_points = np.asarray(cut_points)
+    if cut_points.ndim != 1 or len(cut_points) == 0:
+        raise ValueError("Cut points should be passed as a non-empty 1D "
+                         "sequence or array")
+
+    # Check if cut points are numeric
+    if not np.issubdtype(cut_points.dtype, np.number):
+        raise ValueError("Cut point parameter should be passed a"
+                         " numeric values")
+
+    prom_sort_validation(categories, alternatives_flows,
+                         category_profiles_flows, preference_thresholds,
+                         category_profiles, criteria_directions,
+                         float(cut_points[0]), assign_to_better_class)
+
+
 def promethee_tri_validation(categories: List[str],
                              criteria_weights: pd.Series,
                              alternatives_partial_preferences: Tuple[
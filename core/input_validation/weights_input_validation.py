@@ -1,6 +1,12 @@
+from typing import Tuple
 import pandas as pd
 
-__all__ = ["srf_weights_validation", "surrogate_weights_validation"]
+__all__ = ["srf_weights_validation", "surrogate_weights_validation",
+           "surrogate_weights_batch_validation",
+           "smaa_weights_validation", "smaa_validation",
+           "weight_stability_validation",
+           "srf_perturbation_weights_validation",
+           "srf_perturbation_validation"]
 
 from core.aliases import NumericValue
 
@@ -92,3 +98,203 @@ def surrogate_weights_validation(criteria_ranks: pd.Series,
    """
     _check_decimal_place(decimal_place)
     _check_criteria_ranks(criteria_ranks)
+
+
+def surrogate_weights_batch_validation(criteria_ranks: pd.DataFrame,
+                                       decimal_place: int):
+    """
+    Check input data for surrogate weights calculation for many rankings.
+
+    :param criteria_ranks: pd.DataFrame with rankings as index, criteria as
+    columns and ranks as values
+    :param decimal_place: integer, decimal place
+    :raises TypeError: if any input data is not valid
+    """
+    _check_decimal_place(decimal_place)
+
+    # Check if criteria ranks are in DataFrame
+    if not isinstance(criteria_ranks, pd.DataFrame):
+        raise TypeError("Criteria ranks must be pandas DataFrame")
+
+    # Check if criteria ranks are numeric
+    if not all(dtype in ['int32', 'int64', 'float32', 'float64']
+               for dtype in criteria_ranks.dtypes):
+        raise TypeError("Criteria ranks must be numeric")
+
+    # Check if there is at least one criterion
+    if criteria_ranks.shape[1] == 0:
+        raise ValueError("There must be at least one criterion")
+
+
+def _check_n_samples(n_samples: int):
+    """
+    Check number of samples.
+
+    :param n_samples: number of samples
+    :raises ValueError: if number of samples is not valid
+    """
+
+    # Check if number of samples is a positive integer
+    if not isinstance(n_samples, int) or isinstance(n_samples, bool) or \
+            n_samples <= 0:
+        raise ValueError("Number of samples must be a positive integer")
+
+
+def smaa_weights_validation(criteria: pd.Index, n_samples: int,
+                            criteria_ranks: pd.Series = None,
+                            criteria_weight_ratio: NumericValue = None):
+    """
+    Check input data for sampling weights in SMAA.
+
+    :param criteria: pd.Index with criteria
+    :param n_samples: number of samples
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+    values or None
+    :param criteria_weight_ratio: ratio of weights of criteria or None
+    :raises ValueError: if any input data is not valid
+    """
+    _check_n_samples(n_samples)
+
+    # Check if there is at least one criterion
+    if len(criteria) == 0:
+        raise ValueError("There must be at least one criterion")
+
+    if criteria_ranks is not None:
+        _check_criteria_ranks(criteria_ranks)
+
+        # Check if ranks are given for all criteria
+        if set(criteria_ranks.index) != set(criteria):
+            raise ValueError("Criteria ranks must be given for all criteria")
+
+    if criteria_weight_ratio is not None:
+        _check_criteria_weight_ratio(criteria_weight_ratio)
+
+        # Check if ranking of criteria is given
+        if criteria_ranks is None:
+            raise ValueError("Criteria weight ratio requires criteria ranks")
+
+
+def smaa_validation(single_criterion_net_flows: pd.DataFrame,
+                    n_samples: int, criteria_ranks: pd.Series = None,
+                    criteria_weight_ratio: NumericValue = None):
+    """
+    Check input data for SMAA.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param n_samples: number of samples
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+    values or None
+    :param criteria_weight_ratio: ratio of weights of criteria or None
+    :raises ValueError: if any input data is not valid
+    """
+
+    # Check if single criterion net flows are a numeric DataFrame
+    if not isinstance(single_criterion_net_flows, pd.DataFrame):
+        raise TypeError("Single criterion net flows must be pandas "
+                        "DataFrame")
+    if not all(dtype in ['int32', 'int64', 'float32', 'float64']
+               for dtype in single_criterion_net_flows.dtypes):
+        raise TypeError("Single criterion net flows must be numeric")
+
+    smaa_weights_validation(single_criterion_net_flows.columns, n_samples,
+                            criteria_ranks, criteria_weight_ratio)
+
+
+def weight_stability_validation(criteria_weights: pd.Series,
+                                single_criterion_net_flows: pd.DataFrame,
+                                k: int = None):
+    """
+    Check input data for weight stability intervals.
+
+    :param criteria_weights: pd.Series with criteria as index and weights as
+    values
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param k: number of first positions of the ranking or None
+    :raises ValueError: if any input data is not valid
+    """
+
+    # Check if criteria weights are a numeric Series
+    if not isinstance(criteria_weights, pd.Series):
+        raise TypeError("Criteria weights must be pandas Series")
+    if criteria_weights.dtype not in ['int32', 'int64', 'float32',
+                                      'float64']:
+        raise TypeError("Criteria weights must be numeric")
+
+    # Check if weights are not negative and at least two are positive
+    if (criteria_weights < 0).any() or (criteria_weights > 0).sum() < 2:
+        raise ValueError("Criteria weights must be non-negative and at "
+                         "least two of them must be positive")
+
+    smaa_validation(single_criterion_net_flows, 1)
+
+    # Check if weights are given for all criteria
+    if set(criteria_weights.index) != set(single_criterion_net_flows.columns):
+        raise ValueError("Criteria weights must be given for all criteria")
+
+    # Check if k is a positive integer
+    if k is not None and (not isinstance(k, int) or isinstance(k, bool) or
+                          k <= 0):
+        raise ValueError("Number of first positions k must be a positive "
+                         "integer")
+
+
+def srf_perturbation_weights_validation(
+        criteria_ranks: pd.Series,
+        criteria_weight_ratio: Tuple[NumericValue, NumericValue],
+        n_samples: int, blank_cards_variation: int):
+    """
+    Check input data for sampling perturbed SRF weights.
+
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+    values
+    :param criteria_weight_ratio: tuple with the lowest and the highest
+    ratio of weights of criteria
+    :param n_samples: number of samples
+    :param blank_cards_variation: maximal change of the number of blank cards
+    :raises ValueError: if any input data is not valid
+    """
+    _check_criteria_ranks(criteria_ranks)
+    _check_n_samples(n_samples)
+
+    # Check if criteria weight ratio is a range of two valid ratios
+    if not isinstance(criteria_weight_ratio, tuple) or \
+            len(criteria_weight_ratio) != 2:
+        raise TypeError("Criteria weight ratio must be a tuple with the "
+                        "lowest and the highest ratio")
+    for ratio in criteria_weight_ratio:
+        _check_criteria_weight_ratio(ratio)
+    if criteria_weight_ratio[0] > criteria_weight_ratio[1]:
+        raise ValueError("The lowest criteria weight ratio can not be "
+                         "greater than the highest one")
+
+    # Check if blank cards variation is a non-negative integer
+    if not isinstance(blank_cards_variation, int) or \
+            isinstance(blank_cards_variation, bool) or \
+            blank_cards_variation < 0:
+        raise ValueError("Blank cards variation must be a non-negative "
+                         "integer")
+
+
+def srf_perturbation_validation(
+        single_criterion_net_flows: pd.DataFrame, criteria_ranks: pd.Series,
+        criteria_weight_ratio: Tuple[NumericValue, NumericValue],
+        n_samples: int, blank_cards_variation: int):
+    """
+    Check input data for SRF perturbation analysis.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+    values
+    :param criteria_weight_ratio: tuple with the lowest and the highest
+    ratio of weights of criteria
+    :param n_samples: number of samples
+    :param blank_cards_variation: maximal change of the number of blank cards
+    :raises ValueError: if any input data is not valid
+    """
+    smaa_validation(single_criterion_net_flows, n_samples, criteria_ranks)
+    srf_perturbation_weights_validation(criteria_ranks,
+                                        criteria_weight_ratio, n_samples,
+                                        blank_cards_variation)
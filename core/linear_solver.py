@@ -1,41 +1,404 @@
+import heapq
 import itertools
 import numpy as np
-from typing import List, Tuple
-from core.constraint import Constraint, Relation
+from typing import List, Optional, Tuple, Union
+from core.constraint import Constraint, ConstraintSet, Relation
 from core.aliases import NumericValue
 
+try:
+    from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+except ImportError:  # SciPy is an optional backend
+    linprog = milp = None
 
-def solve_linear_problem(constraints: List[Constraint], C: List[NumericValue],
-                         n: int) -> Tuple[int]:
+# Number of explored nodes after which the MILP backend takes over
+_NODE_LIMIT = 1000
+# Absolute tolerance used when checking constraints
+_TOLERANCE = 1e-9
+# Tolerance of integrality of LP solutions
+_INTEGRALITY_TOLERANCE = 1e-6
+# Value of components which are not fixed yet
+_FREE = -1
+# Number of components enumerated within one block of bitmasks
+_ENUMERATION_BLOCK_BITS = 16
+# Maximal number of components which can be enumerated
+_ENUMERATION_MAX_COMPONENTS = 63
+
+
+def _leq_rows(constraints: Union[List[Constraint], ConstraintSet],
+              C: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts constraints into rows of the form A x <= b. Equality gives two
+    rows. Additional row keeps the goal function non negative, as the empty
+    decision is always considered.
+
+    :param constraints: list of problem constraints or compiled constraint
+     set
+    :param C: np.ndarray with coefficients in the goal function
+    :param n: number of components
+    :return: 2D np.ndarray with multipliers and np.ndarray with right sides
+    """
+    if not isinstance(constraints, ConstraintSet):
+        constraints = ConstraintSet(constraints, n)
+    A, b = constraints.leq_rows()
+    return np.concatenate([-C[np.newaxis], A]), np.concatenate([[0.0], b])
+
+
+def _propagate(A: np.ndarray, b: np.ndarray, fixed: np.ndarray
+               ) -> Optional[np.ndarray]:
+    """
+    Fixes components which value is forced by constraints. Component is
+    forced when its other value exceeds slack of a constraint at its
+    minimal possible left side.
+
+    :param A: 2D np.ndarray with multipliers of rows A x <= b
+    :param b: np.ndarray with right sides
+    :param fixed: np.ndarray with values of components (-1 if free)
+    :return: np.ndarray with propagated values or None if infeasible
+    """
+    fixed = fixed.copy()
+    while True:
+        free = fixed == _FREE
+        values = np.where(free, 0, fixed)
+        slack = b - A @ values - np.minimum(A, 0) @ free
+        if (slack < -_TOLERANCE).any():
+            return None
+        forced = free & (np.abs(A) > slack[:, np.newaxis] + _TOLERANCE)
+        if not forced.any():
+            return fixed
+        forced_values = A < 0
+        to_one = (forced & forced_values).any(axis=0)
+        to_zero = (forced & ~forced_values).any(axis=0)
+        if (to_one & to_zero).any():
+            return None
+        fixed[to_one] = 1
+        fixed[to_zero] = 0
+
+
+class _Relaxation:
+    """
+    LP relaxations of single constraints. Components with negative multiplier
+    are substituted with 1 - y, so every relaxation is a fractional knapsack
+    solved greedily in order of value to weight ratio.
+    """
+
+    def __init__(self, A: np.ndarray, b: np.ndarray, C: np.ndarray):
+        """
+        :param A: 2D np.ndarray with multipliers of rows A x <= b
+        :param b: np.ndarray with right sides
+        :param C: np.ndarray with coefficients in the goal function
+        """
+        self.A, self.b, self.C = A, b, C
+        self.negative = A < 0
+        self.weights = np.abs(A)
+        self.values = np.where(self.negative, -C, C)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(self.weights > 0,
+                              self.values / self.weights, np.inf)
+        self.orders = np.argsort(-ratios, axis=1, kind='stable')
+
+    def bound(self, fixed: np.ndarray) -> Tuple[float, np.ndarray, int]:
+        """
+        Calculates the tightest bound of the goal function over relaxations
+        of all rows.
+
+        :param fixed: np.ndarray with values of components (-1 if free)
+        :return: bound, np.ndarray with integral part of the greedy solution
+         of the tightest relaxation and its fractional component (-1 if none)
+        """
+        free = fixed == _FREE
+        values = np.where(free, 0, fixed)
+        best = (np.inf, values, _FREE)
+        for k in range(len(self.A)):
+            substituted = free & self.negative[k]
+            capacity = self.b[k] - self.A[k] @ values - \
+                self.A[k][substituted].sum()
+            order = self.orders[k]
+            items = order[free[order] & (self.values[k][order] > 0)]
+            weights = np.cumsum(self.weights[k][items])
+            taken = np.searchsorted(weights, capacity + _TOLERANCE,
+                                    side='right')
+            bound = self.C @ values + self.C[substituted].sum() + \
+                self.values[k][items[:taken]].sum()
+            critical = _FREE
+            if taken < len(items):
+                critical = items[taken]
+                used = weights[taken - 1] if taken else 0.0
+                bound += self.values[k][critical] * \
+                    (capacity - used) / self.weights[k][critical]
+            if bound < best[0]:
+                solution = values.copy()
+                solution[substituted] = 1
+                solution[items[:taken]] = 1 - solution[items[:taken]]
+                best = (bound, solution, critical)
+        return best
+
+
+class _LPRelaxation:
+    """
+    LP relaxation of all constraints at once solved with SciPy (HiGHS).
+    Fixed components are passed as equal bounds.
+    """
+
+    def __init__(self, A: np.ndarray, b: np.ndarray, C: np.ndarray):
+        """
+        :param A: 2D np.ndarray with multipliers of rows A x <= b
+        :param b: np.ndarray with right sides
+        :param C: np.ndarray with coefficients in the goal function
+        """
+        self.A, self.b, self.C = A, b, C
+
+    def bound(self, fixed: np.ndarray) -> Tuple[float, np.ndarray, int]:
+        """
+        Calculates bound of the goal function with LP relaxation.
+
+        :param fixed: np.ndarray with values of components (-1 if free)
+        :return: bound, np.ndarray with LP solution and its most fractional
+         component (-1 if LP solution is integral)
+        """
+        free = fixed == _FREE
+        bounds = np.column_stack([np.where(free, 0, fixed),
+                                  np.where(free, 1, fixed)])
+        result = linprog(-self.C, A_ub=self.A, b_ub=self.b, bounds=bounds,
+                         method='highs')
+        if result.status != 0:
+            return -np.inf, np.where(free, 0, fixed), _FREE
+        x = np.clip(result.x, 0, 1)
+        fractionality = np.where(free, np.minimum(x, 1 - x), 0)
+        critical = int(np.argmax(fractionality))
+        if fractionality[critical] <= _INTEGRALITY_TOLERANCE:
+            return -result.fun, np.round(x).astype(np.int8), _FREE
+        return -result.fun, x, critical
+
+
+def _round(A: np.ndarray, b: np.ndarray, C: np.ndarray, fixed: np.ndarray,
+           target: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Rounding heuristic: free components are fixed one by one to rounded
+    values of target solution (the most certain first). Value is accepted
+    when every constraint can still be satisfied at minimal possible left
+    side of the remaining free components, otherwise the other value is
+    tried.
+
+    :param A: 2D np.ndarray with multipliers of rows A x <= b
+    :param b: np.ndarray with right sides
+    :param C: np.ndarray with coefficients in the goal function
+    :param fixed: np.ndarray with values of components (-1 if free)
+    :param target: np.ndarray with values of components in [0, 1]
+    :return: np.ndarray with feasible solution or None if not found
+    """
+    free = fixed == _FREE
+    solution = np.where(free, np.round(target), fixed).astype(np.int8)
+    if (A @ solution <= b + _TOLERANCE).all():
+        return solution
+
+    limit = b + _TOLERANCE
+    # components with integral values are fixed at once if possible
+    integral = free & (np.abs(target - solution) <= _INTEGRALITY_TOLERANCE)
+    activity = A @ np.where(free & ~integral, 0, solution)
+    rest = np.minimum(A, 0) @ (free & ~integral)
+    if (activity + rest <= limit).all():
+        free &= ~integral
+    else:
+        activity = A @ np.where(free, 0, fixed)
+        rest = np.minimum(A, 0) @ free
+    order = np.lexsort((-C, -np.abs(target - 0.5)))
+    for component in order[free[order]]:
+        column = A[:, component]
+        rest -= np.minimum(column, 0)
+        rounded = solution[component]
+        if (activity + rounded * column + rest <= limit).all():
+            value = rounded
+        elif (activity + (1 - rounded) * column + rest <= limit).all():
+            value = 1 - rounded
+        else:
+            return None
+        activity += value * column
+        solution[component] = value
+    return solution
+
+
+def _solve_with_milp(A: np.ndarray, b: np.ndarray, C: np.ndarray
+                     ) -> Tuple[int]:
+    """
+    Solves the problem with SciPy MILP backend.
+
+    :param A: 2D np.ndarray with multipliers of rows A x <= b
+    :param b: np.ndarray with right sides
+    :param C: np.ndarray with coefficients in the goal function
+    :return: tuple of boolean values of components in the goal function
+    """
+    result = milp(-C, integrality=np.ones(len(C)), bounds=Bounds(0, 1),
+                  constraints=LinearConstraint(A, -np.inf, b))
+    if result.status != 0:
+        return ()
+    return tuple(int(value) for value in np.round(result.x))
+
+
+def _bits(masks: np.ndarray, n: int) -> np.ndarray:
+    """
+    Converts bitmasks into values of components. The first component is the
+    most significant bit, so masks follow order of itertools.product.
+
+    :param masks: np.ndarray of np.uint64 bitmasks
+    :param n: number of components
+    :return: 2D np.ndarray with values of components of every mask
+    """
+    shifts = np.arange(n - 1, -1, -1, dtype=np.uint64)
+    return ((masks[:, np.newaxis] >> shifts) & np.uint64(1)).astype(np.int8)
+
+
+def enumerate_linear_problem(constraints: Union[List[Constraint],
+                                                ConstraintSet],
+                             C: List[NumericValue], n: int, top: int = 1,
+                             ties: bool = False) -> List[Tuple[int]]:
+    """
+    Solves given linear problem by enumeration of all solutions. Solutions
+    are generated as blocks of np.uint64 bitmasks: the last components
+    change within a block, so goal function and constraints of the block are
+    evaluated once and shifted by the contribution of the first components.
+    Only the best solutions are kept between blocks, so memory does not
+    depend on number of solutions.
+
+    :param constraints: list of problem constraints or compiled constraint
+     set
+    :param C: list of coefficients in the goal function
+    :param n: number of components
+    :param top: number of the best solutions
+    :param ties: if True all solutions with the same goal function value as
+     the last of top solutions are also returned
+    :return: list of tuples of boolean values of components, the best
+     solution first (among equal solutions later combinations go first)
+    """
+    if n > _ENUMERATION_MAX_COMPONENTS:
+        raise ValueError(f"Enumeration is possible for at most "
+                         f"{_ENUMERATION_MAX_COMPONENTS} components")
+    C = np.asarray(C, dtype=float)[:n]
+    A, b = _leq_rows(constraints, C, n)
+
+    low = min(n, _ENUMERATION_BLOCK_BITS)
+    high = n - low
+    block_masks = np.arange(2 ** low, dtype=np.uint64)
+    block_values = _bits(block_masks, low)
+    block_Z = block_values @ C[high:]
+    block_activity = block_values @ A[:, high:].T
+
+    best_Z = np.empty(0)
+    best_masks = np.empty(0, dtype=np.uint64)
+    for prefix in range(2 ** high):
+        prefix_values = _bits(np.array([prefix], dtype=np.uint64), high)[0]
+        activity = block_activity + A[:, :high] @ prefix_values
+        Z = block_Z + C[:high] @ prefix_values
+        feasible = (activity <= b + _TOLERANCE).all(axis=1)
+        if len(best_Z) >= top:
+            # only solutions not worse than the current top ones
+            feasible &= Z >= best_Z[top - 1] - _TOLERANCE
+        if not feasible.any():
+            continue
+
+        masks = (np.uint64(prefix) << np.uint64(low)) | \
+            block_masks[feasible]
+        best_Z = np.concatenate([best_Z, Z[feasible]])
+        best_masks = np.concatenate([best_masks, masks])
+        order = np.lexsort((~best_masks, -best_Z))
+        best_Z, best_masks = best_Z[order], best_masks[order]
+        kept = min(top, len(best_Z))
+        if ties:
+            kept = np.searchsorted(-best_Z, -best_Z[kept - 1] + _TOLERANCE,
+                                   side='right')
+        best_Z, best_masks = best_Z[:kept], best_masks[:kept]
+
+    return [tuple(int(value) for value in solution)
+            for solution in _bits(best_masks, n)]
+
+
+def solve_linear_problem(constraints: Union[List[Constraint], ConstraintSet],
+                         C: List[NumericValue],
+                         n: int, node_limit: int = _NODE_LIMIT,
+                         exhaustive: bool = False) -> Tuple[int]:
     """
     Solves given linear problem. Component value can be either 1 or 0.
+    Exact best-first branch-and-bound is used: nodes are bounded with LP
+    relaxation of all constraints (with SciPy) or with relaxations of single
+    constraints, values forced by constraints are propagated and relaxed
+    solutions are rounded to feasible incumbents. When node_limit is
+    exceeded and SciPy is available, the problem is passed to its MILP
+    solver, otherwise the best solution found so far is returned. Among
+    solutions with the same goal function value any of them may be returned
+    (only exhaustive enumeration prefers later combinations, as the former
+    solver did).
 
-    :param constraints: list of problem constraints
+    :param constraints: list of problem constraints or compiled constraint
+     set
     :param C: list of coefficients in the goal function
     :param n: number of components
+    :param node_limit: number of explored nodes after which MILP backend
+     is used (if available, otherwise search is stopped)
+    :param exhaustive: if True solutions are enumerated in blocks of
+     bitmasks instead of branch-and-bound (suitable for small n)
     :return: tuple of boolean values of components in the goal function
     """
-    # generate possible solutions
-    combinations = list(itertools.product([0, 1], repeat=n))
+    if exhaustive:
+        solutions = enumerate_linear_problem(constraints, C, n)
+        return solutions[0] if solutions else ()
+
+    C = np.asarray(C, dtype=float)[:n]
+    A, b = _leq_rows(constraints, C, n)
+    if linprog is not None:
+        relaxation = _LPRelaxation(A, b, C)
+    else:
+        relaxation = _Relaxation(A, b, C)
 
-    max_Z = 0
+    best_Z = -np.inf
     decision = ()
-    for combination in combinations:
-        # calculate value for a given solution
-        Z = np.dot(C, combination)
-        # check if new solution value is greater than current maximum value
-        if Z >= max_Z:
-            flag = True
-            # check if solution meets the constraints
-            for constraint in constraints:
-                if not check_constraint(constraint, combination):
-                    flag = False
-                    break
-            # if solution meets the constraints set the solution as current
-            # decision and its value as maximum value
-            if flag:
-                max_Z = Z
-                decision = combination
+
+    root = _propagate(A, b, np.full(n, _FREE, dtype=np.int8))
+    if root is None:
+        return decision
+    counter = itertools.count()
+    bound, candidate, critical = relaxation.bound(root)
+    nodes = [(-bound, next(counter), root, candidate, critical)]
+
+    explored = 0
+    while nodes:
+        negative_bound, _, fixed, candidate, critical = heapq.heappop(nodes)
+        if -negative_bound <= best_Z + _TOLERANCE:
+            break
+        explored += 1
+        if explored > node_limit:
+            if milp is not None:
+                return _solve_with_milp(A, b, C)
+            break
+
+        if critical == _FREE and (A @ candidate - b <= _TOLERANCE).all():
+            # relaxed solution is integral and feasible
+            solution = candidate
+        else:
+            solution = _round(A, b, C, fixed, candidate)
+        if solution is not None and C @ solution > best_Z:
+            best_Z = C @ solution
+            decision = tuple(int(value) for value in solution)
+        if critical == _FREE:
+            if solution is candidate:
+                continue
+            # branch on free component with the greatest multiplier in the
+            # most violated constraint
+            free = fixed == _FREE
+            if not free.any():
+                continue
+            row = np.abs(A[np.argmax(A @ candidate - b)]) * free
+            critical = int(np.argmax(row)) if row.any() else \
+                int(np.argmax(free))
+
+        for value in (1, 0):
+            child = fixed.copy()
+            child[critical] = value
+            child = _propagate(A, b, child)
+            if child is None:
+                continue
+            bound, candidate, child_critical = relaxation.bound(child)
+            if bound > best_Z + _TOLERANCE:
+                heapq.heappush(nodes, (-bound, next(counter), child,
+                                       candidate, child_critical))
 
     return decision
 
@@ -1,5 +1,12 @@
+import numpy as np
 import pandas as pd
 from typing import Union, Tuple
+from core.aliases import NumericValue
+from core.enums import GeneralCriterion
+
+# Maximal number of pairwise deviations kept in memory at once for
+# criteria without piecewise-linear preference function
+_DEVIATIONS_CHUNK_SIZE = 2 ** 22
 
 
 def compute_single_criterion_net_flows(
@@ -70,3 +77,154 @@ def compute_single_criterion_net_flows(
         single_criterion_net_flows.index = object_names
 
     return single_criterion_net_flows
+
+
+def _step_flows(sorted_values: np.ndarray, values: np.ndarray,
+                threshold: NumericValue) -> np.ndarray:
+    """
+    Compute sum of subtractions of step preferences (1 if difference is
+    greater than threshold, 0 otherwise) of each alternative over all
+    alternatives and all alternatives over it.
+
+    :param sorted_values: np.ndarray with sorted performances on criterion
+    :param values: np.ndarray with performances on criterion
+    :param threshold: threshold of the step
+    :return: np.ndarray with not normalized net flows
+    """
+    n = len(sorted_values)
+    positive = np.searchsorted(sorted_values, values - threshold, 'left')
+    negative = n - np.searchsorted(sorted_values, values + threshold, 'right')
+    return positive - negative
+
+
+def _linear_flows(sorted_values: np.ndarray, prefix_sums: np.ndarray,
+                  values: np.ndarray, q: NumericValue,
+                  p: NumericValue) -> np.ndarray:
+    """
+    Compute sum of subtractions of linear preferences (0 up to q, linear
+    between q and p, 1 above p) of each alternative over all alternatives
+    and all alternatives over it.
+
+    :param sorted_values: np.ndarray with sorted performances on criterion
+    :param prefix_sums: np.ndarray with prefix sums of sorted performances
+    starting with 0
+    :param values: np.ndarray with performances on criterion
+    :param q: threshold of indifference
+    :param p: threshold of strict preference
+    :return: np.ndarray with not normalized net flows
+    """
+    if p <= q:
+        return _step_flows(sorted_values, values, q)
+    n = len(sorted_values)
+
+    # Alternatives b with q < values - b <= p lie in [below_p, below_q)
+    below_p = np.searchsorted(sorted_values, values - p, 'left')
+    below_q = np.searchsorted(sorted_values, values - q, 'left')
+    positive = below_p + ((below_q - below_p) * (values - q) -
+                          (prefix_sums[below_q] - prefix_sums[below_p])
+                          ) / (p - q)
+
+    # Alternatives b with q < b - values <= p lie in [above_q, above_p)
+    above_q = np.searchsorted(sorted_values, values + q, 'right')
+    above_p = np.searchsorted(sorted_values, values + p, 'right')
+    negative = (n - above_p) + ((prefix_sums[above_p] -
+                                 prefix_sums[above_q]) -
+                                (above_p - above_q) * (values + q)
+                                ) / (p - q)
+    return positive - negative
+
+
+def _gaussian_flows(values: np.ndarray, s: NumericValue) -> np.ndarray:
+    """
+    Compute sum of subtractions of gaussian preferences of each alternative
+    over all alternatives and all alternatives over it. Deviations are
+    computed in chunks of alternatives to keep memory bounded.
+
+    :param values: np.ndarray with performances on criterion
+    :param s: intermediate value between q and p
+    :return: np.ndarray with not normalized net flows
+    """
+    n = len(values)
+    flows = np.empty(n)
+    chunk = max(1, _DEVIATIONS_CHUNK_SIZE // max(n, 1))
+    for start in range(0, n, chunk):
+        deviations = values[start:start + chunk, np.newaxis] - values
+        flows[start:start + chunk] = (
+            np.sign(deviations) *
+            (1.0 - np.exp(-(deviations ** 2) / (2 * s ** 2)))).sum(axis=1)
+    return flows
+
+
+def compute_single_criterion_net_flows_from_performances(
+        alternatives_performances: pd.DataFrame,
+        preference_thresholds: pd.Series,
+        indifference_thresholds: pd.Series,
+        s_parameters: pd.Series,
+        generalized_criteria: pd.Series) -> pd.DataFrame:
+    """
+    Compute the single criterion net flows for alternatives directly from
+    their performances, without building partial preferences.
+    For piecewise-linear preference functions every criterion is sorted
+    once and flows are computed with binary search and prefix sums in
+    O(n log n). Gaussian criteria are computed exactly in chunks.
+
+    :param alternatives_performances: pd.DataFrame with alternatives as index
+    and criteria as columns. Performances have to be already directed
+    (all criteria maximized).
+    :param preference_thresholds: pd.Series with criteria as index and
+    preference thresholds as values
+    :param indifference_thresholds: pd.Series with criteria as index and
+    indifference thresholds as values
+    :param s_parameters: pd.Series with criteria as index and s parameters
+    (used in Gaussian criterion) as values
+    :param generalized_criteria: pd.Series with criteria as index and
+    GeneralCriterion enums as values
+    :return: pd.DataFrame with alternatives as index and criteria as columns
+    """
+    n = len(alternatives_performances)
+    single_criterion_net_flows = pd.DataFrame(
+        index=alternatives_performances.index, dtype=float)
+
+    for criterion in alternatives_performances.columns:
+        values = alternatives_performances[criterion].to_numpy(dtype=float)
+        method = generalized_criteria[criterion]
+        q = indifference_thresholds[criterion]
+        p = preference_thresholds[criterion]
+
+        if method is GeneralCriterion.GAUSSIAN:
+            flows = _gaussian_flows(values, s_parameters[criterion])
+        else:
+            sorted_values = np.sort(values)
+            prefix_sums = np.concatenate(([0.0], np.cumsum(sorted_values)))
+            if method in (GeneralCriterion.LEVEL,
+                          GeneralCriterion.V_SHAPE_INDIFFERENCE) and q > p:
+                raise ValueError(
+                    "incorrect threshold : q "
+                    + str(q)
+                    + " greater than p "
+                    + str(p)
+                )
+
+            if method is GeneralCriterion.USUAL:
+                flows = _step_flows(sorted_values, values, 0)
+            elif method is GeneralCriterion.U_SHAPE:
+                flows = _step_flows(sorted_values, values, q)
+            elif method is GeneralCriterion.V_SHAPE:
+                flows = _linear_flows(sorted_values, prefix_sums, values,
+                                      0, p)
+            elif method is GeneralCriterion.LEVEL:
+                flows = (_step_flows(sorted_values, values, q) +
+                         _step_flows(sorted_values, values, p)) / 2
+            elif method is GeneralCriterion.V_SHAPE_INDIFFERENCE:
+                flows = _linear_flows(sorted_values, prefix_sums, values,
+                                      q, p)
+            else:
+                raise ValueError(
+                    "pref_func "
+                    + str(method)
+                    + " is not known."
+                )
+
+        single_criterion_net_flows[criterion] = flows / (n - 1)
+
+    return single_criterion_net_flows
@@ -0,0 +1,20 @@
+from typing import Tuple
+import numpy as np
+
+
+def expand_ranges(starts: np.ndarray, stops: np.ndarray
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expands ranges [starts[i], stops[i]) into flat arrays of range numbers
+    and values.
+
+    :param starts: np.ndarray with first values of ranges
+    :param stops: np.ndarray with ends (exclusive) of ranges
+    :return: np.ndarray with range number and np.ndarray with value of every
+    element of all ranges
+    """
+    lengths = np.maximum(stops - starts, 0)
+    ranges = np.repeat(np.arange(len(starts)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) -
+                                                   lengths, lengths)
+    return ranges, starts[ranges] + offsets
@@ -0,0 +1,25 @@
+from typing import Iterator, Tuple
+import numpy as np
+import pandas as pd
+from core.enums import RelationType
+
+# Code of a pair without relation (e.g. alternative compared with itself)
+NO_RELATION = 0
+
+
+def relation_matrix_to_pairs(relation_matrix: pd.DataFrame
+                             ) -> Iterator[Tuple[str, str, RelationType]]:
+    """
+    Lazily iterates over pairs of a coded relation matrix. Pairs are
+    generated row by row, pairs coded as NO_RELATION are skipped.
+
+    :param relation_matrix: pd.DataFrame with alternatives as index and
+    columns and RelationType values (int8) as cells
+    :return: iterator of (alternative, alternative, RelationType) tuples
+    """
+    relations = {relation.value: relation for relation in RelationType}
+    alternatives = relation_matrix.columns
+    for alternative_a, row in zip(relation_matrix.index,
+                                  relation_matrix.to_numpy()):
+        for num_b in np.flatnonzero(row != NO_RELATION):
+            yield alternative_a, alternatives[num_b], relations[row[num_b]]
@@ -0,0 +1,65 @@
+import math
+from core.aliases import NumericValue
+
+
+class MinSegmentTree:
+    """
+    The MinSegmentTree class represents a segment tree of minima which
+    supports point updates and search of the first position (not lower than
+    given one) with value lower than given bound in O(log n).
+    """
+    def __init__(self, size: int):
+        """
+        :param size: number of positions in the tree
+        """
+        self.size = 1
+        while self.size < size:
+            self.size *= 2
+        self.tree = [math.inf] * (2 * self.size)
+
+    def update(self, i: int, value: NumericValue):
+        """
+        Sets value at position i to the minimum of its value and given value.
+
+        :param i: position (0-based)
+        :param value: value combined with position i
+        """
+        i += self.size
+        tree = self.tree
+        while i > 0 and value < tree[i]:
+            tree[i] = value
+            i //= 2
+
+    def find_first(self, start: int, bound: NumericValue) -> int:
+        """
+        Finds the first position not lower than start with value lower than
+        bound.
+
+        :param start: first searched position (0-based)
+        :param bound: exclusive upper bound of value
+        :return: position or -1 if there is no such position
+        """
+        return self._find_first(1, 0, self.size, start, bound)
+
+    def _find_first(self, node: int, low: int, high: int, start: int,
+                    bound: NumericValue) -> int:
+        """
+        Finds the first position in subtree of node (positions low..high-1).
+
+        :param node: node of the tree
+        :param low: first position of the subtree
+        :param high: end (exclusive) of positions of the subtree
+        :param start: first searched position (0-based)
+        :param bound: exclusive upper bound of value
+        :return: position or -1 if there is no such position
+        """
+        if high <= start or self.tree[node] >= bound:
+            return -1
+        if high - low == 1:
+            return low
+        middle = (low + high) // 2
+        position = self._find_first(2 * node, low, middle, start, bound)
+        if position == -1:
+            position = self._find_first(2 * node + 1, middle, high, start,
+                                        bound)
+        return position
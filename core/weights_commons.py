@@ -0,0 +1,42 @@
+from typing import Tuple
+import numpy as np
+
+
+def srf_non_normalized_weights(positions: np.ndarray,
+                               criteria_weight_ratio: np.ndarray
+                               ) -> np.ndarray:
+    """
+    Calculate non-normalized weights of criteria (before rounding) for many
+    variants of SRF parameters at once.
+
+    :param positions: 2D np.ndarray with positions of criteria (sum of
+    spaces from the first criterion) for every variant in rows
+    :param criteria_weight_ratio: np.ndarray with the ratio of the weight of
+    the most important criterion to the weight of the least important
+    criterion for every variant
+    :return: 2D np.ndarray with non-normalized weights
+    """
+    return 1 + (criteria_weight_ratio[:, np.newaxis] - 1) * positions / \
+        positions.max(axis=1, keepdims=True)
+
+
+def rank_statistics(weights: np.ndarray, net_flows: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Counts how many times every alternative takes every rank and sums
+    weights for which alternatives are the best.
+
+    :param weights: 2D np.ndarray with samples of weights in rows
+    :param net_flows: 2D np.ndarray with net flows of alternatives (columns)
+     for every sample (rows)
+    :return: np.ndarray with flattened counts (alternatives x ranks) and 2D
+     np.ndarray with sums of weights (alternatives x criteria)
+    """
+    n = net_flows.shape[1]
+    order = np.argsort(-net_flows, axis=1, kind='stable')
+    rank_counts = np.bincount((order * n + np.arange(n)).ravel(),
+                              minlength=n * n)
+    weights_sums = np.stack([np.bincount(order[:, 0], weights=weights[:, k],
+                                         minlength=n)
+                             for k in range(weights.shape[1])], axis=1)
+    return rank_counts, weights_sums
@@ -6,10 +6,13 @@
 """
 
 import pandas as pd
-from core.promethee_flow import compute_single_criterion_net_flows
+import core.preference_commons as pc
+from core.promethee_flow import compute_single_criterion_net_flows, \
+    compute_single_criterion_net_flows_from_performances
 from core.input_validation import *
 
-__all__ = ["calculate_alternatives_profiles"]
+__all__ = ["calculate_alternatives_profiles",
+           "calculate_alternatives_profiles_from_performances"]
 
 
 def _calculate_net_flows(criteria_weights: pd.Series,
@@ -53,3 +56,50 @@ def calculate_alternatives_profiles(criteria_weights: pd.Series,
     net_flows = _calculate_net_flows(criteria_weights, criteria_net_flows)
 
     return net_flows
+
+
+def calculate_alternatives_profiles_from_performances(
+        criteria_weights: pd.Series,
+        alternatives_performances: pd.DataFrame,
+        preference_thresholds: pd.Series,
+        indifference_thresholds: pd.Series,
+        s_parameters: pd.Series,
+        generalized_criteria: pd.Series,
+        directions: pd.Series) -> pd.Series:
+    """
+    This function calculates profiles of alternatives directly from their
+    performances. Single criterion net flows are computed per criterion from
+    sorted performances, so partial preferences of all pairs of alternatives
+    are never built.
+
+    :param criteria_weights: pd.Series with criterion name as index and weight
+    of each criterion as values
+    :param alternatives_performances: pd.DataFrame with alternatives as index
+    and criteria as columns
+    :param preference_thresholds: pd.Series with criteria as index and
+    preference thresholds as values
+    :param indifference_thresholds: pd.Series with criteria as index and
+    indifference thresholds as values
+    :param s_parameters: pd.Series with criteria as index and s parameters
+    (used in Gaussian criterion) as values
+    :param generalized_criteria: pd.Series with criteria as index and
+    GeneralCriterion enums as values
+    :param directions: pd.Series with criteria as index and Direction enums
+    as values
+
+    return: pd.Series with alternatives names as index and alternatives
+    profiles as values
+    """
+    alternatives_profiles_from_performances_validation(
+        criteria_weights, alternatives_performances, preference_thresholds,
+        indifference_thresholds, s_parameters, generalized_criteria,
+        directions)
+
+    alternatives_performances = pc.directed_alternatives_performances(
+        alternatives_performances, directions)
+    criteria_net_flows = compute_single_criterion_net_flows_from_performances(
+        alternatives_performances, preference_thresholds,
+        indifference_thresholds, s_parameters, generalized_criteria)
+    net_flows = _calculate_net_flows(criteria_weights, criteria_net_flows)
+
+    return net_flows
@@ -0,0 +1,174 @@
+"""
+    This module computes the GAIA plane - projection of the single criterion
+    net flows of alternatives, of criteria axes and of the decision stick
+    onto the plane of the first two principal components.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'BransMareschal2005'.
+"""
+from typing import Iterable, Tuple
+import numpy as np
+import pandas as pd
+from core.input_validation import gaia_validation, \
+    gaia_chunk_validation, gaia_axes_validation
+
+__all__ = ["calculate_gaia_plane", "calculate_gaia_axes",
+           "project_on_gaia_plane"]
+
+_GAIA_COLUMNS = ['u', 'v']
+
+
+def _accumulate_covariance(single_criterion_net_flows_chunks:
+                           Iterable[pd.DataFrame],
+                           criteria: pd.Index) -> Tuple[np.ndarray, int]:
+    """
+    Accumulates covariance matrix of single criterion net flows chunk by
+    chunk, so only one chunk of alternatives is kept in memory.
+
+    :param single_criterion_net_flows_chunks: iterable of pd.DataFrame with
+    alternatives as index and criteria as columns
+    :param criteria: pd.Index with criteria in order used in calculations
+
+    :return: Tuple with covariance matrix (criteria x criteria) and number of
+    alternatives
+    """
+    k = len(criteria)
+    gram = np.zeros((k, k))
+    sums = np.zeros(k)
+    n = 0
+    for chunk in single_criterion_net_flows_chunks:
+        gaia_chunk_validation(chunk, criteria)
+        values = chunk[criteria].to_numpy(dtype=float)
+        gram += values.T @ values
+        sums += values.sum(axis=0)
+        n += len(values)
+
+    if n == 0:
+        raise ValueError("Single criterion net flows should contain at "
+                         "least one alternative")
+
+    mean = sums / n
+    covariance = gram / n - np.outer(mean, mean)
+    return covariance, n
+
+
+def _principal_components(covariance: np.ndarray
+                          ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes eigenvalues and eigenvectors of the covariance matrix in
+    descending order of eigenvalues. Sign of every eigenvector is fixed so
+    that its largest component is positive.
+
+    :param covariance: np.ndarray with covariance matrix
+
+    :return: Tuple with eigenvalues and eigenvectors (as columns)
+    """
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues = np.clip(eigenvalues[order], 0, None)
+    eigenvectors = eigenvectors[:, order]
+
+    signs = np.sign(eigenvectors[np.argmax(np.abs(eigenvectors), axis=0),
+                                 np.arange(eigenvectors.shape[1])])
+    signs[signs == 0] = 1
+    return eigenvalues, eigenvectors * signs
+
+
+def calculate_gaia_axes(single_criterion_net_flows_chunks:
+                        Iterable[pd.DataFrame],
+                        criteria_weights: pd.Series
+                        ) -> Tuple[pd.DataFrame, pd.Series, float]:
+    """
+    Calculates the GAIA plane from single criterion net flows passed in
+    chunks of alternatives. The chunks are consumed once, so they can be
+    generated lazily (e.g. read from disk) and memory stays bounded by the
+    size of a single chunk.
+
+    :param single_criterion_net_flows_chunks: iterable of pd.DataFrame with
+    alternatives as index and criteria as columns
+    :param criteria_weights: pd.Series with criteria as index and weights
+    as values
+
+    :return: Tuple with pd.DataFrame with criteria as index and GAIA plane
+    coordinates ('u', 'v') of criteria axes as columns, pd.Series with GAIA
+    plane coordinates of the decision stick and the retained information
+    ratio (delta) of the plane
+    """
+    gaia_axes_validation(criteria_weights)
+    criteria = criteria_weights.index
+
+    covariance, _ = _accumulate_covariance(single_criterion_net_flows_chunks,
+                                           criteria)
+    eigenvalues, eigenvectors = _principal_components(covariance)
+
+    total_information = eigenvalues.sum()
+    retained_information = eigenvalues[:2].sum() / total_information \
+        if total_information > 0 else 1.0
+
+    criteria_axes = pd.DataFrame(eigenvectors[:, :2], index=criteria,
+                                 columns=_GAIA_COLUMNS)
+    weights = criteria_weights.to_numpy(dtype=float)
+    decision_stick = pd.Series(weights / weights.sum() @ eigenvectors[:, :2],
+                               index=_GAIA_COLUMNS, name='decision stick')
+
+    return criteria_axes, decision_stick, float(retained_information)
+
+
+def project_on_gaia_plane(single_criterion_net_flows: pd.DataFrame,
+                          criteria_axes: pd.DataFrame) -> pd.DataFrame:
+    """
+    Projects alternatives onto the GAIA plane. Can be called chunk by chunk
+    with axes obtained from calculate_gaia_axes.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria_axes: pd.DataFrame with criteria as index and GAIA plane
+    coordinates ('u', 'v') of criteria axes as columns
+
+    :return: pd.DataFrame with alternatives as index and GAIA plane
+    coordinates ('u', 'v') as columns
+    """
+    gaia_chunk_validation(single_criterion_net_flows, criteria_axes.index)
+
+    values = single_criterion_net_flows[criteria_axes.index].to_numpy(
+        dtype=float)
+    return pd.DataFrame(values @ criteria_axes.to_numpy(),
+                        index=single_criterion_net_flows.index,
+                        columns=_GAIA_COLUMNS)
+
+
+def calculate_gaia_plane(single_criterion_net_flows: pd.DataFrame,
+                         criteria_weights: pd.Series,
+                         chunk_size: int = 100000
+                         ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series,
+                                    float]:
+    """
+    Calculates the GAIA plane. Covariance of single criterion net flows is
+    accumulated over chunks of alternatives and, because it is only
+    criteria x criteria, its eigendecomposition gives the truncated SVD of
+    the net flows exactly.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+    index and criteria as columns
+    :param criteria_weights: pd.Series with criteria as index and weights
+    as values
+    :param chunk_size: number of alternatives processed at once
+
+    :return: Tuple with pd.DataFrame with alternatives as index and GAIA
+    plane coordinates ('u', 'v') as columns, pd.DataFrame with criteria as
+    index and coordinates of criteria axes as columns, pd.Series with
+    coordinates of the decision stick and the retained information ratio
+    (delta) of the plane
+    """
+    gaia_validation(single_criterion_net_flows, criteria_weights, chunk_size)
+
+    chunks = [single_criterion_net_flows.iloc[start:start + chunk_size]
+              for start in range(0, len(single_criterion_net_flows),
+                                 chunk_size)]
+    criteria_axes, decision_stick, retained_information = \
+        calculate_gaia_axes(chunks, criteria_weights)
+
+    alternatives = pd.concat([project_on_gaia_plane(chunk, criteria_axes)
+                              for chunk in chunks])
+
+    return alternatives, criteria_axes, decision_stick, retained_information
@@ -1,3 +1,5 @@
 from .M13_PrometheeAlternativesProfiles import *
+from .M29_PrometheeGaia import *
 
-__all__ = M13_PrometheeAlternativesProfiles.__all__
+__all__ = M13_PrometheeAlternativesProfiles.__all__ + \
+          M29_PrometheeGaia.__all__
@@ -3,37 +3,60 @@ This module implements Promethee V method, which
 maximises the result of {0,1} linear programming problem
 by choosing appropriate set of alternatives.
 
+In c-optimality variant net flows in the goal function are increased by
+constant c, so alternatives with negative net flows are not excluded from
+the decision only because of their sign.
+
 Implementation and naming of conventions are taken from
 :cite:p:'BransMareschal2005'.
 """
-from core.constraint import Constraint
+from core.aliases import NumericValue
+from core.constraint import Constraint, ConstraintSet
 from core.linear_solver import solve_linear_problem
 from core.input_validation import decision_validation
-from typing import List
+from typing import List, Union
 import pandas as pd
 
 __all__ = ["compute_decision"]
 
 
-def compute_decision(flows: pd.Series, constraints: List[Constraint]
-                     ) -> pd.Series:
+def compute_decision(flows: pd.Series,
+                     constraints: Union[List[Constraint], ConstraintSet],
+                     exhaustive: bool = False, c_optimality: bool = False,
+                     c: NumericValue = None) -> pd.Series:
     """
     Computes decision by solving a linear problem.
 
     :param flows: Series of net flows with alternatives as index
-    :param constraints: list of problem constraints
+    :param constraints: list of problem constraints or constraint set
+     compiled for all alternatives
+    :param exhaustive: if True all decisions are enumerated (suitable for
+     small number of alternatives)
+    :param c_optimality: if True c-optimality variant is used
+    :param c: constant added to net flows in c-optimality variant, by default
+     opposite of the lowest net flow
 
     :returns: Series of alternatives which are part of the decision
     """
     # input data validation
-    decision_validation(flows, constraints)
+    decision_validation(flows, constraints, exhaustive, c_optimality, c)
 
     alternatives = flows.index
     flows = flows.values
-    constraints = constraints
+    if c_optimality:
+        flows = flows + (-flows.min() if c is None else c)
+
+    if not isinstance(constraints, ConstraintSet):
+        constraints = ConstraintSet(constraints, len(flows))
 
     # solve linear problem
-    decision_tuple = solve_linear_problem(constraints, flows, len(flows))
+    decision_tuple = solve_linear_problem(constraints, flows, len(flows),
+                                          exhaustive=exhaustive)
+
+    # check the decision (empty if no decision satisfies constraints)
+    if decision_tuple and \
+            not constraints.is_satisfied([decision_tuple])[0]:
+        raise ValueError("Decision does not satisfy constraints")
 
     # find alternatives that create the solution
     chosen_alternatives = []
@@ -174,7 +174,7 @@ def _sort_alternatives_to_categories(
         alternatives_preference, FlowType.PROFILE_BASED,
         profiles_preference)
     promethee_ii_flows = calculate_net_outranking_flows(profile_based_flows,
-                                                        True)
+                                                        True, inplace=True)
 
     redirected_profiles = pc.directed_alternatives_performances(
         central_profiles, directions)
@@ -5,7 +5,6 @@
     Implementation and naming of conventions are taken from
     :cite:p:'KadzinskiMichalski2016' and :cite:p:'BouyssouPerny1992'.
 """
-import math
 import numpy as np
 import pandas as pd
 from core.enums import ScoringFunction, ScoringFunctionDirection
@@ -14,14 +13,14 @@ from core.input_validation import net_flow_score_validation
 __all__ = ['calculate_net_flows_score']
 
 
-def _calculate_score(preferences: pd.DataFrame,
+def _calculate_score(preferences: np.ndarray,
                      function: ScoringFunction,
                      direction: ScoringFunctionDirection) -> np.ndarray:
     """
     This function calculates scores for passed preferences.
 
-    :param preferences: pd.DataFrame with alternatives names as index
-    and columns
+    :param preferences: np.ndarray with preferences of alternatives (rows)
+    over alternatives (columns) and NaN on the diagonal
     :param function: ScoringFunction that determines scoring function
     used in calculation
     :param direction: ScoringFunctionDirection that determines scoring
@@ -40,32 +39,102 @@ def _calculate_score(preferences: pd.DataFrame,
 
     # Scoring function direction selection
     if direction is ScoringFunctionDirection.IN_FAVOR:
-        scores = function(preferences.values, axis=1)
+        scores = function(preferences, axis=1)
     elif direction is ScoringFunctionDirection.AGAINST:
-        scores = -function(preferences.values, axis=0)
+        scores = -function(preferences, axis=0)
     else:
-        scores = function(preferences.values - preferences.values.T, axis=1)
+        scores = function(preferences - preferences.T, axis=1)
     return scores
 
 
-def _find_duplicates_values(array: np.ndarray) -> set:
+def _find_tie_groups(scores: np.ndarray) -> np.ndarray:
     """
-    This function finds duplicated values.
+    This function groups alternatives with the same score. Scores are
+    sorted once and neighbouring scores are compared with the relative
+    tolerance of math.isclose. Only groups which contain at least one
+    exact duplicate are returned as ties.
 
-    :param array: np.ndarray with net flow scores for passed preferences
+    :param scores: np.ndarray with net flow scores
+
+    :return: np.ndarray with tie group id of each alternative (-1 if
+    alternative is not tied with any other)
+    """
+    order = np.argsort(scores, kind='stable')
+    sorted_scores = scores[order]
+
+    # Neighbouring scores are close in the sense of math.isclose
+    close = np.abs(np.diff(sorted_scores)) <= \
+        1e-09 * np.maximum(np.abs(sorted_scores[1:]),
+                           np.abs(sorted_scores[:-1]))
+    group_ids = np.cumsum(np.concatenate(([0], ~close)))
+
+    # Only groups with exact duplicates are treated as ties
+    exact_duplicates = sorted_scores[1:] == sorted_scores[:-1]
+    tied_groups = np.zeros(group_ids[-1] + 1 if len(scores) else 0,
+                           dtype=bool)
+    tied_groups[group_ids[1:][exact_duplicates]] = True
+
+    ties = np.full(len(scores), -1)
+    ties[order] = np.where(tied_groups[group_ids], group_ids, -1)
+    return ties
+
+
+def _calculate_tied_scores(preferences: np.ndarray,
+                           ties: np.ndarray,
+                           function: ScoringFunction,
+                           direction: ScoringFunctionDirection
+                           ) -> np.ndarray:
+    """
+    This function recalculates scores of tied alternatives using only
+    preferences among alternatives from the same tie group. All groups are
+    processed with a single reduction over contiguous blocks of the
+    preferences of tied alternatives.
+
+    :param preferences: np.ndarray with preferences of alternatives (rows)
+    over alternatives (columns) and NaN on the diagonal
+    :param ties: np.ndarray with tie group id of each alternative (-1 if
+    alternative is not tied)
+    :param function: ScoringFunction that determines scoring function
+    used in calculation
+    :param direction: ScoringFunctionDirection that determines scoring
+    function direction used in calculation
 
-    :return: set with duplicated values
+    :return: np.ndarray with scores of tied alternatives ordered as
+    np.flatnonzero(ties >= 0)
     """
-    seen = set()
-    duplicated_values = set()
+    tied = np.flatnonzero(ties >= 0)
+
+    # Order tied alternatives so that every group is a contiguous block
+    block_order = np.argsort(ties[tied], kind='stable')
+    tied_sorted = tied[block_order]
+    block_ids = ties[tied_sorted]
+    block_starts = np.flatnonzero(
+        np.concatenate(([True], block_ids[1:] != block_ids[:-1])))
+    block_of_row = np.cumsum(np.concatenate(
+        ([0], block_ids[1:] != block_ids[:-1])))
+
+    sub_preferences = preferences[np.ix_(tied_sorted, tied_sorted)]
+    if direction is ScoringFunctionDirection.AGAINST:
+        sub_preferences = sub_preferences.T
+    elif direction is ScoringFunctionDirection.DIFFERENCE:
+        sub_preferences = sub_preferences - sub_preferences.T
+
+    # Reduce every row over the blocks of columns at once
+    if function is ScoringFunction.MAX:
+        block_scores = np.fmax.reduceat(sub_preferences, block_starts, axis=1)
+    elif function is ScoringFunction.MIN:
+        block_scores = np.fmin.reduceat(sub_preferences, block_starts, axis=1)
+    else:
+        block_scores = np.add.reduceat(np.nan_to_num(sub_preferences),
+                                       block_starts, axis=1)
+    sub_scores = block_scores[np.arange(len(tied_sorted)), block_of_row]
 
-    for x in array:
-        if x in seen:
-            duplicated_values.add(x)
-        else:
-            seen.add(x)
+    if direction is ScoringFunctionDirection.AGAINST:
+        sub_scores = -sub_scores
 
-    return duplicated_values
+    scores = np.empty(len(tied))
+    scores[block_order] = sub_scores
+    return scores
 
 
 def calculate_net_flows_score(preferences: pd.DataFrame,
@@ -74,6 +143,7 @@ def calculate_net_flows_score(preferences: pd.DataFrame,
                               avoid_same_scores: bool = False) -> pd.Series:
     """
     This function calculates net flow scores for all preferences.
+    Passed preferences are not modified.
 
     :param preferences: pd.DataFrame with alternatives names as index
     and columns
@@ -88,26 +158,19 @@ def calculate_net_flows_score(preferences: pd.DataFrame,
     """
     net_flow_score_validation(preferences, function, direction,
                               avoid_same_scores)
-    np.fill_diagonal(preferences.values, np.NaN)
+
+    # Work on a private copy with the diagonal masked out
+    preferences_values = preferences.to_numpy(dtype=float, copy=True)
+    np.fill_diagonal(preferences_values, np.NaN)
+
+    scores = _calculate_score(preferences_values, function, direction)
 
     if avoid_same_scores:
-        scores = _calculate_score(preferences, function, direction)
-
-        # Repeat calculations for duplicate values
-        if len(scores) != len(set(scores)):
-            duplicated_values = _find_duplicates_values(scores)
-            for duplicated_value in duplicated_values:
-                duplicated_score_indices = \
-                    [i for i, score in enumerate(scores)
-                     if math.isclose(score, duplicated_value)]
-                sub_preferences = \
-                    preferences.iloc[:, duplicated_score_indices].iloc[
-                        duplicated_score_indices, :]
-                sub_scores = _calculate_score(sub_preferences, function,
-                                              direction)
-                for index, score in zip(duplicated_score_indices, sub_scores):
-                    scores[index] = score
-    else:
-        scores = _calculate_score(preferences, function, direction)
+        # Repeat calculations for all groups of duplicate values at once
+        ties = _find_tie_groups(scores)
+        if (ties >= 0).any():
+            scores[ties >= 0] = _calculate_tied_scores(preferences_values,
+                                                       ties, function,
+                                                       direction)
 
     return pd.Series(scores, index=preferences.columns)
@@ -6,15 +6,57 @@
     :cite:p:'BransMareschal2005'.
 """
 
-from typing import Union
+from typing import Union, List
+import numpy as np
 import pandas as pd
-__all__ = ['calculate_net_outranking_flows']
+__all__ = ['calculate_net_outranking_flows',
+           'calculate_net_outranking_flows_batch']
 
-from core.input_validation import calculate_net_outranking_flows_validation
+from core.input_validation import calculate_net_outranking_flows_validation, \
+    calculate_net_outranking_flows_batch_validation
+
+
+def _calculate_net_flows(flows: pd.DataFrame) -> np.ndarray:
+    """
+    Computes net outranking flow as a difference between positive and
+    negative flow.
+
+    :param flows: pd.Dataframe of both positive and negative outranking flows
+
+    :return: np.ndarray with net flows in order of flows index
+    """
+    return np.subtract(flows['positive'].to_numpy(dtype=float),
+                       flows['negative'].to_numpy(dtype=float))
+
+
+def _format_net_flows(flows: pd.DataFrame, net_flow: np.ndarray,
+                      profile_based_format: bool, inplace: bool) \
+        -> Union[pd.Series, pd.DataFrame]:
+    """
+    Wraps calculated net flows in the output structure.
+
+    :param flows: pd.Dataframe of both positive and negative outranking flows
+    :param net_flow: np.ndarray with net flows in order of flows index
+    :param profile_based_format: boolean value describe whether net flow
+        should be return alone or as DataFrame together with outranking flows
+    :param inplace: boolean value describe whether 'net' column should be
+        appended to passed flows instead of their copy
+
+    :return: Series of net outranking flow or DataFrame of outranking flows
+        with net outranking flow
+    """
+    if profile_based_format:
+        net_flows = flows if inplace else flows.copy()
+        net_flows['net'] = net_flow
+        return net_flows
+    else:
+        return pd.Series(data=net_flow, index=flows.index,
+                         name='Net outranking flow')
 
 
 def calculate_net_outranking_flows(flows: pd.DataFrame,
-                                   profile_based_format: bool = False) \
+                                   profile_based_format: bool = False,
+                                   inplace: bool = False) \
         -> Union[pd.Series, pd.DataFrame]:
     """
     Computes net outranking flow based on positive and negative flows.
@@ -25,27 +67,48 @@ def calculate_net_outranking_flows(flows: pd.DataFrame,
         index: alternatives, columns: positive, negative
     :param profile_based_format: boolean value describe whether net flow
         should be return alone or as DataFrame together with outranking flows
+    :param inplace: boolean value describe whether 'net' column should be
+        appended to passed flows (without copying them) when
+        profile_based_format is True
 
     :return: Series of net outranking flow - index: alternatives or DataFrame
         of outranking flows with net outranking flow, index: alternatives,
         columns: positive, negative, net
     """
 
-    calculate_net_outranking_flows_validation(flows)
-    positive_flow = flows['positive'].values
-    negative_flow = flows['negative'].values
-    alternatives = flows.index
-    flow_data = []
+    calculate_net_outranking_flows_validation(flows, inplace)
 
     # calculating net flow
-    for num_a, alternative_a in enumerate(positive_flow):
-        flow_data.append(positive_flow[num_a] - negative_flow[num_a])
+    net_flow = _calculate_net_flows(flows)
 
-    net = pd.Series(data=flow_data, index=alternatives,
-                    name='Net outranking flow')
-    if profile_based_format:
-        net_flow = flows.copy()
-        net_flow['net'] = net
-        return net_flow
-    else:
-        return net
+    return _format_net_flows(flows, net_flow, profile_based_format, inplace)
+
+
+def calculate_net_outranking_flows_batch(flows: List[pd.DataFrame],
+                                         profile_based_format: bool = False) \
+        -> Union[pd.Series, pd.DataFrame]:
+    """
+    Computes net outranking flows for many flow tables (e.g. scenarios or
+    iterations) at once. Flow tables are stacked on one axis and net flows
+    are calculated with a single subtraction.
+
+    :param flows: list of pd.Dataframe of both positive and negative
+        outranking flows, index: alternatives, columns: positive, negative
+    :param profile_based_format: boolean value describe whether net flow
+        should be return alone or as DataFrame together with outranking flows
+
+    :return: Series of net outranking flows - index: MultiIndex(number of
+        flow table, alternatives) or DataFrame of outranking flows with net
+        outranking flow, index: MultiIndex(number of flow table,
+        alternatives), columns: positive, negative, net
+    """
+
+    calculate_net_outranking_flows_batch_validation(flows)
+
+    stacked_flows = pd.concat(flows, keys=range(len(flows)))
+
+    # calculating net flows of all tables at once
+    net_flow = _calculate_net_flows(stacked_flows)
+
+    return _format_net_flows(stacked_flows, net_flow, profile_based_format,
+                             inplace=True)
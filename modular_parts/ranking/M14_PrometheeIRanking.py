@@ -5,16 +5,96 @@
     Implementation and naming of conventions are taken from
     :cite:p:'BransMareschal2005'.
 """
-import math
-
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
-from core.input_validation import promethee_i_ranking_validation
+from core.input_validation import promethee_i_ranking_validation, \
+    promethee_i_dominance_validation
 from core.enums import RelationType
+from core.fenwick_tree import FenwickTree
+from core.relations import relation_matrix_to_pairs, NO_RELATION
 # from mcda.core.sorting import RelationType -> ścieżka francuza
 
 
-__all__ = ["calculate_prometheeI_ranking"]
+__all__ = ["calculate_prometheeI_ranking",
+           "calculate_prometheeI_relation_matrix",
+           "calculate_prometheeI_dominance"]
+
+# Maximal number of compared pairs kept in memory at once
+_PAIRS_CHUNK_SIZE = 2 ** 22
+
+
+def _isclose(values_a: np.ndarray, values_b: np.ndarray,
+             rel_tol: float = 1e-09) -> np.ndarray:
+    """
+    Vectorized math.isclose (relative tolerance only) between every value
+    from values_a (rows) and every value from values_b (columns).
+
+    :param values_a: np.ndarray with values compared in rows
+    :param values_b: np.ndarray with values compared in columns
+    :param rel_tol: relative tolerance
+    :return: np.ndarray of booleans
+    """
+    values_a = values_a[:, np.newaxis]
+    return np.abs(values_a - values_b) <= \
+        rel_tol * np.maximum(np.abs(values_a), np.abs(values_b))
+
+
+def calculate_prometheeI_relation_matrix(flows: pd.DataFrame,
+                                         weak_preference=False
+                                         ) -> pd.DataFrame:
+    """
+    This function calculates outranking relation among all alternatives as
+    a matrix of RelationType values (int8). Alternatives in rows are
+    compared with alternatives in columns, the diagonal is 0.
+    Relationship types:
+        PREFERENCE,
+        INDIFFERENCE,
+        INCOMPARABLE,
+        WEAK_PREFERENCE.
+
+    :param flows: pd.DataFrame with alternatives names as index and flows
+    as columns named (positive and negative)
+    :param weak_preference: bool that determines if general method of
+    computing the ranking is  generalized to the relation of the
+    weak preference
+
+    :return: pd.DataFrame with alternatives as index and columns and
+    RelationType values as cells
+    """
+    promethee_i_ranking_validation(flows, weak_preference)
+
+    alternatives = flows.index
+    positive_flow = flows['positive'].to_numpy(dtype=float)
+    negative_flow = flows['negative'].to_numpy(dtype=float)
+    n = len(alternatives)
+
+    relations = np.empty((n, n), dtype=np.int8)
+    chunk = max(1, _PAIRS_CHUNK_SIZE // max(n, 1))
+
+    # Outranking relation among all alternatives calculation
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        outranks = \
+            (positive_flow[start:stop, np.newaxis] >= positive_flow) & \
+            (negative_flow[start:stop, np.newaxis] <= negative_flow)
+        if weak_preference:
+            relations[start:stop] = np.where(
+                outranks, RelationType.WEAK_PREFERENCE.value,
+                RelationType.INCOMPARABLE.value)
+        else:
+            indifferent = \
+                _isclose(positive_flow[start:stop], positive_flow,
+                         rel_tol=1e-6) & \
+                _isclose(negative_flow[start:stop], negative_flow)
+            relations[start:stop] = np.where(
+                indifferent, RelationType.INDIFFERENCE.value,
+                np.where(outranks, RelationType.PREFERENCE.value,
+                         RelationType.INCOMPARABLE.value))
+
+    np.fill_diagonal(relations, NO_RELATION)
+
+    return pd.DataFrame(relations, index=alternatives, columns=alternatives)
 
 
 def calculate_prometheeI_ranking(flows: pd.DataFrame,
@@ -37,45 +117,119 @@ def calculate_prometheeI_ranking(flows: pd.DataFrame,
 
     :return: List with outranking pars (str, str, RelationType)
     """
-    promethee_i_ranking_validation(flows, weak_preference)
+    relation_matrix = calculate_prometheeI_relation_matrix(flows,
+                                                           weak_preference)
 
-    alternatives = flows.index
-    positive_flow = flows['positive']
-    negative_flow = flows['negative']
+    return list(relation_matrix_to_pairs(relation_matrix))
 
-    pairs = []
 
-    # Outranking relation among all alternatives calculation
-    for alternative_a in alternatives:
-        for alternative_b in alternatives:
-            if alternative_a == alternative_b:
-                continue
-            if weak_preference:
-                if positive_flow[alternative_a] >= \
-                        positive_flow[alternative_b] \
-                        and negative_flow[alternative_a] <= \
-                        negative_flow[alternative_b]:
-                    pairs.append((alternative_a, alternative_b,
-                                  RelationType.WEAK_PREFERENCE))
-                else:
-                    pairs.append((alternative_a, alternative_b,
-                                  RelationType.INCOMPARABLE))
-            else:
-                if math.isclose(positive_flow[alternative_a],
-                                positive_flow[alternative_b], rel_tol=1e-6) \
-                        and math.isclose(negative_flow[alternative_a],
-                                         negative_flow[alternative_b]):
-                    pairs.append((alternative_a, alternative_b,
-                                  RelationType.INDIFFERENCE))
-
-                elif positive_flow[alternative_a] >= \
-                        positive_flow[alternative_b] \
-                        and negative_flow[alternative_a] <= \
-                        negative_flow[alternative_b]:
-                    pairs.append((alternative_a, alternative_b,
-                                  RelationType.PREFERENCE))
-                else:
-                    pairs.append((alternative_a, alternative_b,
-                                  RelationType.INCOMPARABLE))
-
-    return pairs
+def _count_dominated(x_ranks: np.ndarray, y_ranks: np.ndarray,
+                     multiplicities: np.ndarray) -> np.ndarray:
+    """
+    Counts for every unique point how many points (with multiplicities)
+    have both coordinates lower or equal, including the point itself.
+    Points are swept in ascending order of x, y coordinates are kept in
+    a Fenwick tree.
+
+    :param x_ranks: np.ndarray with dense ranks of x coordinates
+    :param y_ranks: np.ndarray with dense ranks of y coordinates
+    :param multiplicities: np.ndarray with number of alternatives in every
+    point
+    :return: np.ndarray with counts for every point
+    """
+    tree = FenwickTree(int(y_ranks.max()) + 1)
+    counts = np.empty(len(x_ranks), dtype=np.int64)
+    order = np.lexsort((y_ranks, x_ranks)).tolist()
+    x_list, y_list = x_ranks.tolist(), y_ranks.tolist()
+    multiplicities = multiplicities.tolist()
+
+    group_start = 0
+    while group_start < len(order):
+        # All points with the same x are inserted before querying them
+        group_end = group_start
+        x = x_list[order[group_start]]
+        while group_end < len(order) and x_list[order[group_end]] == x:
+            point = order[group_end]
+            tree.update(y_list[point], multiplicities[point])
+            group_end += 1
+        for point in order[group_start:group_end]:
+            counts[point] = tree.query(y_list[point])
+        group_start = group_end
+    return counts
+
+
+def _calculate_layers(x_ranks: np.ndarray, y_ranks: np.ndarray
+                      ) -> np.ndarray:
+    """
+    Calculates Pareto layers of unique points. Layer of a point is one more
+    than the highest layer of points which dominate it. Points are swept in
+    descending order of x and y, prefix maxima of layers over y
+    coordinates are kept in a Fenwick tree.
+
+    :param x_ranks: np.ndarray with dense ranks of x coordinates
+    :param y_ranks: np.ndarray with dense ranks of y coordinates
+    :return: np.ndarray with layer of every point (starting from 1)
+    """
+    max_rank = int(y_ranks.max())
+    tree = FenwickTree(max_rank + 1, max, 0)
+    layers = np.empty(len(x_ranks), dtype=np.int64)
+    for point in np.lexsort((-y_ranks, -x_ranks)).tolist():
+        # Reversed y positions make prefix queries cover higher y
+        reversed_y = max_rank - int(y_ranks[point])
+        layer = tree.query(reversed_y) + 1
+        layers[point] = layer
+        tree.update(reversed_y, layer)
+    return layers
+
+
+def calculate_prometheeI_dominance(flows: pd.DataFrame
+                                   ) -> Tuple[pd.DataFrame, pd.Index]:
+    """
+    This function calculates the structure of the Promethee I partial order
+    without comparing all pairs of alternatives. Preference of Promethee I
+    is a dominance order on (positive flow, -negative flow), so counts of
+    relations and Pareto layers are obtained with sweep lines over sorted
+    flows and Fenwick trees in O(n log n). Flows are compared exactly
+    (indifference means equal positive and negative flows).
+
+    :param flows: pd.DataFrame with alternatives names as index and flows
+    as columns named (positive and negative)
+
+    :return: Tuple with pd.DataFrame with alternatives as index and
+    columns: 'outranks' (number of alternatives preferred by alternative),
+    'outranked' (number of alternatives preferred to alternative),
+    'indifferent', 'incomparable' and 'layer' (Pareto layer, 1 for maximal
+    alternatives) and pd.Index with maximal alternatives
+    """
+    promethee_i_dominance_validation(flows)
+
+    n = len(flows)
+    positive_flow = flows['positive'].to_numpy(dtype=float)
+    negative_flow = flows['negative'].to_numpy(dtype=float)
+
+    # Group alternatives with identical flows into unique points
+    points, point_of_alternative, multiplicities = np.unique(
+        np.column_stack([positive_flow, -negative_flow]), axis=0,
+        return_inverse=True, return_counts=True)
+    point_of_alternative = point_of_alternative.reshape(-1)
+    x_ranks = np.unique(points[:, 0], return_inverse=True)[1].reshape(-1)
+    y_ranks = np.unique(points[:, 1], return_inverse=True)[1].reshape(-1)
+
+    dominated = _count_dominated(x_ranks, y_ranks, multiplicities)
+    dominating = _count_dominated(x_ranks.max() - x_ranks,
+                                  y_ranks.max() - y_ranks, multiplicities)
+    layers = _calculate_layers(x_ranks, y_ranks)
+
+    indifferent = multiplicities - 1
+    outranks = dominated - multiplicities
+    outranked = dominating - multiplicities
+    incomparable = n - 1 - outranks - outranked - indifferent
+
+    dominance = pd.DataFrame({'outranks': outranks,
+                              'outranked': outranked,
+                              'indifferent': indifferent,
+                              'incomparable': incomparable,
+                              'layer': layers}).iloc[point_of_alternative]
+    dominance.index = flows.index
+
+    return dominance, flows.index[dominance['layer'].to_numpy() == 1]
@@ -6,9 +6,19 @@ Implementation and naming of conventions are taken from
 :cite:p:'BransMareschal2005'.
 """
 
+import heapq
+from typing import Iterable, List
+import numpy as np
 import pandas as pd
-from core.input_validation import promethee_ii_ranking_validation
-__all__ = ["calculate_promethee_ii_ranking"]
+from core.input_validation import promethee_ii_ranking_validation, \
+    promethee_ii_top_k_validation, promethee_ii_ranks_validation
+__all__ = ["calculate_promethee_ii_ranking",
+           "calculate_promethee_ii_top_k",
+           "calculate_promethee_ii_top_k_stream",
+           "calculate_promethee_ii_ranks"]
+
+# Maximal number of compared pairs kept in memory at once
+_PAIRS_CHUNK_SIZE = 2 ** 22
 
 
 def calculate_promethee_ii_ranking(promethee_ii_flows: pd.DataFrame
@@ -25,8 +35,152 @@ def calculate_promethee_ii_ranking(promethee_ii_flows: pd.DataFrame
     promethee_ii_ranking_validation(promethee_ii_flows)
 
     # create ranking based on net flows
-    data = promethee_ii_flows.sort_values('net', ascending=False).index
+    data = promethee_ii_flows.sort_values('net', ascending=False,
+                                          kind='stable').index
     ranking = pd.Series(data=data, name="ranking")
     # start indexing from 1
     ranking.index += 1
     return ranking
+
+
+def _top_k_positions(net_flows: np.ndarray, k: int) -> np.ndarray:
+    """
+    Finds positions of k alternatives with the highest net flows without
+    sorting all of them. Ties are resolved in favour of alternatives with
+    lower position.
+
+    :param net_flows: np.ndarray with net flows
+    :param k: number of selected alternatives
+
+    :return: np.ndarray with positions ordered from the best alternative
+    """
+    n = len(net_flows)
+    if k >= n:
+        candidates = np.arange(n)
+    else:
+        kth_value = np.partition(net_flows, n - k)[n - k]
+        better = np.flatnonzero(net_flows > kth_value)
+        equal = np.flatnonzero(net_flows == kth_value)[:k - len(better)]
+        candidates = np.concatenate([better, equal])
+    return candidates[np.lexsort((candidates, -net_flows[candidates]))]
+
+
+def calculate_promethee_ii_top_k(promethee_ii_flows: pd.DataFrame, k: int,
+                                 bottom: bool = False) -> pd.Series:
+    """
+    Creates a part of Promethee II ranking with k best (or worst)
+    alternatives. Only selected alternatives are sorted, ties are resolved
+    in favour of alternatives which appear first in flows.
+
+    :param promethee_ii_flows: DataFrame of Promethee II flows - flows as
+     values, alternatives as index and flow types as columns
+    :param k: number of alternatives in the ranking
+    :param bottom: if True k worst alternatives are returned
+
+    :return: Series representing part of Promethee II ranking with
+     positions in the full ranking as index
+    """
+    # input data validation
+    promethee_ii_top_k_validation(promethee_ii_flows, k, bottom)
+
+    net_flows = promethee_ii_flows['net'].to_numpy(dtype=float)
+    n = len(net_flows)
+    if bottom:
+        # worst alternatives are the best ones of reversed ranking
+        positions = _top_k_positions(-net_flows[::-1], k)[::-1]
+        positions = n - 1 - positions
+        index = np.arange(n - len(positions), n) + 1
+    else:
+        positions = _top_k_positions(net_flows, k)
+        index = np.arange(len(positions)) + 1
+
+    return pd.Series(data=promethee_ii_flows.index[positions], index=index,
+                     name="ranking")
+
+
+def calculate_promethee_ii_top_k_stream(
+        promethee_ii_flows_chunks: Iterable[pd.DataFrame], k: int,
+        bottom: bool = False) -> pd.Series:
+    """
+    Creates a part of Promethee II ranking with k best (or worst)
+    alternatives from flows passed in chunks of alternatives. Only a heap of
+    k alternatives is kept between chunks, so memory does not depend on
+    the number of alternatives. Ties are resolved in favour of alternatives
+    which appear first.
+
+    :param promethee_ii_flows_chunks: iterable of DataFrames of Promethee II
+     flows - flows as values, alternatives as index and flow types as columns
+    :param k: number of alternatives in the ranking
+    :param bottom: if True k worst alternatives are returned
+
+    :return: Series representing part of Promethee II ranking with
+     positions in the full ranking as index
+    """
+    heap = []
+    offset = 0
+    for chunk in promethee_ii_flows_chunks:
+        # input data validation
+        promethee_ii_top_k_validation(chunk, k, bottom)
+
+        net_flows = chunk['net'].to_numpy(dtype=float)
+        if bottom:
+            # worst alternatives are the best ones of reversed ranking
+            net_flows = -net_flows
+            positions = len(net_flows) - 1 - \
+                _top_k_positions(net_flows[::-1], k)
+            sign = 1
+        else:
+            positions = _top_k_positions(net_flows, k)
+            sign = -1
+        for position in positions.tolist():
+            item = (net_flows[position], sign * (offset + position),
+                    chunk.index[position])
+            if len(heap) < k:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+        offset += len(chunk)
+
+    best = sorted(heap, key=lambda item: item[:2], reverse=True)
+    alternatives: List = [alternative for _, _, alternative in best]
+    if bottom:
+        alternatives.reverse()
+    ranking = pd.Series(data=alternatives, name="ranking", dtype=object)
+    # start indexing from 1 (from position of the first selected alternative
+    # in the full ranking for the worst alternatives)
+    ranking.index += 1 + (offset - len(alternatives) if bottom else 0)
+    return ranking
+
+
+def calculate_promethee_ii_ranks(promethee_ii_flows: pd.DataFrame,
+                                 alternatives: List[str]) -> pd.Series:
+    """
+    Calculates positions of given alternatives in Promethee II ranking
+    without sorting all alternatives. Ties are resolved in favour of
+    alternatives which appear first in flows.
+
+    :param promethee_ii_flows: DataFrame of Promethee II flows - flows as
+     values, alternatives as index and flow types as columns
+    :param alternatives: list of alternatives which positions are calculated
+
+    :return: Series with given alternatives as index and their positions
+     (starting from 1) as values
+    """
+    # input data validation
+    promethee_ii_ranks_validation(promethee_ii_flows, alternatives)
+
+    net_flows = promethee_ii_flows['net'].to_numpy(dtype=float)
+    n = len(net_flows)
+    positions = promethee_ii_flows.index.get_indexer(alternatives)
+    values = net_flows[positions]
+
+    ranks = np.empty(len(positions), dtype=np.int64)
+    chunk = max(1, _PAIRS_CHUNK_SIZE // max(n, 1))
+    for start in range(0, len(positions), chunk):
+        stop = start + chunk
+        chunk_values = values[start:stop, np.newaxis]
+        ranks[start:stop] = 1 + (net_flows > chunk_values).sum(axis=1) + \
+            ((net_flows == chunk_values) &
+             (np.arange(n) < positions[start:stop, np.newaxis])).sum(axis=1)
+
+    return pd.Series(data=ranks, index=alternatives, name="ranking")
@@ -9,10 +9,22 @@ from typing import List, Tuple
 
 import pandas as pd
 from core.aliases import NumericValue
-from core.input_validation import promethee_iii_ranking_validation
+from core.input_validation import promethee_iii_ranking_validation, \
+    promethee_iii_relation_counts_validation
 import numpy as np
 
-__all__ = ["calculate_promethee_iii_ranking"]
+__all__ = ["calculate_promethee_iii_ranking",
+           "calculate_promethee_iii_relation_matrix",
+           "calculate_promethee_iii_relation_counts"]
+
+# Maximal number of compared pairs kept in memory at once
+_PAIRS_CHUNK_SIZE = 2 ** 22
+
+# Codes of the interval order relation of alternative in row to alternative
+# in column
+PREFERRED = 1
+INDIFFERENT = 0
+NOT_PREFERRED = -1
 
 
 def calculate_promethee_iii_ranking(flows: pd.DataFrame,
@@ -41,41 +53,154 @@ def calculate_promethee_iii_ranking(flows: pd.DataFrame,
      x, y intervals as columns; DataFrame of preference outranking pairs  with
      alternatives as index and columns.
     """
+    intervals, relation_matrix = calculate_promethee_iii_relation_matrix(
+        flows, preferences, alpha, decimal_place)
+
+    # translate relation codes to outranking pairs symbols
+    pairs_data = np.array(['?', 'I', 'P'])[relation_matrix.to_numpy() + 1]
+    pairs = pd.DataFrame(data=pairs_data, columns=relation_matrix.columns,
+                         index=relation_matrix.index)
+
+    return intervals, pairs
+
+
+def calculate_promethee_iii_relation_matrix(flows: pd.DataFrame,
+                                            preferences: pd.DataFrame,
+                                            alpha: NumericValue,
+                                            decimal_place: NumericValue = 3
+                                            ) -> Tuple[pd.DataFrame,
+                                                       pd.DataFrame]:
+    """
+    Calculates intervals and the interval order as an int8 matrix:
+    PREFERRED (1) if alternative in row is preferred to alternative in
+    column, INDIFFERENT (0) if their intervals overlap and NOT_PREFERRED (-1)
+    if alternative in column is preferred to alternative in row.
+
+    :param flows: DataFrame of both positive and negative outranking flows.
+        Index: alternatives, columns: flows type.
+    :param preferences: DataFrame of preference indices with alternatives as
+        index and columns.
+    :param alpha: parameter used in calculating intervals
+    :param decimal_place: the decimal place of the output numbers
+
+    :return: DataFrame of intervals with alternatives as index and
+     x, y intervals as columns; DataFrame of relation codes with
+     alternatives as index and columns.
+    """
     # input data validation
     promethee_iii_ranking_validation(flows, preferences, alpha, decimal_place)
 
     alternatives = preferences.index
-
-    # calculate net flows
-    flow = pd.Series(data=np.subtract(flows['positive'].values,
-                                      flows['negative'].values),
-                     index=alternatives)
-
-    # calculate intervals
-    intervals_list, intervals = _calculate_intervals(alternatives, flow,
+    intervals_list, intervals = _calculate_intervals(alternatives,
+                                                     _net_flow(flows),
                                                      preferences,
                                                      alpha, decimal_place)
+    x, y = np.asarray(intervals_list[0]), np.asarray(intervals_list[1])
 
-    # create outranking pairs matrix
-    pairs_data = np.zeros(np.shape(preferences), dtype=str)
-    for num_a in range(len(alternatives)):
-        for num_b in range(len(alternatives)):
-            # compare alternatives' intervals
-            if intervals_list[0][num_a] > intervals_list[1][num_b]:
-                pairs_data[num_a][num_b] = 'P'
-            elif intervals_list[0][num_a] <= intervals_list[1][num_b] \
-                    and intervals_list[0][num_b] <= intervals_list[1][num_a]:
-                pairs_data[num_a][num_b] = 'I'
-            else:
-                pairs_data[num_a][num_b] = '?'
-
-    pairs = pd.DataFrame(data=pairs_data, columns=alternatives,
-                         index=alternatives)
+    # compare alternatives' intervals in chunks of rows
+    n = len(alternatives)
+    relations = np.empty((n, n), dtype=np.int8)
+    chunk = max(1, _PAIRS_CHUNK_SIZE // max(n, 1))
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        relations[start:stop] = np.where(
+            x[start:stop, np.newaxis] > y, PREFERRED,
+            np.where(x <= y[start:stop, np.newaxis], INDIFFERENT,
+                     NOT_PREFERRED))
+
+    return intervals, pd.DataFrame(relations, index=alternatives,
+                                   columns=alternatives)
+
+
+def calculate_promethee_iii_relation_counts(flows: pd.DataFrame,
+                                            preferences: pd.DataFrame,
+                                            alphas: List[NumericValue],
+                                            decimal_place: NumericValue = 3
+                                            ) -> Tuple[pd.DataFrame,
+                                                       pd.DataFrame]:
+    """
+    Calculates intervals and counts of interval order relations of every
+    alternative for many alpha values at once (e.g. for sensitivity
+    analysis). Sigmas are calculated once and counts are obtained from
+    sorted interval endpoints, so no pairs of alternatives are compared.
 
-    return intervals, pairs
+    :param flows: DataFrame of both positive and negative outranking flows.
+        Index: alternatives, columns: flows type.
+    :param preferences: DataFrame of preference indices with alternatives as
+        index and columns.
+    :param alphas: list of parameters used in calculating intervals
+    :param decimal_place: the decimal place of the output numbers
+
+    :return: DataFrame of intervals with alternatives as index and
+     MultiIndex(alpha, x/y) as columns; DataFrame of relation counts with
+     alternatives as index and MultiIndex(alpha, 'preferred_to' /
+     'preferred_by' / 'indifferent') as columns. Alternative is not counted
+     as indifferent to itself.
+    """
+    # input data validation
+    promethee_iii_relation_counts_validation(flows, preferences, alphas,
+                                             decimal_place)
 
+    alternatives = preferences.index
+    flow = _net_flow(flows)
+    sigmas = _calculate_sigmas(flow, preferences)
+    n = len(alternatives)
+
+    intervals = {}
+    counts = {}
+    for alpha in alphas:
+        x = np.round(flow - alpha * sigmas, decimal_place)
+        y = np.round(flow + alpha * sigmas, decimal_place)
+        preferred_to = np.searchsorted(np.sort(y), x, 'left')
+        preferred_by = n - np.searchsorted(np.sort(x), y, 'right')
+        intervals[(alpha, 'x')] = x
+        intervals[(alpha, 'y')] = y
+        counts[(alpha, 'preferred_to')] = preferred_to
+        counts[(alpha, 'preferred_by')] = preferred_by
+        counts[(alpha, 'indifferent')] = n - 1 - preferred_to - preferred_by
+
+    return pd.DataFrame(intervals, index=alternatives), \
+        pd.DataFrame(counts, index=alternatives)
+
+
+def _net_flow(flows: pd.DataFrame) -> np.ndarray:
+    """
+    Calculates net flows.
 
-def _calculate_intervals(alternatives: pd.Index, flow: pd.Series,
+    :param flows: DataFrame of both positive and negative outranking flows.
+        Index: alternatives, columns: flows type.
+
+    :return: np.ndarray with net flows
+    """
+    return np.subtract(flows['positive'].to_numpy(dtype=float),
+                       flows['negative'].to_numpy(dtype=float))
+
+
+def _calculate_sigmas(flow: np.ndarray, preferences: pd.DataFrame
+                      ) -> np.ndarray:
+    """
+    Calculates sigma values - standard deviations of preference differences
+    around net flow of every alternative.
+
+    :param flow: np.ndarray of net flows
+    :param preferences: DataFrame of preference indices with alternatives as
+        index and columns.
+
+    :return: np.ndarray with sigma of every alternative
+    """
+    values = preferences.to_numpy(dtype=float)
+    n = len(values)
+    sigmas = np.empty(n)
+    chunk = max(1, _PAIRS_CHUNK_SIZE // max(n, 1))
+    for start in range(0, n, chunk):
+        stop = min(start + chunk, n)
+        differences = values[start:stop] - values[:, start:stop].T - \
+            flow[start:stop, np.newaxis]
+        sigmas[start:stop] = np.sqrt(np.mean(np.square(differences), axis=1))
+    return sigmas
+
+
+def _calculate_intervals(alternatives: pd.Index, flow: np.ndarray,
                          preferences: pd.DataFrame, alpha: NumericValue,
                          decimal_place: NumericValue = 3
                          ) -> Tuple[List[List[NumericValue]], pd.DataFrame]:
@@ -83,7 +208,7 @@ def _calculate_intervals(alternatives: pd.Index, flow: pd.Series,
     Calculates intervals used in alternatives comparison.
 
     :param alternatives: list of alternatives
-    :param flow: Series of net flows with alternatives as index
+    :param flow: np.ndarray of net flows in order of alternatives
     :param preferences: DataFrame of preference indices with alternatives as
         index and columns.
     :param alpha: parameter used in calculating intervals
@@ -93,24 +218,11 @@ def _calculate_intervals(alternatives: pd.Index, flow: pd.Series,
      alternatives as index and x, y intervals as columns
     """
     # calculate sigma values
-    sigmas = []
-    n = len(alternatives)
-    for i in preferences.index:
-        total = 0
-        for j in preferences.columns:
-            total += np.square(preferences.loc[i, j] -
-                               preferences.loc[j, i] - flow[i])
-        sigma = np.sqrt((1 / n) * total)
-        sigmas.append(sigma)
+    sigmas = _calculate_sigmas(flow, preferences)
 
     # calculate intervals
-    x = []
-    y = []
-    for i in range(n):
-        xi = flow[i] - (alpha * sigmas[i])
-        x.append(round(xi, decimal_place))
-        yi = flow[i] + (alpha * sigmas[i])
-        y.append(round(yi, decimal_place))
+    x = np.round(flow - alpha * sigmas, decimal_place).tolist()
+    y = np.round(flow + alpha * sigmas, decimal_place).tolist()
 
     intervals = {'x': x, 'y': y}
 
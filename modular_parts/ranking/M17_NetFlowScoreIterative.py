@@ -6,12 +6,14 @@
     Implementation and naming conventions are taken from
     :cite:p:'KadzinskiMichalski2016'
 """
+import numpy as np
 import pandas as pd
 from core.enums import ScoringFunction, ScoringFunctionDirection
 from core.input_validation import net_flow_score_iterative_validation
 from modular_parts.flows import calculate_net_flows_score
 
-__all__ = ['calculate_netflow_score_ranking']
+__all__ = ['calculate_netflow_score_ranking',
+           'calculate_netflow_score_iterative_ranking']
 
 
 def calculate_netflow_score_ranking(preferences: pd.DataFrame,
@@ -43,3 +45,104 @@ def calculate_netflow_score_ranking(preferences: pd.DataFrame,
     ranking = scores.sort_values(ascending=False)
 
     return ranking
+
+
+def _initial_reduction_order(matrix: np.ndarray,
+                             function: ScoringFunction) -> np.ndarray:
+    """
+    Sorts every row of the matrix so that its best element (according to the
+    scoring function) comes first. NaN values are placed at the end of
+    each row.
+
+    :param matrix: np.ndarray with diagonal masked by NaN
+    :param function: ScoringFunction MAX or MIN
+
+    :return: np.ndarray with column indices of sorted rows
+    """
+    if function is ScoringFunction.MAX:
+        return np.argsort(-matrix, axis=1, kind='stable')
+    return np.argsort(matrix, axis=1, kind='stable')
+
+
+def calculate_netflow_score_iterative_ranking(
+        preferences: pd.DataFrame,
+        function: ScoringFunction,
+        direction: ScoringFunctionDirection) -> pd.Series:
+    """
+    Ranking creation with the iterative Net Flow Score procedure. In each
+    step the alternative with the best score is placed on the next position
+    in the ranking and removed, then scores of the remaining alternatives are
+    updated. For SUM only the removed alternative's row and column are
+    subtracted. For MAX and MIN every row keeps its elements sorted and
+    removed alternatives are skipped lazily (like a heap with lazy
+    deletion), so the full ranking costs O(n^2) updates.
+    Ties are resolved in favour of the alternative that appears first in
+    preferences.
+
+    :param preferences: pd.DataFrame with alternatives as index and
+    alternatives as columns
+    :param function: ScoringFunction object, which defines the function
+    used to calculate the score
+    :param direction: ScoringFunctionDirection object, which defines the
+    direction of the function
+
+    :return: pd.Series with alternatives as index and net flow score
+    at the moment of selection as values. The first item is ranked first.
+    """
+
+    # Input validation
+    net_flow_score_iterative_validation(preferences, function, direction)
+
+    # Rows of this matrix are reduced with the scoring function
+    values = preferences.to_numpy(dtype=float, copy=True)
+    np.fill_diagonal(values, np.NaN)
+    if direction is ScoringFunctionDirection.AGAINST:
+        matrix = values.T.copy()
+        sign = -1
+    elif direction is ScoringFunctionDirection.DIFFERENCE:
+        matrix = values - values.T
+        sign = 1
+    else:
+        matrix = values
+        sign = 1
+
+    n = len(matrix)
+    remaining = np.ones(n, dtype=bool)
+    rows = np.arange(n)
+
+    if function is ScoringFunction.SUM:
+        matrix = np.nan_to_num(matrix)
+        reduced = matrix.sum(axis=1)
+    else:
+        order = _initial_reduction_order(matrix, function)
+        pointers = np.zeros(n, dtype=int)
+        # Column n marks an exhausted row
+        order = np.hstack([order, np.full((n, 1), n)])
+        padded = np.hstack([matrix, np.full((n, 1), np.NaN)])
+        reduced = padded[rows, order[:, 0]]
+
+    ranking = np.empty(n, dtype=int)
+    ranking_scores = np.empty(n)
+    for position in range(n):
+        scores = np.where(remaining, sign * reduced, -np.inf)
+        scores[remaining & np.isnan(reduced)] = -np.inf
+        best = int(np.argmax(scores))
+        if not remaining[best]:
+            best = int(np.flatnonzero(remaining)[0])
+        ranking[position] = best
+        ranking_scores[position] = sign * reduced[best]
+        remaining[best] = False
+
+        # Update scores of remaining alternatives
+        if function is ScoringFunction.SUM:
+            reduced -= matrix[:, best]
+        else:
+            outdated = rows[remaining & (order[rows, pointers] == best)]
+            while len(outdated):
+                pointers[outdated] += 1
+                current = order[outdated, pointers[outdated]]
+                outdated = outdated[(current < n) &
+                                    ~remaining[np.minimum(current, n - 1)]]
+            reduced = padded[rows, order[rows, pointers]]
+
+    return pd.Series(ranking_scores, index=preferences.index[ranking])
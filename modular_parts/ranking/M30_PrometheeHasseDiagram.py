@@ -0,0 +1,211 @@
+"""
+    This module computes the transitive reduction (Hasse diagram) of the
+    Promethee I partial order and of the Promethee III interval order and
+    exports it as an edge list, DOT or GraphML.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'BransMareschal2005' and :cite:p:'PrometheeIII'.
+"""
+from typing import Tuple
+from xml.sax.saxutils import quoteattr
+import numpy as np
+import pandas as pd
+from core.ranking_commons import expand_ranges
+from core.segment_tree import MinSegmentTree
+from core.input_validation import promethee_i_hasse_diagram_validation, \
+    promethee_iii_hasse_diagram_validation, hasse_diagram_export_validation
+
+__all__ = ["calculate_prometheeI_hasse_diagram",
+           "calculate_prometheeIII_hasse_diagram",
+           "hasse_diagram_to_dot", "hasse_diagram_to_graphml"]
+
+
+def _create_edges(alternatives: pd.Index, sources: np.ndarray,
+                  targets: np.ndarray) -> pd.DataFrame:
+    """
+    Creates edge list with alternatives stored as categorical codes.
+
+    :param alternatives: pd.Index with alternatives
+    :param sources: np.ndarray with positions of better alternatives
+    :param targets: np.ndarray with positions of worse alternatives
+    :return: pd.DataFrame with 'source' and 'target' columns
+    """
+    return pd.DataFrame({
+        'source': pd.Categorical.from_codes(sources, categories=alternatives),
+        'target': pd.Categorical.from_codes(targets, categories=alternatives)
+    })
+
+
+def _covering_pairs(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds covering pairs of the dominance order of unique points. Points
+    are swept in descending order of x (and y), so points inserted into
+    the tree are the ones with not lower x. In order of (y, x) the points
+    covering a point form a staircase starting from the first inserted
+    point after it, every next one is the first point after the previous
+    one with lower x. Every point and every pair costs O(log n).
+
+    :param points: 2D np.ndarray with unique points (x, y) in rows
+    :return: np.ndarray with covering (better) points and np.ndarray with
+    covered points, pairs are sorted by covered and covering point
+    """
+    x_ranks = np.unique(points[:, 0], return_inverse=True)[1].reshape(-1)
+    by_y = np.lexsort((points[:, 0], points[:, 1]))
+    positions = np.empty(len(points), dtype=np.int64)
+    positions[by_y] = np.arange(len(points))
+    by_y, positions = by_y.tolist(), positions.tolist()
+    x_ranks = x_ranks.tolist()
+
+    tree = MinSegmentTree(len(points))
+    sources = []
+    targets = []
+    for point in np.lexsort((-points[:, 1], -points[:, 0])).tolist():
+        position = positions[point]
+        bound = len(points)
+        while True:
+            position = tree.find_first(position + 1, bound)
+            if position == -1:
+                break
+            source = by_y[position]
+            sources.append(source)
+            targets.append(point)
+            bound = x_ranks[source]
+        tree.update(positions[point], x_ranks[point])
+
+    sources = np.array(sources, dtype=np.int64)
+    targets = np.array(targets, dtype=np.int64)
+    order = np.lexsort((sources, targets))
+    return sources[order], targets[order]
+
+
+def calculate_prometheeI_hasse_diagram(flows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculates the Hasse diagram of the Promethee I preference relation.
+    Alternatives with identical flows (indifferent) are grouped, so all of
+    them share the same edges. Points are swept in order of positive flow
+    and for each point only its covering points (minimal points of the
+    dominating quadrant) are found with a segment tree, without computing
+    the transitive closure, in O((n + number of edges) log n).
+
+    :param flows: pd.DataFrame with alternatives names as index and flows
+    as columns named (positive and negative)
+
+    :return: pd.DataFrame with 'source' (better alternative) and 'target'
+    (worse alternative) columns, one row per edge of the Hasse diagram
+    """
+    promethee_i_hasse_diagram_validation(flows)
+
+    # Group alternatives with identical flows into unique points
+    points, point_of_alternative = np.unique(
+        np.column_stack([flows['positive'].to_numpy(dtype=float),
+                         -flows['negative'].to_numpy(dtype=float)]),
+        axis=0, return_inverse=True)
+    point_of_alternative = point_of_alternative.reshape(-1)
+
+    point_sources, point_targets = _covering_pairs(points)
+
+    # Replace points with alternatives
+    alternatives_order = np.argsort(point_of_alternative, kind='stable')
+    point_starts = np.searchsorted(point_of_alternative[alternatives_order],
+                                   np.arange(len(points)))
+    point_stops = np.append(point_starts[1:], len(point_of_alternative))
+
+    edges, source_positions = expand_ranges(point_starts[point_sources],
+                                            point_stops[point_sources])
+    edges_targets = point_targets[edges]
+    target_edges, target_positions = expand_ranges(
+        point_starts[edges_targets], point_stops[edges_targets])
+
+    return _create_edges(flows.index,
+                         alternatives_order[source_positions[target_edges]],
+                         alternatives_order[target_positions])
+
+
+def calculate_prometheeIII_hasse_diagram(intervals: pd.DataFrame
+                                         ) -> pd.DataFrame:
+    """
+    Calculates the Hasse diagram of the Promethee III interval order
+    (a is preferred to b if x of a is greater than y of b). For
+    alternatives sorted by y, alternatives covered by a form a contiguous
+    range, so the diagram is obtained with binary searches in
+    O(n log n + number of edges).
+
+    :param intervals: pd.DataFrame with alternatives as index and 'x', 'y'
+    columns (e.g. intervals from calculate_promethee_iii_ranking)
+
+    :return: pd.DataFrame with 'source' (better alternative) and 'target'
+    (worse alternative) columns, one row per edge of the Hasse diagram
+    """
+    promethee_iii_hasse_diagram_validation(intervals)
+
+    x = intervals['x'].to_numpy(dtype=float)
+    y = intervals['y'].to_numpy(dtype=float)
+
+    order = np.argsort(y, kind='stable')
+    sorted_y = y[order]
+    prefix_max_x = np.maximum.accumulate(x[order])
+
+    # Alternatives worse than a: y < x_a, first ones in y order
+    worse_stops = np.searchsorted(sorted_y, x, 'left')
+    # Worse alternative is covered if no worse alternative lies above it
+    max_worse_x = np.where(worse_stops > 0,
+                           prefix_max_x[np.maximum(worse_stops - 1, 0)],
+                           np.inf)
+    covered_starts = np.searchsorted(sorted_y, max_worse_x, 'left')
+
+    sources, targets = expand_ranges(covered_starts, worse_stops)
+
+    return _create_edges(intervals.index, sources, order[targets])
+
+
+def _quote_dot_id(name) -> str:
+    """
+    Quotes name of a node to be used as DOT identifier.
+
+    :param name: name of a node
+    :return: str with quoted name
+    """
+    return '"' + str(name).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def hasse_diagram_to_dot(edges: pd.DataFrame) -> str:
+    """
+    Exports Hasse diagram to DOT format.
+
+    :param edges: pd.DataFrame with categorical 'source' and 'target'
+    columns
+
+    :return: str with the graph in DOT format
+    """
+    hasse_diagram_export_validation(edges)
+
+    lines = ['digraph {']
+    lines += [f'  {_quote_dot_id(node)};'
+              for node in edges['source'].cat.categories]
+    lines += [f'  {_quote_dot_id(source)} -> {_quote_dot_id(target)};'
+              for source, target in zip(edges['source'], edges['target'])]
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def hasse_diagram_to_graphml(edges: pd.DataFrame) -> str:
+    """
+    Exports Hasse diagram to GraphML format.
+
+    :param edges: pd.DataFrame with categorical 'source' and 'target'
+    columns
+
+    :return: str with the graph in GraphML format
+    """
+    hasse_diagram_export_validation(edges)
+
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">',
+             '  <graph edgedefault="directed">']
+    lines += [f'    <node id={quoteattr(str(node))}/>'
+              for node in edges['source'].cat.categories]
+    lines += [f'    <edge source={quoteattr(str(source))} '
+              f'target={quoteattr(str(target))}/>'
+              for source, target in zip(edges['source'], edges['target'])]
+    lines += ['  </graph>', '</graphml>']
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,152 @@
+"""
+    This module analyses rank reversal of Promethee II ranking when single
+    alternatives are removed from the set. Leave-one-out net flows are
+    obtained from row and column sums of the preference matrix, so the
+    Promethee II method does not have to be recalculated for every removed
+    alternative.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'BransMareschal2005'.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from core.input_validation import promethee_ii_rank_reversal_validation
+from core.ranking_commons import expand_ranges
+
+__all__ = ["calculate_leave_one_out_net_flows",
+           "calculate_promethee_ii_rank_reversal"]
+
+# Absolute tolerance used when comparing aggregated net scores
+_SCORE_TOLERANCE = 1e-9
+
+
+def _net_scores(preferences: np.ndarray) -> np.ndarray:
+    """
+    Calculates not normalized net scores (row sums minus column sums).
+
+    :param preferences: np.ndarray with preferences between alternatives
+    :return: np.ndarray with net score of every alternative
+    """
+    return preferences.sum(axis=1) - preferences.sum(axis=0)
+
+
+def calculate_leave_one_out_net_flows(preferences: pd.DataFrame
+                                      ) -> pd.DataFrame:
+    """
+    Calculates Promethee II net flows of alternatives after removing each
+    alternative from the set. Every leave-one-out net flow vector is
+    obtained from net scores of the full set by subtracting preferences
+    of the removed alternative, so total complexity is O(n^2).
+
+    :param preferences: pd.DataFrame with alternatives as index and
+     alternatives as columns
+    :return: pd.DataFrame with removed alternatives as index and alternatives
+     as columns, net flows as values (NaN for removed alternative)
+    """
+    # input data validation
+    promethee_ii_rank_reversal_validation(preferences, 1)
+
+    values = preferences.to_numpy(dtype=float)
+    n = len(values)
+    scores = _net_scores(values)
+    # row of removed alternative x: score_y - (P(y, x) - P(x, y))
+    flows = (scores[np.newaxis, :] - values.T + values) / max(n - 2, 1)
+    np.fill_diagonal(flows, np.nan)
+
+    return pd.DataFrame(flows, index=preferences.index,
+                        columns=preferences.index)
+
+
+def _find_reversals(values: np.ndarray, scores: np.ndarray,
+                    order: np.ndarray, removed: int
+                    ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds pairs of alternatives which order is reversed after removing
+    given alternative. Removing alternative x changes score of y by
+    P(y, x) - P(x, y), so only pairs which scores differ by less than the
+    spread of these changes have to be checked.
+
+    :param values: np.ndarray with preferences between alternatives
+    :param scores: np.ndarray with net scores of the full set
+    :param order: np.ndarray with positions sorted by descending scores
+    :param removed: position of removed alternative
+    :return: np.ndarray with positions of alternatives which were better and
+     np.ndarray with positions of alternatives which were worse before
+     removal
+    """
+    changes = values[:, removed] - values[removed, :]
+    changes[removed] = 0
+    # better alternative a can fall below b only if
+    # score_a - score_b < change_a - change_b <= change_a - min(change)
+    spreads = changes[order] - changes.min() + _SCORE_TOLERANCE
+
+    sorted_scores = -scores[order]
+    stops = np.searchsorted(sorted_scores, sorted_scores + spreads,
+                            side='right')
+    first, second = expand_ranges(np.arange(1, len(order) + 1), stops)
+    first, second = order[first], order[second]
+
+    new_scores = scores - changes
+    reversed_pairs = \
+        (scores[first] - scores[second] > _SCORE_TOLERANCE) & \
+        (new_scores[second] - new_scores[first] > _SCORE_TOLERANCE) & \
+        (first != removed) & (second != removed)
+
+    return first[reversed_pairs], second[reversed_pairs]
+
+
+def calculate_promethee_ii_rank_reversal(preferences: pd.DataFrame,
+                                         n_jobs: int = 1
+                                         ) -> Tuple[pd.DataFrame, float]:
+    """
+    Checks for every alternative if its removal reverses Promethee II
+    order of any pair of remaining alternatives. Pair is reversed when
+    the first alternative had strictly greater net flow than the second one
+    and after removal it has strictly lower net flow. Leave-one-out net flows
+    are updated from row and column sums in O(n) for every removed
+    alternative.
+
+    :param preferences: pd.DataFrame with alternatives as index and
+     alternatives as columns
+    :param n_jobs: number of threads used to analyse removed alternatives
+
+    :return: Tuple of pd.DataFrame with reversed pairs ('removed', 'first',
+     'second' columns, where 'first' was ranked better than 'second' before
+     removal) and rank reversal rate - fraction of reversed pairs among all
+     analysed pairs
+    """
+    # input data validation
+    promethee_ii_rank_reversal_validation(preferences, n_jobs)
+
+    values = preferences.to_numpy(dtype=float)
+    n = len(values)
+    scores = _net_scores(values)
+    order = np.argsort(-scores, kind='stable')
+
+    def analyse(removed: int) -> Tuple[np.ndarray, np.ndarray]:
+        return _find_reversals(values, scores, order, removed)
+
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(executor.map(analyse, range(n)))
+    else:
+        results = [analyse(removed) for removed in range(n)]
+
+    removed = np.repeat(np.arange(n), [len(first) for first, _ in results])
+    first = np.concatenate([first for first, _ in results]) \
+        if results else np.empty(0, dtype=int)
+    second = np.concatenate([second for _, second in results]) \
+        if results else np.empty(0, dtype=int)
+
+    alternatives = preferences.index
+    reversals = pd.DataFrame({
+        'removed': alternatives[removed],
+        'first': alternatives[first],
+        'second': alternatives[second]
+    })
+    analysed_pairs = n * (n - 1) * (n - 2) // 2
+    rate = len(reversals) / analysed_pairs if analysed_pairs else 0.0
+
+    return reversals, rate
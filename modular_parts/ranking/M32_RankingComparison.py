@@ -0,0 +1,313 @@
+"""
+    This module compares rankings of alternatives (obtained e.g. for
+    different decision makers or scenarios) with Kendall tau-b, Spearman
+    rho and top-k overlap. Kendall tau-b of two rankings is calculated with
+    Knight's O(n log n) algorithm based on merge sort inversion counting,
+    batches of rankings are compared all at once with matrix products.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'Knight1966'.
+"""
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from core.input_validation import ranking_comparison_validation, \
+    rankings_comparison_validation, ranking_positions_validation
+
+__all__ = ["calculate_ranking_positions",
+           "calculate_kendall_tau", "calculate_spearman_rho",
+           "calculate_top_k_overlap", "calculate_kendall_tau_matrix",
+           "calculate_spearman_rho_matrix",
+           "calculate_top_k_overlap_matrix"]
+
+# Maximal number of signs of rank differences kept in memory at once
+_SIGNS_CHUNK_SIZE = 2 ** 22
+
+
+def calculate_ranking_positions(ranking: pd.Series) -> pd.Series:
+    """
+    Converts ranking with positions as index and alternatives as values
+    (e.g. Promethee II ranking) into positions of alternatives.
+
+    :param ranking: pd.Series with positions as index and alternatives as
+     values
+    :return: pd.Series with alternatives as index and positions as values
+    """
+    # input data validation
+    ranking_positions_validation(ranking)
+
+    return pd.Series(data=ranking.index, index=ranking.values,
+                     name=ranking.name)
+
+
+def _dense_ranks(positions: np.ndarray) -> np.ndarray:
+    """
+    Replaces positions in every row with dense ranks (0, 1, ...), equal
+    positions get equal ranks.
+
+    :param positions: 2D np.ndarray with positions of alternatives
+    :return: 2D np.ndarray with dense ranks
+    """
+    order = np.argsort(positions, axis=1, kind='stable')
+    sorted_positions = np.take_along_axis(positions, order, axis=1)
+    new_value = np.ones_like(sorted_positions, dtype=np.int64)
+    new_value[:, 0] = 0
+    new_value[:, 1:] = sorted_positions[:, 1:] != sorted_positions[:, :-1]
+    ranks = np.empty_like(new_value)
+    np.put_along_axis(ranks, order, np.cumsum(new_value, axis=1), axis=1)
+    return ranks
+
+
+def _average_ranks(positions: np.ndarray) -> np.ndarray:
+    """
+    Replaces positions in every row with ranks, where tied alternatives get
+    average of ranks they occupy.
+
+    :param positions: 2D np.ndarray with positions of alternatives
+    :return: 2D np.ndarray with average ranks
+    """
+    n = positions.shape[1]
+    dense = _dense_ranks(positions)
+    rows = np.arange(len(dense))[:, np.newaxis]
+    counts = np.zeros((len(dense), n), dtype=np.int64)
+    np.add.at(counts, (rows, dense), 1)
+    ends = np.cumsum(counts, axis=1)
+    averages = ends - (counts - 1) / 2
+    return averages[rows, dense]
+
+
+def _count_inversions(sequences: np.ndarray) -> np.ndarray:
+    """
+    Counts pairs i < j with sequence[i] > sequence[j] in every row with
+    bottom-up merge sort. Every level merges blocks of all rows at once.
+
+    :param sequences: 2D np.ndarray with non negative integers smaller than
+     number of columns
+    :return: np.ndarray with number of inversions in every row
+    """
+    m, n = sequences.shape
+    sequences = sequences.astype(np.int64)
+    inversions = np.zeros(m, dtype=np.int64)
+    index = np.arange(n)
+    width = 1
+    while width < n:
+        block = index // (2 * width)
+        in_right = (index // width) % 2
+        # left half goes first for equal values, so only strictly greater
+        # values from left half are counted for elements of right half
+        keys = (block * n + sequences) * 2 + in_right
+        order = np.argsort(keys, axis=1, kind='stable')
+        sequences = np.take_along_axis(sequences, order, axis=1)
+        merged_half = in_right[order]
+
+        # position in merged block minus position in right half gives number
+        # of not greater elements from left half
+        block_start = block * 2 * width
+        right_before = np.cumsum(merged_half, axis=1) - merged_half - \
+            np.concatenate([[0], np.cumsum(in_right)])[block_start]
+        left_size = np.minimum(width, n - block_start)
+        greater_in_left = left_size - (index - block_start - right_before)
+        inversions += np.where(merged_half == 1, greater_in_left, 0).sum(
+            axis=1)
+        width *= 2
+    return inversions
+
+
+def _tied_pairs(ranks: np.ndarray) -> np.ndarray:
+    """
+    Counts pairs of alternatives with equal ranks in every row.
+
+    :param ranks: 2D np.ndarray with dense ranks
+    :return: np.ndarray with number of tied pairs in every row
+    """
+    rows = np.arange(len(ranks))[:, np.newaxis]
+    counts = np.zeros(ranks.shape, dtype=np.int64)
+    np.add.at(counts, (rows, ranks), 1)
+    return (counts * (counts - 1) // 2).sum(axis=1)
+
+
+def _kendall_tau(reference: np.ndarray, compared: np.ndarray,
+                 reference_ties: int, compared_ties: np.ndarray
+                 ) -> np.ndarray:
+    """
+    Calculates Kendall tau-b between one ranking and many rankings with
+    Knight's algorithm.
+
+    :param reference: np.ndarray with dense ranks of reference ranking
+    :param compared: 2D np.ndarray with dense ranks of compared rankings
+    :param reference_ties: number of tied pairs in reference ranking
+    :param compared_ties: np.ndarray with number of tied pairs in compared
+     rankings
+    :return: np.ndarray with Kendall tau-b for every compared ranking
+    """
+    n = len(reference)
+    # sort by reference, then by compared ranking
+    order = np.argsort(reference * n + compared, axis=1, kind='stable')
+    sorted_reference = reference[order]
+    sorted_compared = np.take_along_axis(compared, order, axis=1)
+    joint_ties = _tied_pairs(_dense_ranks(sorted_reference * n +
+                                          sorted_compared))
+    discordant = _count_inversions(sorted_compared)
+
+    pairs = n * (n - 1) // 2
+    score = pairs - reference_ties - compared_ties + joint_ties - \
+        2 * discordant
+    denominator = np.sqrt(float(pairs - reference_ties) *
+                          (pairs - compared_ties).astype(float))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, score / denominator, np.nan)
+
+
+def _rankings_values(rankings: pd.DataFrame) -> Tuple[np.ndarray,
+                                                      np.ndarray]:
+    """
+    Prepares dense ranks and numbers of tied pairs of rankings.
+
+    :param rankings: pd.DataFrame with alternatives as index, rankings as
+     columns and positions as values
+    :return: 2D np.ndarray with dense ranks (rankings in rows) and
+     np.ndarray with number of tied pairs
+    """
+    ranks = _dense_ranks(rankings.to_numpy(dtype=float).T)
+    return ranks, _tied_pairs(ranks)
+
+
+def calculate_kendall_tau_matrix(rankings: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculates Kendall tau-b between every pair of rankings. Signs of
+    differences between all pairs of alternatives are compared for all
+    rankings at once with matrix multiplication, which for batches is faster
+    than merge sort applied to every pair of rankings.
+
+    :param rankings: pd.DataFrame with alternatives as index, rankings as
+     columns and positions (lower is better, equal means tie) as values
+    :return: pd.DataFrame with rankings as index and columns and Kendall
+     tau-b as values
+    """
+    # input data validation
+    rankings_comparison_validation(rankings)
+
+    ranks = _dense_ranks(rankings.to_numpy(dtype=float).T)
+    m, n = ranks.shape
+    # signs of rank differences of all pairs of alternatives for every
+    # ranking, sum of their products is number of concordant minus
+    # number of discordant pairs (ties give 0)
+    concordance = np.zeros((m, m))
+    untied_pairs = np.zeros(m)
+    first, second = np.triu_indices(n, k=1)
+    chunk = max(1, _SIGNS_CHUNK_SIZE // m)
+    for start in range(0, len(first), chunk):
+        signs = np.sign(ranks[:, first[start:start + chunk]] -
+                        ranks[:, second[start:start + chunk]]
+                        ).astype(float)
+        concordance += signs @ signs.T
+        untied_pairs += np.abs(signs).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        taus = concordance / np.sqrt(np.outer(untied_pairs, untied_pairs))
+    return pd.DataFrame(taus, index=rankings.columns,
+                        columns=rankings.columns)
+
+
+def calculate_spearman_rho_matrix(rankings: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculates Spearman rho (Pearson correlation of average ranks) between
+    every pair of rankings.
+
+    :param rankings: pd.DataFrame with alternatives as index, rankings as
+     columns and positions (lower is better, equal means tie) as values
+    :return: pd.DataFrame with rankings as index and columns and Spearman
+     rho as values
+    """
+    # input data validation
+    rankings_comparison_validation(rankings)
+
+    ranks = _average_ranks(rankings.to_numpy(dtype=float).T)
+    ranks = ranks - ranks.mean(axis=1, keepdims=True)
+    norms = np.sqrt((ranks ** 2).sum(axis=1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rhos = (ranks @ ranks.T) / np.outer(norms, norms)
+
+    return pd.DataFrame(rhos, index=rankings.columns,
+                        columns=rankings.columns)
+
+
+def calculate_top_k_overlap_matrix(rankings: pd.DataFrame, k: int
+                                   ) -> pd.DataFrame:
+    """
+    Calculates overlap of top-k sets (alternatives with position not greater
+    than k) between every pair of rankings, divided by k.
+
+    :param rankings: pd.DataFrame with alternatives as index, rankings as
+     columns and positions (starting from 1) as values
+    :param k: number of best positions
+    :return: pd.DataFrame with rankings as index and columns and top-k
+     overlap as values
+    """
+    # input data validation
+    rankings_comparison_validation(rankings, k)
+
+    top = (rankings.to_numpy(dtype=float) <= k).astype(float)
+    overlaps = (top.T @ top) / k
+
+    return pd.DataFrame(overlaps, index=rankings.columns,
+                        columns=rankings.columns)
+
+
+def _pair_frame(ranking_a: pd.Series, ranking_b: pd.Series) -> pd.DataFrame:
+    """
+    Combines two rankings into one DataFrame aligned on alternatives.
+
+    :param ranking_a: pd.Series with alternatives as index and positions as
+     values
+    :param ranking_b: pd.Series with alternatives as index and positions as
+     values
+    :return: pd.DataFrame with alternatives as index and two columns
+    """
+    ranking_comparison_validation(ranking_a, ranking_b)
+    return pd.DataFrame({0: ranking_a, 1: ranking_b.loc[ranking_a.index]})
+
+
+def calculate_kendall_tau(ranking_a: pd.Series, ranking_b: pd.Series
+                          ) -> float:
+    """
+    Calculates Kendall tau-b between two rankings in O(n log n).
+
+    :param ranking_a: pd.Series with alternatives as index and positions
+     (lower is better, equal means tie) as values
+    :param ranking_b: pd.Series with alternatives as index and positions
+     (lower is better, equal means tie) as values
+    :return: Kendall tau-b
+    """
+    ranks, ties = _rankings_values(_pair_frame(ranking_a, ranking_b))
+    return float(_kendall_tau(ranks[0], ranks[1:], ties[0], ties[1:])[0])
+
+
+def calculate_spearman_rho(ranking_a: pd.Series, ranking_b: pd.Series
+                           ) -> float:
+    """
+    Calculates Spearman rho between two rankings.
+
+    :param ranking_a: pd.Series with alternatives as index and positions
+     (lower is better, equal means tie) as values
+    :param ranking_b: pd.Series with alternatives as index and positions
+     (lower is better, equal means tie) as values
+    :return: Spearman rho
+    """
+    return float(calculate_spearman_rho_matrix(
+        _pair_frame(ranking_a, ranking_b)).iloc[0, 1])
+
+
+def calculate_top_k_overlap(ranking_a: pd.Series, ranking_b: pd.Series,
+                            k: int) -> float:
+    """
+    Calculates overlap of top-k sets of two rankings divided by k.
+
+    :param ranking_a: pd.Series with alternatives as index and positions
+     (starting from 1) as values
+    :param ranking_b: pd.Series with alternatives as index and positions
+     (starting from 1) as values
+    :param k: number of best positions
+    :return: top-k overlap
+    """
+    return float(calculate_top_k_overlap_matrix(
+        _pair_frame(ranking_a, ranking_b), k).iloc[0, 1])
@@ -2,7 +2,13 @@ from .M14_PrometheeIRanking import *
 from .M16_PrometheeIIIRanking import *
 from .M17_NetFlowScoreIterative import *
 from .M15_PrometheeIIRanking import *
+from .M30_PrometheeHasseDiagram import *
+from .M31_PrometheeIIRankReversal import *
+from .M32_RankingComparison import *
 
 __all__ = M14_PrometheeIRanking.__all__ + M15_PrometheeIIRanking.__all__ + \
           M16_PrometheeIIIRanking.__all__ \
-          + M17_NetFlowScoreIterative.__all__
+          + M17_NetFlowScoreIterative.__all__ \
+          + M30_PrometheeHasseDiagram.__all__ \
+          + M31_PrometheeIIRankReversal.__all__ \
+          + M32_RankingComparison.__all__
@@ -5,79 +5,77 @@
     Implementation and naming of conventions are taken from
     :cite:p:'ArazOzkarahan2007'.
 """
-import math
+import numpy as np
 import pandas as pd
 from core.aliases import NumericValue
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from core.preference_commons import directed_alternatives_performances
 from core.promethee_check_dominance import \
     check_if_profiles_are_strictly_worse
-from core.input_validation import prom_sort_validation
+from core.input_validation import prom_sort_validation, \
+    prom_sort_cut_points_validation
 
-__all__ = ["calculate_promsort_sorted_alternatives"]
+__all__ = ["calculate_promsort_sorted_alternatives",
+           "calculate_promsort_cut_points_assignments"]
 
 
-def _define_outranking_relation(positive_flow_a: NumericValue,
-                                negative_flow_a: NumericValue,
-                                positive_flow_b: NumericValue,
-                                negative_flow_b: NumericValue) -> chr:
+def _define_outranking_relations(positive_flows_a: np.ndarray,
+                                 negative_flows_a: np.ndarray,
+                                 positive_flows_b: np.ndarray,
+                                 negative_flows_b: np.ndarray) -> np.ndarray:
     """
-    This function declare 3 types of outranking relation between alternative
-    and profile or profile and alternative (preference - 'P', indifference -
-     'I', incomparable - '?')
-
-    :param positive_flow_a: NumericValue that determines positive flow of
-    first profile/alternative
-    :param negative_flow_a: NumericValue that determines negative flow of
-    first profile/alternative
-    :param positive_flow_b: NumericValue that determines positive flow of
-    second profile/alternative
-    :param negative_flow_b: NumericValue that determines negative flow of
-    second profile/alternative
-
-    :return: chr that determines one of three types of outranking relation
-    between first profile/alternative and second profile/alternative
+    This function declare types of outranking relation between alternatives
+    and profiles or profiles and alternatives (preference - 'P',
+    indifference - 'I', incomparability - 'R', other - '?'). Flows are
+    broadcast against each other, so relations of all pairs are computed at
+    once.
+
+    :param positive_flows_a: np.ndarray with positive flows of first
+    profiles/alternatives
+    :param negative_flows_a: np.ndarray with negative flows of first
+    profiles/alternatives
+    :param positive_flows_b: np.ndarray with positive flows of second
+    profiles/alternatives
+    :param negative_flows_b: np.ndarray with negative flows of second
+    profiles/alternatives
+
+    :return: np.ndarray with chr that determines type of outranking relation
+    between first profiles/alternatives and second profiles/alternatives
     """
-    if math.isclose(positive_flow_a, positive_flow_b) \
-            and math.isclose(negative_flow_a, negative_flow_b):
-        return "I"
-    elif positive_flow_a >= positive_flow_b \
-            and negative_flow_a <= negative_flow_b:
-        return "P"
-    elif (positive_flow_a > positive_flow_b and negative_flow_a >
-          negative_flow_b) or \
-            (positive_flow_a < positive_flow_b and negative_flow_a <
-             negative_flow_b):
-        return "R"
-    else:
-        return "?"
-
-
-def _check_if_all_profiles_are_preferred_to_alternative(
-        category_profiles_flows: pd.DataFrame,
-        alternative_positive_flow: NumericValue,
-        alternative_negative_flow: NumericValue) -> bool:
+
+    def isclose(a, b):
+        # Same tolerance as math.isclose
+        return (a == b) | (np.abs(a - b) <=
+                           1e-09 * np.maximum(np.abs(a), np.abs(b)))
+
+    indifference = isclose(positive_flows_a, positive_flows_b) & \
+        isclose(negative_flows_a, negative_flows_b)
+    preference = (positive_flows_a >= positive_flows_b) & \
+        (negative_flows_a <= negative_flows_b)
+    incomparability = ((positive_flows_a > positive_flows_b) &
+                       (negative_flows_a > negative_flows_b)) | \
+                      ((positive_flows_a < positive_flows_b) &
+                       (negative_flows_a < negative_flows_b))
+
+    return np.select([indifference, preference, incomparability],
+                     ['I', 'P', 'R'], '?')
+
+
+def _first_occurrence(relations: np.ndarray, relation: chr) -> np.ndarray:
     """
-    This function checks if all profiles are preferred to alternative
-    (which allow sorting method to assign alternative to the worst category)
+    This function finds position of the first occurrence of the relation in
+    every row.
 
-    :param category_profiles_flows: pd.DataFrame with alternatives as
-    index and flows as columns named (positive and negative)
-    :param alternative_positive_flow: NumericValue that determines positive
-    flow of alternative
-    :param alternative_negative_flow: NumericValue that determines negative
-    flow of alternative
+    :param relations: 2D np.ndarray with outranking relations of
+    alternatives (rows) to profiles (columns)
+    :param relation: chr with searched relation
 
-    :return: Boolean that determines if all profiles are preferred
-    to alternative
+    :return: np.ndarray with positions, number of profiles if relation does
+    not occur
     """
-    outranking_relations = category_profiles_flows.apply(
-        lambda row: _define_outranking_relation(row['positive'],
-                                                row['negative'],
-                                                alternative_positive_flow,
-                                                alternative_negative_flow),
-        axis=1)
-    return outranking_relations.str.contains('P').all()
+    occurrences = relations == relation
+    return np.where(occurrences.any(axis=1), occurrences.argmax(axis=1),
+                    relations.shape[1])
 
 
 def _calculate_first_step_assignments(categories: List[str],
@@ -110,48 +108,105 @@ def _calculate_first_step_assignments(categories: List[str],
     :return: pd.DataFrame with alternatives names as index and
     assignments as columns named (worse and better)
     """
+    alternatives_positive = \
+        alternatives_flows['positive'].to_numpy()[:, np.newaxis]
+    alternatives_negative = \
+        alternatives_flows['negative'].to_numpy()[:, np.newaxis]
+    profiles_positive = category_profiles_flows['positive'].to_numpy()
+    profiles_negative = category_profiles_flows['negative'].to_numpy()
+    n_profiles = len(category_profiles_flows)
+
+    # Relations of alternatives (rows) to profiles (columns) and conversely
+    outranking_relations = _define_outranking_relations(
+        alternatives_positive, alternatives_negative, profiles_positive,
+        profiles_negative)
+    reversed_relations = _define_outranking_relations(
+        profiles_positive, profiles_negative, alternatives_positive,
+        alternatives_negative)
+
+    # Checking alternatives outranking relations, number of profiles stands
+    # for no occurrence
+    first_i_occurrence = _first_occurrence(outranking_relations, 'I')
+    first_r_occurrence = _first_occurrence(outranking_relations, 'R')
+    first_not_p_occurrence = np.where(
+        (outranking_relations != 'P').any(axis=1),
+        (outranking_relations != 'P').argmax(axis=1), 0)
+    last_p_occurrence = np.where((outranking_relations == 'P').any(axis=1),
+                                 first_not_p_occurrence - 1, n_profiles)
+    min_idx = np.minimum(first_r_occurrence, first_i_occurrence)
+
+    # Assignment conditions
+    conditions = [outranking_relations[:, -1] == 'P',
+                  (reversed_relations == 'P').all(axis=1),
+                  min_idx > last_p_occurrence]
+    worse = np.select(conditions, [len(categories) - 1, 0,
+                                   last_p_occurrence + 1], min_idx)
+    better = np.select(conditions, [len(categories) - 1, 0,
+                                    last_p_occurrence + 1], min_idx + 1)
+
+    categories = np.array(categories, dtype=object)
+    return pd.DataFrame({'worse': categories[worse],
+                         'better': categories[better]},
+                        index=alternatives_flows.index)
+
+
+def _calculate_cut_points_assignments(alternatives_flows: pd.DataFrame,
+                                      classification: pd.DataFrame,
+                                      cut_points: np.ndarray,
+                                      assign_to_better_class: bool = True
+                                      ) -> np.ndarray:
+    """
+    Used assigned categories to assign the unassigned ones for every cut
+    point. Net flows of alternatives assigned in the first step are summed
+    per category once, so positive distance (to the worse category s) and
+    negative distance (to the better category s+1) of all unassigned
+    alternatives are obtained with array arithmetic. Total distance is then
+    compared with all cut points at once.
+
+    :param alternatives_flows: pd.DataFrame with alternatives as
+    index and flows as columns named (positive and negative)
+    :param classification: pd.DataFrame with alternatives names as index and
+    assignments as columns named (worse and better)
+    :param cut_points: np.ndarray with cut points
+    :param assign_to_better_class: boolean which describe preference of
+    the DM in final alternative assignment if total distance is equal
+    cut_point value.
 
-    classification = {alternative: [] for alternative in
-                      alternatives_flows.index}
-
-    category_profiles = category_profiles_flows.index
-
-    for alternative, alternative_row in alternatives_flows.iterrows():
-        outranking_relations = category_profiles_flows.apply(
-            lambda category_profile_row: _define_outranking_relation(
-                alternative_row['positive'], alternative_row['negative'],
-                category_profile_row['positive'],
-                category_profile_row['negative']), axis=1)
-
-        # Checking alternatives outranking relations
-        first_i_occurrence = category_profiles.get_loc(
-            outranking_relations.str.contains('I').idxmax()) \
-            if outranking_relations.str.contains('I').any() else float('inf')
-        first_r_occurrence = category_profiles.get_loc(
-            outranking_relations.str.contains('R').idxmax()) \
-            if outranking_relations.str.contains('R').any() else float('inf')
-        last_p_occurrence = category_profiles.get_loc(
-            outranking_relations.str.contains('P').idxmin()) - 1 \
-            if outranking_relations.str.contains('P').any() else float('inf')
-
-        # Assignment conditions
-        if outranking_relations[-1] == 'P':
-            classification[alternative] = [categories[-1], categories[-1]]
-        elif _check_if_all_profiles_are_preferred_to_alternative(
-                category_profiles_flows, alternative_row['positive'],
-                alternative_row['negative']):
-            classification[alternative] = [categories[0], categories[0]]
-        elif min(first_r_occurrence, first_i_occurrence) > last_p_occurrence:
-            classification[alternative] = \
-                [categories[last_p_occurrence + 1],
-                 categories[last_p_occurrence + 1]]
-        else:
-            min_idx = min(first_r_occurrence, first_i_occurrence)
-            classification[alternative] = [categories[min_idx],
-                                           categories[min_idx + 1]]
-
-    return pd.DataFrame.from_dict(classification, orient='index',
-                                  columns=['worse', 'better'])
+    :return: 2D np.ndarray with assignments (alternatives x cut points)
+    """
+    worse = classification['worse'].to_numpy(dtype=object)
+    better = classification['better'].to_numpy(dtype=object)
+    net_flows = (alternatives_flows['positive'] -
+                 alternatives_flows['negative']).loc[
+        classification.index].to_numpy()
+    classified = worse == better
+
+    # Mean net flow of alternatives assigned to every category
+    categories_net_flows = pd.Series(net_flows[classified]).groupby(
+        worse[classified]).agg(['sum', 'count'])
+    categories_means = categories_net_flows['sum'] / \
+        categories_net_flows['count']
+    worse_means = categories_means.reindex(worse).to_numpy()
+    better_means = categories_means.reindex(better).to_numpy()
+
+    positive_distance = net_flows - worse_means
+    negative_distance = better_means - net_flows
+    total_distance = (positive_distance - negative_distance)[:, np.newaxis]
+
+    # Assignment based on distance comparison
+    to_better = (total_distance > cut_points) | \
+                ((total_distance == cut_points) & assign_to_better_class)
+    assignments = np.where(to_better, better[:, np.newaxis],
+                           worse[:, np.newaxis])
+
+    # Edge cases: no alternative was assigned to worse or better category
+    assignments[np.isnan(better_means)] = \
+        better[np.isnan(better_means), np.newaxis]
+    assignments[np.isnan(worse_means)] = \
+        worse[np.isnan(worse_means), np.newaxis]
+    assignments[classified] = worse[classified, np.newaxis]
+
+    return assignments
 
 
 def _calculate_final_assignments(alternatives_flows: pd.DataFrame,
@@ -184,62 +239,10 @@ def _calculate_final_assignments(alternatives_flows: pd.DataFrame,
 
     :return: pd.Series objects with assignments as values
     """
-
-    new_classification = classification.apply(
-        lambda row: row['worse'] if row['worse'] == row['better'] else None,
-        axis=1)
-    not_classified = classification[new_classification.isnull()]
-    classified = classification[~new_classification.isnull()]
-
-    # Iterating over unassigned alternatives
-    for alternative, alternative_row in not_classified.iterrows():
-        worse_category_alternatives = alternatives_flows.loc[
-            classified[classified['worse'] == alternative_row['worse']].index]
-        better_category_alternatives = alternatives_flows.loc[
-            classified[
-                classified['worse'] == alternative_row['better']].index]
-
-        alternative_net_outranking_flow = \
-            alternatives_flows.loc[alternative, 'positive'] - \
-            alternatives_flows.loc[alternative, 'negative']
-
-        if worse_category_alternatives.empty:
-            new_classification[alternative] = alternative_row['worse']
-            continue
-        else:
-            worse_category_net_outranking_flow = \
-                worse_category_alternatives.apply(
-                    lambda row: row['positive'] - row['negative'], axis=1)
-            positive_distance = \
-                worse_category_net_outranking_flow.map(
-                    lambda x: alternative_net_outranking_flow - x).sum() / \
-                worse_category_alternatives.shape[0]
-
-        if better_category_alternatives.empty:
-            new_classification[alternative] = alternative_row['better']
-            continue
-        else:
-            better_category_net_outranking_flow = \
-                better_category_alternatives.apply(
-                    lambda row: row['positive'] - row['negative'], axis=1)
-            negative_distance = better_category_net_outranking_flow.map(
-                lambda x: x - alternative_net_outranking_flow).sum() / \
-                better_category_alternatives.shape[0]
-
-        total_distance = positive_distance - negative_distance
-
-        # Assignment based on distance comparison
-        if total_distance > cut_point:
-            new_classification[alternative] = alternative_row['better']
-        elif total_distance < cut_point:
-            new_classification[alternative] = alternative_row['worse']
-        else:
-            if assign_to_better_class:
-                new_classification[alternative] = alternative_row['better']
-            else:
-                new_classification[alternative] = alternative_row['worse']
-
-    return new_classification
+    assignments = _calculate_cut_points_assignments(
+        alternatives_flows, classification, np.array([cut_point]),
+        assign_to_better_class)
+    return pd.Series(assignments[:, 0], index=classification.index)
 
 
 def calculate_promsort_sorted_alternatives(
@@ -301,3 +304,69 @@ def calculate_promsort_sorted_alternatives(
         assign_to_better_class)
 
     return first_step_assignments, final_step_assignments
+
+
+def calculate_promsort_cut_points_assignments(
+        categories: List[str],
+        alternatives_flows: pd.DataFrame,
+        category_profiles_flows: pd.DataFrame,
+        criteria_thresholds: pd.Series,
+        category_profiles: pd.DataFrame,
+        criteria_directions: pd.Series,
+        cut_points: Union[List[NumericValue], np.ndarray],
+        assign_to_better_class: bool = True) -> \
+        Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    This function sorts alternatives to proper categories (based on
+    PromSort) for many cut points at once, e.g. to calibrate cut point.
+    First step is calculated once and final assignments of all cut points
+    are obtained in one pass.
+
+    :param categories: List with categories names as strings
+    :param alternatives_flows: pd.DataFrame with alternatives as
+    index and flows as columns named (positive and negative)
+    :param category_profiles_flows: pd.DataFrame with alternatives as
+    index and flows as columns named (positive and negative)
+    :param criteria_thresholds: pd.Series with criteria as index and
+    thresholds as values
+    :param category_profiles: pd.DataFrame with profiles as index and criteria
+    as columns
+    :param criteria_directions: pd.Series with criteria as index and
+    Direction as values
+    :param cut_points: 1D sequence or np.ndarray of NumericValues in range
+    <-1, 1> which define DM preference of classifying alternative to worse
+    or better class in final alternative assignment
+    :param assign_to_better_class: Boolean which describe preference of
+    the DM in final alternative assignment if total distance is equal
+    cut_point value.
+    :return: Tuple with pd.DataFrame with alternatives names as index and
+    assignments as columns named (worse and better) and pd.DataFrame with
+    alternatives names as index, cut points as columns and final
+    assignments as values
+    """
+    prom_sort_cut_points_validation(categories, alternatives_flows,
+                                    category_profiles_flows,
+                                    criteria_thresholds, category_profiles,
+                                    criteria_directions, cut_points,
+                                    assign_to_better_class)
+
+    category_profiles = pd.DataFrame(
+        directed_alternatives_performances(category_profiles,
+                                           criteria_directions),
+        index=category_profiles.columns, columns=category_profiles.columns)
+    check_if_profiles_are_strictly_worse(criteria_thresholds,
+                                         category_profiles)
+    first_step_assignments = _calculate_first_step_assignments(
+        categories,
+        alternatives_flows,
+        category_profiles_flows)
+
+    final_step_assignments = _calculate_cut_points_assignments(
+        alternatives_flows,
+        first_step_assignments,
+        np.array(cut_points, dtype=float),
+        assign_to_better_class)
+
+    return first_step_assignments, pd.DataFrame(
+        final_step_assignments, index=first_step_assignments.index,
+        columns=cut_points)
@@ -6,6 +6,7 @@
     :cite:p:'FigueiraDeSmetBrans2004' and :cite:p:'ArazOzkarahan2007'.
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
 from core.promethee_flow import compute_single_criterion_net_flows
@@ -13,6 +14,9 @@ from core.input_validation import promethee_tri_validation
 
 __all__ = ["calculate_prometheetri_sorted_alternatives"]
 
+# Maximal number of differences of net flows kept in memory at once
+_DEVIATIONS_CHUNK_SIZE = 2 ** 22
+
 
 def _calculate_criteria_net_flows(
         alternatives_partial_preferences: Tuple[pd.DataFrame, pd.DataFrame],
@@ -46,7 +50,9 @@ def _calculate_deviations(alternatives: List[str],
                           alternatives_criteria_net_flows: pd.DataFrame,
                           use_marginal_value: bool = True) -> pd.DataFrame:
     """
-    This function calculates deviation for each alternative and each profile.
+    This function calculates deviation for each alternative and each profile
+    as weighted sum of differences of single criterion net flows, broadcast
+    over all pairs at once.
 
     :param alternatives: List with alternatives names as strings
     :param criteria_weights: Series with weights of each criterion
@@ -60,22 +66,27 @@ def _calculate_deviations(alternatives: List[str],
     :return: pd.DataFrame with alternatives as index and profiles as columns
     """
 
-    deviations = pd.DataFrame(columns=profiles_criteria_net_flows.index,
-                              index=alternatives, dtype=float)
-
-    for alternative, alternative_row in \
-            alternatives_criteria_net_flows.iterrows():
-        for profile, profile_row in profiles_criteria_net_flows.iterrows():
-            # Check if deviations should be calculated as absolute values
-            if use_marginal_value:
-                deviations.loc[alternative, profile] = (
-                        criteria_weights *
-                        abs(alternative_row - profile_row)).sum()
-            else:
-                deviations.loc[alternative, profile] = (criteria_weights * (
-                        alternative_row - profile_row)).sum()
-
-    return deviations
+    criteria = alternatives_criteria_net_flows.columns
+    weights = criteria_weights.reindex(criteria).fillna(0).to_numpy()
+    alternatives_flows = alternatives_criteria_net_flows.loc[
+        alternatives].to_numpy(dtype=float)
+    profiles_flows = profiles_criteria_net_flows[criteria].to_numpy(
+        dtype=float)
+
+    deviations = np.empty((len(alternatives), len(profiles_flows)))
+    chunk = max(1, _DEVIATIONS_CHUNK_SIZE // max(1, profiles_flows.size))
+    for start in range(0, len(alternatives), chunk):
+        # Differences of single criterion net flows (alternatives x profiles
+        # x criteria)
+        differences = alternatives_flows[start:start + chunk, np.newaxis] - \
+            profiles_flows
+        # Check if deviations should be calculated as absolute values
+        if use_marginal_value:
+            differences = np.abs(differences)
+        deviations[start:start + chunk] = (differences * weights).sum(axis=2)
+
+    return pd.DataFrame(deviations, index=alternatives,
+                        columns=profiles_criteria_net_flows.index)
 
 
 def _assign_alternatives_to_classes_with_minimal_deviation(
@@ -96,15 +107,16 @@ def _assign_alternatives_to_classes_with_minimal_deviation(
 
     :return: pd.Series with assignments as values
     """
-    classification = pd.Series(index=alternatives, dtype=str)
-    for alternative, alternative_row in deviations.iterrows():
-        if assign_to_better_class:
-            classification[alternative] = categories[alternative_row.argmin()]
-        else:
-            classification[alternative] = categories[
-                alternative_row[::-1].argmin()]
-
-    return classification
+    deviations = deviations.to_numpy()
+    if assign_to_better_class:
+        positions = deviations.argmin(axis=1)
+    else:
+        # the last of minimal deviations
+        positions = len(categories) - 1 - \
+            deviations[:, ::-1].argmin(axis=1)
+
+    categories = np.array(categories, dtype=object)
+    return pd.Series(categories[positions], index=alternatives)
 
 
 def calculate_prometheetri_sorted_alternatives(
@@ -6,8 +6,9 @@
     :cite:p:'NemeryLamboray2007'.
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Hashable
+from typing import List, Tuple
 from core.enums import CompareProfiles
 from core.preference_commons import directed_alternatives_performances
 from core.promethee_check_dominance import check_dominance_condition
@@ -16,31 +17,67 @@ from core.input_validation import flow_sort_i_validation
 __all__ = ["calculate_flowsortI_sorted_alternatives"]
 
 
-def _append_to_classification(
-        categories: List[str], classification: pd.DataFrame,
-        pessimistic_category: str,
-        optimistic_category: str, alternative_name: Hashable) -> None:
+def _classification(categories: List[str], alternatives: pd.Index,
+                    positive_categories: np.ndarray,
+                    negative_categories: np.ndarray) -> pd.DataFrame:
     """
-    This function assign alternatives to correctly class.
+    This function assigns all alternatives to classes at once. Worse class is
+    the lower of the categories chosen by positive and negative flow, better
+    class is the higher one. Alternatives with category index out of range
+    are left unassigned.
 
     :param categories: List with categories names as strings
-    :param classification: pd.DataFrame with alternatives as index and
-    assignments as columns named (worse and better)
-    :param pessimistic_category: str that determines category names chosen of
-    negative flow
-    :param optimistic_category: str that determines category name chosen of
-    positive flow
-    :param alternative_name: Hashable that determines the alternative name
-    assigned to the category
+    :param alternatives: pd.Index with alternatives
+    :param positive_categories: np.ndarray with indices of categories chosen
+    by positive flows
+    :param negative_categories: np.ndarray with indices of categories chosen
+    by negative flows
+
+    :return: pd.DataFrame with alternatives as index and assignments as
+    columns named (worse and better)
+    """
+    classification = pd.DataFrame(index=alternatives,
+                                  columns=['worse', 'better'], dtype=str)
+
+    assigned = (positive_categories >= 0) & \
+               (positive_categories < len(categories)) & \
+               (negative_categories >= 0) & \
+               (negative_categories < len(categories))
+    names = np.array(categories, dtype=object)
+    worse = np.minimum(positive_categories, negative_categories)[assigned]
+    better = np.maximum(positive_categories, negative_categories)[assigned]
+    classification.loc[assigned, 'worse'] = names[worse]
+    classification.loc[assigned, 'better'] = names[better]
+
+    return classification
+
+
+def _threshold_categories(alternatives_flows: pd.DataFrame,
+                          positive_thresholds: np.ndarray,
+                          negative_thresholds: np.ndarray
+                          ) -> Tuple[np.ndarray, np.ndarray]:
     """
-    pessimistic_category_index = categories.index(pessimistic_category)
-    optimistic_category_index = categories.index(optimistic_category)
-    if pessimistic_category_index > optimistic_category_index:
-        pessimistic_category, optimistic_category = optimistic_category, \
-                                                    pessimistic_category
+    This function finds for every alternative the index of the first
+    threshold not lower than its positive flow and the index of the first
+    threshold lower than its negative flow. Positive thresholds must be
+    non-decreasing and negative thresholds non-increasing, which holds for
+    flows of profiles dominating each other.
+
+    :param alternatives_flows: pd.DataFrame with alternatives as
+    index and flows as columns named (positive and negative)
+    :param positive_thresholds: np.ndarray with thresholds of positive flows
+    :param negative_thresholds: np.ndarray with thresholds of negative flows
 
-    classification.loc[alternative_name, 'worse'] = pessimistic_category
-    classification.loc[alternative_name, 'better'] = optimistic_category
+    :return: Tuple with np.ndarray of indices found by positive flows and
+    np.ndarray of indices found by negative flows
+    """
+    positive_categories = np.searchsorted(
+        positive_thresholds, alternatives_flows['positive'].to_numpy(),
+        side='left')
+    negative_categories = np.searchsorted(
+        -negative_thresholds, -alternatives_flows['negative'].to_numpy(),
+        side='right')
+    return positive_categories, negative_categories
 
 
 def _limiting_profiles_sorting(categories: List[str],
@@ -60,34 +97,15 @@ def _limiting_profiles_sorting(categories: List[str],
     :return: pd.DataFrame with alternatives as index and assignments as
     columns named (worse and better)
     """
+    positive_categories, negative_categories = _threshold_categories(
+        alternatives_flows, category_profiles_flows['positive'].to_numpy(),
+        category_profiles_flows['negative'].to_numpy())
 
-    classification = pd.DataFrame(index=alternatives_flows.index,
-                                  columns=['worse', 'better'], dtype=str)
-
-    for alternative, alternative_row in alternatives_flows.iterrows():
-        positive_flow_category = ''
-        negative_flow_category = ''
-        for i, (category, category_row) in enumerate(
-                category_profiles_flows.iterrows()):
-            if not positive_flow_category:
-                if i != len(category_profiles_flows) - 1:
-                    if category_row['positive'] < alternative_row[
-                        'positive'] <= category_profiles_flows.iloc[i + 1][
-                         'positive']:
-                        positive_flow_category = categories[i]
-            if not negative_flow_category:
-                if i != len(category_profiles_flows) - 1:
-                    if category_row['negative'] >= \
-                            alternative_row['negative'] \
-                            > category_profiles_flows.iloc[i + 1]['negative']:
-                        negative_flow_category = categories[i]
-            if positive_flow_category and negative_flow_category:
-                _append_to_classification(categories, classification,
-                                          negative_flow_category,
-                                          positive_flow_category, alternative)
-                break
-
-    return classification
+    # Category lies between two consecutive limiting profiles
+    n_categories = min(len(categories), len(category_profiles_flows) - 1)
+    return _classification(categories[:n_categories],
+                           alternatives_flows.index,
+                           positive_categories - 1, negative_categories - 1)
 
 
 def _boundary_profiles_sorting(categories: List[str],
@@ -110,49 +128,15 @@ def _boundary_profiles_sorting(categories: List[str],
     :return: pd.DataFrame with alternatives as index and assignments as
     columns named (worse and better)
     """
-    classification = pd.DataFrame(index=alternatives_flows.index,
-                                  columns=['worse', 'better'], dtype=str)
-
-    for alternative, alternative_row in alternatives_flows.iterrows():
-        positive_flow_category = ''
-        negative_flow_category = ''
-        for i, (category, category_row) in enumerate(
-                category_profiles_flows.iterrows()):
-            if not positive_flow_category:
-                if i == 0:
-                    if alternative_row['positive'] <= category_row[
-                         'positive']:
-                        positive_flow_category = categories[i]
-                elif i == category_profiles.shape[0] - 1:
-                    if alternative_row['positive'] > \
-                            category_profiles_flows.iloc[i - 1]['positive']:
-                        positive_flow_category = categories[i]
-                else:
-                    if category_profiles_flows.iloc[i - 1]['positive'] < \
-                            alternative_row['positive'] <= category_row[
-                         'positive']:
-                        positive_flow_category = categories[i]
-            if not negative_flow_category:
-                if i == 0:
-                    if alternative_row['negative'] > category_row['negative']:
-                        negative_flow_category = categories[i]
-                elif i == len(category_profiles) - 1:
-                    if alternative_row['negative'] <= \
-                            category_profiles_flows.iloc[i - 1]['negative']:
-                        negative_flow_category = categories[i]
-                else:
-                    if category_profiles_flows.iloc[i - 1]['negative'] >= \
-                            alternative_row['negative'] > category_row[
-                         'negative']:
-                        negative_flow_category = categories[i]
-            if positive_flow_category and negative_flow_category:
-                _append_to_classification(categories, classification,
-                                          negative_flow_category,
-                                          positive_flow_category,
-                                          alternative)
-                break
+    # The last category is above the last but one boundary profile
+    n_thresholds = category_profiles.shape[0] - 1
+    positive_categories, negative_categories = _threshold_categories(
+        alternatives_flows,
+        category_profiles_flows['positive'].to_numpy()[:n_thresholds],
+        category_profiles_flows['negative'].to_numpy()[:n_thresholds])
 
-    return classification
+    return _classification(categories, alternatives_flows.index,
+                           positive_categories, negative_categories)
 
 
 def _central_profiles_sorting(categories: List[str],
@@ -175,61 +159,17 @@ def _central_profiles_sorting(categories: List[str],
     :return: pd.DataFrame with alternatives as index and assignments as
     columns named (worse and better)
     """
-    classification = pd.DataFrame(index=alternatives_flows.index,
-                                  columns=['worse', 'better'], dtype=str)
-
-    for alternative, alternative_row in alternatives_flows.iterrows():
-        positive_flow_category = ''
-        negative_flow_category = ''
-        for i, (category, category_row) in enumerate(
-                category_profiles_flows.iterrows()):
-            if not positive_flow_category:
-                if i == 0:
-                    if alternative_row['positive'] <= \
-                            (category_row['positive'] +
-                             category_profiles_flows.iloc[i + 1][
-                                 'positive']) / 2:
-                        positive_flow_category = categories[i]
-                elif i == len(category_profiles) - 1:
-                    if (category_profiles_flows.iloc[i - 1]['positive'] +
-                        category_row['positive']) / 2 < \
-                            alternative_row['positive']:
-                        positive_flow_category = categories[i]
-                else:
-                    if (category_profiles_flows.iloc[i - 1]['positive'] +
-                        category_row['positive']) / 2 < \
-                            alternative_row['positive'] <= \
-                            (category_row['positive'] +
-                             category_profiles_flows.iloc[i + 1][
-                                 'positive']) / 2:
-                        positive_flow_category = categories[i]
-            if not negative_flow_category:
-                if i == 0:
-                    if alternative_row['negative'] > \
-                            (category_row['negative'] +
-                             category_profiles_flows.iloc[i + 1][
-                                 'negative']) / 2:
-                        negative_flow_category = categories[i]
-                elif i == len(category_profiles) - 1:
-                    if (category_profiles_flows.iloc[i - 1]['negative'] +
-                        category_row['negative']) / 2 >= \
-                            alternative_row['negative']:
-                        negative_flow_category = categories[i]
-                else:
-                    if (category_profiles_flows.iloc[i - 1]['negative'] +
-                        category_row['negative']) / 2 >= \
-                            alternative_row['negative'] > \
-                            (category_row['negative'] +
-                             category_profiles_flows.iloc[i + 1][
-                                 'negative']) / 2:
-                        negative_flow_category = categories[i]
-            if positive_flow_category and negative_flow_category:
-                _append_to_classification(categories, classification,
-                                          negative_flow_category,
-                                          positive_flow_category,
-                                          alternative)
-                break
-    return classification
+    # Categories are separated by midpoints between central profiles
+    n_profiles = category_profiles.shape[0]
+    positive_flows = category_profiles_flows['positive'].to_numpy()
+    negative_flows = category_profiles_flows['negative'].to_numpy()
+    positive_categories, negative_categories = _threshold_categories(
+        alternatives_flows,
+        (positive_flows[:n_profiles - 1] + positive_flows[1:n_profiles]) / 2,
+        (negative_flows[:n_profiles - 1] + negative_flows[1:n_profiles]) / 2)
+
+    return _classification(categories, alternatives_flows.index,
+                           positive_categories, negative_categories)
 
 
 def calculate_flowsortI_sorted_alternatives(
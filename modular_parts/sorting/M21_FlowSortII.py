@@ -5,8 +5,9 @@
     Implementation and naming convention are taken from the
     :cite:p:'NemeryLamboray2007'
 """
+import numpy as np
 import pandas as pd
-from typing import List
+from typing import List, Tuple
 from core.enums import CompareProfiles
 from core.input_validation import flow_sort_ii_validation
 from core.promethee_check_dominance import check_dominance_condition
@@ -14,127 +15,114 @@ from core.promethee_check_dominance import check_dominance_condition
 __all__ = ["calculate_flowsortII_sorted_alternatives"]
 
 
-def _limiting_profiles_sorting(alternative: str,
-                               alternative_flows: pd.Series,
-                               profiles_flows: pd.Series,
-                               categories: List[str],
-                               flow_type: str,
-                               classification: pd.DataFrame):
+# Signs making "profile is not worse than alternative" a <= comparison
+# for positive, negative and net flow
+_FLOW_SIGNS = np.array([1, -1, 1])
+
+
+def _profile_based_layout(prometheeII_flows: pd.DataFrame
+                          ) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
     """
-    Assign alternative to the category based on the limiting profiles.
+    Reshape profile-based flows into arrays. Groups are ordered by their
+    names and every group consists of profiles followed by alternative.
 
-    :param alternative: str, alternative name
-    :param alternative_flows: pd.Series with alternative as index
-    and flows as values
-    :param profiles_flows: pd.Series with profiles as index and
-    flows as values
-    :param categories: List with categories names as strings
-    :param flow_type: str, flow type ('positive', 'negative' or 'net')
-    :param classification: pd.DataFrame with alternatives as index and
-    'positive', 'negative' and 'net' as columns. This object is modified by
-    adding new assignment.
+    :param prometheeII_flows: pd.DataFrame with
+    MultiIndex("R" + alternatives, profiles + alternative) as index and
+    'positive', 'negative' and 'net' columns
+    :return: Tuple with pd.Index of alternatives, 2D np.ndarray with
+    alternatives flows (alternatives x flow types) and 3D np.ndarray with
+    profiles flows (alternatives x profiles x flow types). Negative flows
+    are negated.
+    """
+    codes, groups = pd.factorize(
+        prometheeII_flows.index.get_level_values(0), sort=True)
+    order = np.argsort(codes, kind='stable')
+    flows = prometheeII_flows.to_numpy(dtype=float)[order] * _FLOW_SIGNS
+    flows = flows.reshape(len(groups), -1, flows.shape[1])
+
+    alternatives = pd.Index([Ralternative[1:] for Ralternative in groups])
+    return alternatives, flows[:, -1], flows[:, :-1]
+
+
+def _first_not_worse_profile(alternatives_flows: np.ndarray,
+                             profiles_flows: np.ndarray
+                             ) -> Tuple[np.ndarray, np.ndarray]:
     """
+    Find for every alternative and flow type the first profile which is not
+    worse than the alternative.
+
+    :param alternatives_flows: 2D np.ndarray with alternatives flows
+    (alternatives x flow types)
+    :param profiles_flows: 3D np.ndarray with profiles flows
+    (alternatives x profiles x flow types)
+    :return: Tuple with 2D np.ndarray of profiles positions and 2D
+    np.ndarray of bools, False if there is no such profile
+    """
+    not_worse = alternatives_flows[:, np.newaxis, :] <= profiles_flows
+    return not_worse.argmax(axis=1), not_worse.any(axis=1)
+
 
-    # Iterate over profiles flows until the first profile with better
-    # flow is found
-    for i, (profile, profile_flows) in enumerate(profiles_flows.iterrows()):
-        if (alternative_flows[flow_type] <= profile_flows[flow_type] and
-            flow_type in ['positive', 'net']) or \
-                (alternative_flows[flow_type] >= profile_flows[flow_type] and
-                 flow_type == 'negative'):
-            # Edge case: if the first profile is better than the alternative
-            if i == 0:
-                classification.loc[alternative, flow_type] = "Under limit"
-            else:
-                classification.loc[alternative, flow_type] = \
-                    categories[i - 1]
-            break
-        # Edge case: if the alternative is better than the last profile
-        elif i == (len(profiles_flows) - 1):
-            classification.loc[alternative, flow_type] = "Over limit"
-
-
-def _boundary_profiles_sorting(alternative: str,
-                               alternative_flows: pd.Series,
-                               profiles_flows: pd.Series,
-                               categories: List[str], flow_type: str,
-                               classification: pd.DataFrame):
+def _limiting_profiles_sorting(alternatives_flows: np.ndarray,
+                               profiles_flows: np.ndarray,
+                               categories: List[str]) -> np.ndarray:
     """
-    Assign alternative to the category based on the boundary profiles.
+    Assign alternatives to the categories based on the limiting profiles.
 
-    :param alternative: str, alternative name
-    :param alternative_flows: pd.Series with alternative as index
-    and flows as values
-    :param profiles_flows: pd.Series with profiles as index and
-    flows as values
+    :param alternatives_flows: 2D np.ndarray with alternatives flows
+    (alternatives x flow types)
+    :param profiles_flows: 3D np.ndarray with profiles flows
+    (alternatives x profiles x flow types)
     :param categories: List with categories names as strings
-    :param flow_type: str, flow type ('positive', 'negative' or 'net')
-    :param classification: pd.DataFrame with alternatives as index and
-    'positive', 'negative' and 'net' as columns. This object is modified by
-    adding new assignment.
+    :return: 2D np.ndarray with categories names (alternatives x flow types)
     """
+    first, found = _first_not_worse_profile(alternatives_flows,
+                                            profiles_flows)
+
+    # Edge cases: the first profile is better than the alternative or the
+    # alternative is better than the last profile
+    labels = np.array(["Under limit"] + list(categories) + ["Over limit"],
+                      dtype=object)
+    return labels[np.where(found, first, len(categories) + 1)]
 
-    # Iterate over profiles flows until the first profile
-    # with better flow is found
-    for i, (profile, profile_flows) in enumerate(profiles_flows.iterrows()):
-        if (alternative_flows[flow_type] <= profile_flows[flow_type] and
-            flow_type in ['positive', 'net']) or \
-                (alternative_flows[flow_type] >= profile_flows[flow_type] and
-                 flow_type == 'negative'):
-            classification.loc[alternative, flow_type] = categories[i]
-            break
-        # Edge case: if the alternative is better than the last profile
-        elif i == (len(profiles_flows) - 1):
-            classification.loc[alternative, flow_type] = categories[-1]
-
-
-def _central_profiles_sorting(alternative: str,
-                              alternative_flows: pd.Series,
-                              profiles_flows: pd.Series,
-                              categories: List[str],
-                              flow_type: str,
-                              classification: pd.DataFrame):
+
+def _boundary_profiles_sorting(alternatives_flows: np.ndarray,
+                               profiles_flows: np.ndarray,
+                               categories: List[str]) -> np.ndarray:
     """
-    Assign alternative to the category based on the central profiles.
+    Assign alternatives to the categories based on the boundary profiles.
 
-    :param alternative: str, alternative name
-    :param alternative_flows: pd.Series with alternative as index
-    and flows as values
-    :param profiles_flows: pd.Series with profiles as index and
-    flows as values
+    :param alternatives_flows: 2D np.ndarray with alternatives flows
+    (alternatives x flow types)
+    :param profiles_flows: 3D np.ndarray with profiles flows
+    (alternatives x profiles x flow types)
     :param categories: List with categories names as strings
-    :param flow_type: str, flow type ('positive', 'negative' or 'net')
-    :param classification: pd.DataFrame with alternatives as index and
-    'positive', 'negative' and 'net' as columns. This object is modified by
-    adding new assignment.
+    :return: 2D np.ndarray with categories names (alternatives x flow types)
+    """
+    first, found = _first_not_worse_profile(alternatives_flows,
+                                            profiles_flows)
+
+    # Edge case: the alternative is better than the last profile
+    labels = np.array(categories, dtype=object)
+    return labels[np.where(found, first, len(categories) - 1)]
+
+
+def _central_profiles_sorting(alternatives_flows: np.ndarray,
+                              profiles_flows: np.ndarray,
+                              categories: List[str]) -> np.ndarray:
     """
+    Assign alternatives to the categories based on the central profiles.
+    Categories are separated by means of flows of consecutive profiles.
 
-    # Iterate over profiles flows until the first profile with better mean
-    # with the next profile is found
-    for i, (profile, profile_flows) in enumerate(profiles_flows.iterrows()):
-        # Edge case: last alternative is better than last profile
-        if i == (len(profiles_flows) - 1):
-            if (alternative_flows[flow_type] >
-                (profile_flows[flow_type] +
-                 profiles_flows.iloc[i - 1][flow_type]) / 2 and
-                flow_type in ['positive', 'net']) or \
-                    (alternative_flows[flow_type] <
-                     (profile_flows[flow_type] +
-                      profiles_flows.iloc[i - 1][flow_type]) / 2 and
-                     flow_type == 'negative'):
-                classification.loc[alternative, flow_type] = categories[i]
-            classification.loc[alternative, flow_type] = categories[-1]
-        else:
-            if (alternative_flows[flow_type] <=
-                (profile_flows[flow_type] +
-                 profiles_flows.iloc[i + 1][flow_type]) / 2 and
-                flow_type in ['positive', 'net']) or \
-                    (alternative_flows[flow_type] >=
-                     (profile_flows[flow_type] +
-                      profiles_flows.iloc[i + 1][flow_type]) / 2 and
-                     flow_type == 'negative'):
-                classification.loc[alternative, flow_type] = categories[i]
-                break
+    :param alternatives_flows: 2D np.ndarray with alternatives flows
+    (alternatives x flow types)
+    :param profiles_flows: 3D np.ndarray with profiles flows
+    (alternatives x profiles x flow types)
+    :param categories: List with categories names as strings
+    :return: 2D np.ndarray with categories names (alternatives x flow types)
+    """
+    midpoints_flows = (profiles_flows[:, :-1] + profiles_flows[:, 1:]) / 2
+    return _boundary_profiles_sorting(alternatives_flows, midpoints_flows,
+                                      categories)
 
 
 def calculate_flowsortII_sorted_alternatives(
@@ -172,34 +160,19 @@ def calculate_flowsortII_sorted_alternatives(
     check_dominance_condition(criteria_directions,
                               profiles_performances)
 
-    # Init classification structure
-    classification = pd.DataFrame(dtype=str,
-                                  columns=['positive', 'negative', 'net'])
-
-    # Iterate over flow groups (profiles + alternative)
-    for Ralternative, alternative_group_flows in \
-            prometheeII_flows.groupby(level=0):
-        # Get alternative name
-        alternative = Ralternative[1:]
-
-        # Separate profiles and alternative flows
-        profiles_flows = alternative_group_flows.iloc[:-1]
-        alternative_flows = alternative_group_flows.iloc[-1]
-
-        # Assign alternative to class using all types of flows
-        for flow_type in ['positive', 'negative', 'net']:
-            if comparison_with_profiles == CompareProfiles.LIMITING_PROFILES:
-                _limiting_profiles_sorting(alternative, alternative_flows,
-                                           profiles_flows, categories,
-                                           flow_type, classification)
-            elif comparison_with_profiles == \
-                    CompareProfiles.BOUNDARY_PROFILES:
-                _boundary_profiles_sorting(alternative, alternative_flows,
-                                           profiles_flows, categories,
-                                           flow_type, classification)
-            elif comparison_with_profiles == CompareProfiles.CENTRAL_PROFILES:
-                _central_profiles_sorting(alternative, alternative_flows,
-                                          profiles_flows, categories,
-                                          flow_type, classification)
-
-    return classification
+    alternatives, alternatives_flows, profiles_flows = \
+        _profile_based_layout(prometheeII_flows)
+
+    # Assign alternatives to classes using all types of flows at once
+    if comparison_with_profiles == CompareProfiles.LIMITING_PROFILES:
+        assignments = _limiting_profiles_sorting(
+            alternatives_flows, profiles_flows, categories)
+    elif comparison_with_profiles == CompareProfiles.BOUNDARY_PROFILES:
+        assignments = _boundary_profiles_sorting(
+            alternatives_flows, profiles_flows, categories)
+    else:
+        assignments = _central_profiles_sorting(
+            alternatives_flows, profiles_flows, categories)
+
+    return pd.DataFrame(assignments, index=alternatives,
+                        columns=['positive', 'negative', 'net'])
@@ -5,12 +5,10 @@
     Implementation and naming conventions are taken from
     :cite:p:'LoliiIshizakaGamberiniRiminiMessori2015'
 """
-import math
-
 import pandas as pd
 import numpy as np
 
-from typing import List, Tuple, Dict
+from typing import List, Tuple
 from core.enums import CompareProfiles
 from core.input_validation import flow_sort_gdss_validation
 from core.preference_commons import directed_alternatives_performances
@@ -19,172 +17,96 @@ from core.promethee_check_dominance import check_dominance_condition_GDSS
 __all__ = ["calculate_flowsort_gdss_sorted_alternatives"]
 
 
-def _classify_alternative(categories: List[str], classification: pd.DataFrame,
-                          not_classified: Dict[str, Dict[str, List[str]]],
-                          alternative_assignment: pd.Series):
+def _profiles_flows_layout(profiles: pd.Index,
+                           profiles_general_net_flows: pd.DataFrame
+                           ) -> Tuple[pd.Index, np.ndarray]:
+    """
+    Reshape profiles general net flows into array.
+
+    :param profiles: pd.Index with profiles names
+    :param profiles_general_net_flows: pd.DataFrame with
+    MultiIndex(DMs, profiles) as index and alternatives as columns
+
+    :return: Tuple with pd.Index of DMs and 3D np.ndarray with profiles
+    general net flows (DMs x profiles x alternatives)
     """
-    Classify imprecisely alternative to proper category. Used in first step of
-     assignment.
-
-    :param categories: List with categories names as strings
-    :param classification: pd.DataFrame with alternatives as index and 'worse'
-    and 'better' columns. Contains imprecise assignments of alternatives to
-    categories. Used to update imprecise assignments. This DataFrame is
-    modified in place.
-    :param not_classified: Dictionary with alternatives as keys and
-    Dictionary with 'worse_category_voters' and
-    'better_category_voters' as values. Contains alternatives which are not
-    precisely classified yet and list of DMs who voted on particular category.
-    Used to update not_classified. This Dictionary is modified in place.
-    :param alternative_assignment: pd.Series with DMs as index and
-    assignments of the current alternative as values. It contains assignment
-    name as name of pd.Series.
+    dms_codes, dms = pd.factorize(
+        profiles_general_net_flows.index.get_level_values(0), sort=True)
+    profiles_codes = profiles.get_indexer(
+        profiles_general_net_flows.index.get_level_values(1))
+
+    flows = np.full((len(dms), len(profiles),
+                      profiles_general_net_flows.shape[1]), np.nan)
+    flows[dms_codes, profiles_codes] = profiles_general_net_flows.to_numpy(
+        dtype=float)
+    return pd.Index(dms), flows
+
+
+def _calculate_votes(alternatives_general_net_flows: np.ndarray,
+                     profiles_flows: np.ndarray,
+                     categories: List[str],
+                     comparison_with_profiles: CompareProfiles
+                     ) -> np.ndarray:
     """
+    Calculate assignment of each alternative by each DM.
 
-    # Get if all assignments are the same
-    if alternative_assignment.nunique() > 1:
-        # Case when assignments are different
-
-        # Specify worse and better category
-        worse_category, better_category = sorted(
-            alternative_assignment.unique(),
-            key=lambda x: categories.index(x))
-
-        # Get DMs names who voted for worse and better category
-        DMs_that_chose_worse_category = alternative_assignment[
-            alternative_assignment == worse_category].index
-        DMs_that_chose_better_category = alternative_assignment[
-            alternative_assignment == better_category].index
-
-        # Update not_classified dictionary
-        not_classified[str(alternative_assignment.name)] = {
-            'worse_category_voters': DMs_that_chose_worse_category,
-            'better_category_voters': DMs_that_chose_better_category}
-
-        # Update classification DataFrame
-        classification.loc[
-            alternative_assignment.name, 'worse'] = worse_category
-        classification.loc[
-            alternative_assignment.name, 'better'] = better_category
-    else:
-        # Case when assignments are the same
+    :param alternatives_general_net_flows: np.ndarray with alternatives
+    general net flows
+    :param profiles_flows: 3D np.ndarray with profiles general net flows
+    (DMs x profiles x alternatives)
+    :param categories: List of categories names as strings
+    :param comparison_with_profiles: CompareProfiles enum. Indicates if
+    type of profiles used in sorting (boundary or central)
 
-        # Update classification DataFrame by adding alternative with
-        # the same worse and better category (precise assignment)
-        classification.loc[alternative_assignment.name, 'worse'] = \
-            alternative_assignment.unique()[0]
-        classification.loc[alternative_assignment.name, 'better'] = \
-            alternative_assignment.unique()[0]
+    :return: 2D np.ndarray with indices of categories (DMs x alternatives)
+    """
+
+    # Case when soring is done with boundary profiles
+    # Main idea is to find the first profile with not lower flow
+    if comparison_with_profiles == CompareProfiles.BOUNDARY_PROFILES:
+        not_worse = alternatives_general_net_flows <= profiles_flows
+        # Edge case when all profiles flows are lower than alternative flow
+        return np.where(not_worse.any(axis=1), not_worse.argmax(axis=1),
+                        len(categories) - 1)
+    # Case when soring is done with central profiles
+    else:
+        # Get profile position, which is closest to alternative flow
+        return np.argmin(np.abs(profiles_flows -
+                                alternatives_general_net_flows), axis=1)
 
 
 def _calculate_first_step_assignments(
         alternatives: pd.Index,
-        dms: pd.Index,
-        alternatives_general_net_flows: pd.Series,
-        profiles: pd.Index,
-        profiles_general_net_flows: pd.DataFrame,
-        categories: List[str],
-        comparison_with_profiles: CompareProfiles
-) -> Tuple[pd.DataFrame, Dict[str, Dict[str, List[str]]]]:
+        votes: np.ndarray,
+        categories: List[str]) -> pd.DataFrame:
     """
     Use first step of assignment of FlowSort GDSS method to classify
-    alternatives.
-    Calculate assignment of each DM for each alternative. If alternative
-    assignment is not unanimous adds this
-    alternative to not_classified (precisely) list.
+    alternatives. Alternative is classified precisely if assignments of all
+    DMs are unanimous, otherwise it is classified imprecisely between the
+    worst and the best category chosen by DMs.
 
     :param alternatives: pd.Index with alternatives names as strings
-    :param dms: pd.Index with DMs names as strings
-    :param alternatives_general_net_flows: pd.Series with alternatives as
-    index and alternatives general net flows as values
-    :param profiles: pd.Index with profiles names as strings
-    :param profiles_general_net_flows: pd.DataFrame with
-    MultiIndex(DMs, profiles) as index and alternatives as columns
+    :param votes: 2D np.ndarray with indices of categories chosen by DMs
+    (DMs x alternatives)
     :param categories: List of categories names as strings
-    :param comparison_with_profiles: CompareProfiles enum. Indicates if
-    type of profiles used in sorting (boundary or central)
 
-    :return: Tuple with pd.DataFrame with alternatives as index and
-    'worse' and 'better' columns and Dictionary with alternatives as keys
-    and Dictionary with 'worse_category_voters' and
-    'better_category_voters' as values. The DataFrame contains imprecise
-    assignments of alternatives to categories. The Dictionary contains
-    alternatives which are not precisely classified yet and list of DMs who
-    voted on particular category.
+    :return: pd.DataFrame with alternatives as index and 'worse' and
+    'better' columns. The DataFrame contains imprecise assignments of
+    alternatives to categories.
     """
+    categories = np.array(categories, dtype=object)
+    return pd.DataFrame({'worse': categories[votes.min(axis=0)],
+                         'better': categories[votes.max(axis=0)]},
+                        index=alternatives)
+
 
-    # Init classification DataFrame and not_classified Dictionary
-    classification = pd.DataFrame(index=alternatives,
-                                  columns=['worse', 'better'], dtype=str)
-    not_classified = {}
-
-    # Iterate over alternatives general net flows (rows) and profiles general
-    # net flows (columns) to get flow of current alternative and
-    # profiles flows which can be compared with current alternative
-    for (alternative, alternative_general_net_flow), \
-        (_, profiles_general_net_flows_for_alternative) in \
-            zip(alternatives_general_net_flows.items(),
-                profiles_general_net_flows.items()):
-
-        # Create Series with DMs as index and assignments of the current
-        # alternative as values
-        alternative_assignments = pd.Series(index=dms, dtype=str,
-                                            name=alternative)
-
-        # Iterate over DMs to obtain assignment of alternative by each DM
-        for DM, DM_profiles_general_net_flows_for_alternative in \
-                profiles_general_net_flows_for_alternative.groupby(level=0):
-
-            # Case when soring is done with boundary profiles
-            # Main idea is to compare flows until profile flow is greater
-            if comparison_with_profiles == CompareProfiles.BOUNDARY_PROFILES:
-                for profile_i, profile_net_flow in enumerate(
-                        DM_profiles_general_net_flows_for_alternative.values):
-
-                    # Edge case when first profile flow is
-                    # better than alternative flow
-                    if profile_i == 0 and alternative_general_net_flow <= \
-                            profile_net_flow:
-                        alternative_assignments[DM] = categories[0]
-                        break
-                    # Edge case when last profile flow is lower than
-                    # alternative flow
-                    elif profile_i == len(
-                            profiles) - 1 and alternative_general_net_flow > \
-                            profile_net_flow:
-                        alternative_assignments[DM] = categories[-1]
-                        break
-                    elif alternative_general_net_flow <= profile_net_flow:
-                        alternative_assignments[DM] = categories[profile_i]
-                        break
-            # Case when soring is done with central profiles
-            else:
-                # Get profile position, which is closest to alternative flow
-                category_pos = np.argmin(np.abs(
-                    DM_profiles_general_net_flows_for_alternative.values -
-                    alternative_general_net_flow))
-                alternative_assignments[DM] = categories[category_pos]
-
-        # Update the DataFrame classification and not_classified dictionary
-        # by analyzing the assignments of each DM
-        _classify_alternative(
-            categories,
-            classification,
-            not_classified,
-            alternative_assignments)
-
-    return classification, not_classified
-
-
-def _calculate_final_assignments(alternatives_general_net_flows: pd.Series,
-                                 profiles: pd.Index,
-                                 profiles_general_net_flows: pd.DataFrame,
+def _calculate_final_assignments(alternatives_general_net_flows: np.ndarray,
+                                 profiles_flows: np.ndarray,
+                                 votes: np.ndarray,
                                  categories: List[str],
-                                 dms_weights: pd.Series,
+                                 dms_weights: np.ndarray,
                                  comparison_with_profiles: CompareProfiles,
                                  classification: pd.DataFrame,
-                                 not_classified: Dict[str,
-                                                      Dict[str, List[str]]],
                                  assign_to_better_class: bool = True
                                  ) -> pd.Series:
     """
@@ -195,117 +117,88 @@ def _calculate_final_assignments(alternatives_general_net_flows: pd.Series,
     Then classifies alternative to category which has smaller distance
     to profile of that category.
      If distances are the same, alternative is classified by using
-     param 'assign_to_better_class'.
-
-    :param alternatives_general_net_flows: pd.Series with alternatives as
-    index and alternatives general net flows as values
-    :param profiles: pd.Index with profiles names
-    :param profiles_general_net_flows: pd.DataFrame with
-    MultiIndex(DMs, profiles) as index and alternatives as columns
+     param 'assign_to_better_class'. Distances of all imprecisely classified
+     alternatives are calculated at once.
+
+    :param alternatives_general_net_flows: np.ndarray with alternatives
+    general net flows
+    :param profiles_flows: 3D np.ndarray with profiles general net flows
+    (DMs x profiles x alternatives)
+    :param votes: 2D np.ndarray with indices of categories chosen by DMs
+    (DMs x alternatives)
     :param categories: List of categories names as strings
-    :param dms_weights: pd.Series with DMs as index and DMs weights as values
+    :param dms_weights: np.ndarray with DMs weights
     :param comparison_with_profiles: CompareProfiles enum. Indicates if
     type of profiles used in sorting (boundary or central)
     :param classification: pd.DataFrame with alternatives as index and
     'worse' and 'better' columns. Contains imprecise assignments of
     alternatives to categories.
-    :param not_classified: Dictionary with alternatives as keys
-    and Dictionary with 'worse_category_voters' and
-    'better_category_voters' as values. The Dictionary contains
-    alternatives which are not precisely classified yet and list of DMs who
-    voted on particular category.
     :param assign_to_better_class: bool. Indicates if alternative should be
     assigned to better category if distances to both categories are the same.
 
     :return: pd.Series with alternatives as index and final assignments as
     values.
     """
-
-    # Init final assignments as DataFrame
-    final_classification = classification.copy()
-
-    # Iterate over alternatives which are not classified yet
-    for alternative, voters in not_classified.items():
-
-        # Extract DMs who voted for worse and better category
-        worse_category_voters = voters['worse_category_voters']
-        better_category_voters = voters['better_category_voters']
-
-        # Get worse and better category names
-        worse_category = classification.loc[alternative, 'worse']
-        better_category = classification.loc[alternative, 'better']
-
-        # Get weights of DMs who voted for worse category
-        worse_category_voters_weights = \
-            dms_weights[worse_category_voters].unique()
-        # Get name of worse category profile
-        worse_category_profile = profiles[categories.index(worse_category)]
-
-        # Get net flows of DMs who voted for worse category of profile
-        # of worse category which are to be compared with alternative
-        worse_category_profiles_general_net_flows = \
-            profiles_general_net_flows.loc[
-                (worse_category_voters, worse_category_profile), alternative]
-
-        # Get weights of DMs who voted for better category
-        better_category_voters_weights = \
-            dms_weights[better_category_voters].unique()
-        # Get name of better category profile
-        better_category_profile = profiles[min(categories.index(
-            better_category), len(profiles) - 1)]
-        # Get net flows of DMs who voted for better category of profile
-        # of better category which are to be compared with alternative
-        better_category_profiles_general_net_flows = \
-            profiles_general_net_flows.loc[
-                (better_category_voters, better_category_profile),
-                alternative]
-
-        # Idea of precise sorting is to calculate 'distance' to worse and
-        # better category based on mentioned profiles flows and
-        # alternative flow
-
-        # Case when soring is done with boundary profiles
-        if comparison_with_profiles == CompareProfiles.BOUNDARY_PROFILES:
-            worse_category_distance = \
-                np.sum((alternatives_general_net_flows[alternative] -
-                        worse_category_profiles_general_net_flows) *
-                       worse_category_voters_weights)
-
-            better_category_distance = np.sum(
-                (better_category_profiles_general_net_flows -
-                 alternatives_general_net_flows[alternative]) *
-                better_category_voters_weights)
-        # Case when soring is done with central profiles
-        else:
-            worse_category_distance = np.sum(
-                abs(worse_category_profiles_general_net_flows -
-                    alternatives_general_net_flows[alternative]) *
-                worse_category_voters_weights)
-
-            better_category_distance = np.sum(
-                abs(better_category_profiles_general_net_flows -
-                    alternatives_general_net_flows[alternative]) *
-                better_category_voters_weights)
-
-        # Assign alternative to category which has smaller distance
-        # to profile of that category
-        # If distances are the same, alternative is classified by using
-        # param 'assign_to_better_class'
-        if math.isclose(worse_category_distance, better_category_distance,
-                        abs_tol=1e-6):
-            if assign_to_better_class:
-                final_classification.loc[alternative, 'final'] = \
-                    better_category
-            else:
-                final_classification.loc[alternative, 'final'] = \
-                    worse_category
-        elif better_category_distance > worse_category_distance:
-            final_classification.loc[alternative, 'better'] = worse_category
-        else:  # better_category_distance < worse_category_distance:
-            final_classification.loc[alternative, 'better'] = better_category
-
-    # Get final assignments
-    final_classification = final_classification['better']
+    worse_category = votes.min(axis=0)
+    better_category = votes.max(axis=0)
+    not_classified = np.flatnonzero(worse_category != better_category)
+
+    votes = votes[:, not_classified]
+    worse_category = worse_category[not_classified]
+    better_category = better_category[not_classified]
+    alternatives_flows = alternatives_general_net_flows[not_classified]
+
+    # Weights of DMs who voted for worse and better category
+    worse_category_voters_weights = \
+        (votes == worse_category) * dms_weights[:, np.newaxis]
+    better_category_voters_weights = \
+        (votes == better_category) * dms_weights[:, np.newaxis]
+
+    # Net flows of DMs profiles of worse and better category which are to be
+    # compared with alternative
+    worse_category_profiles_general_net_flows = profiles_flows[
+        :, worse_category, not_classified]
+    better_category_profiles_general_net_flows = profiles_flows[
+        :, np.minimum(better_category, profiles_flows.shape[1] - 1),
+        not_classified]
+
+    # Idea of precise sorting is to calculate 'distance' to worse and
+    # better category based on mentioned profiles flows and
+    # alternative flow
+
+    # Case when soring is done with boundary profiles
+    if comparison_with_profiles == CompareProfiles.BOUNDARY_PROFILES:
+        worse_category_distance = np.sum(
+            (alternatives_flows - worse_category_profiles_general_net_flows)
+            * worse_category_voters_weights, axis=0)
+        better_category_distance = np.sum(
+            (better_category_profiles_general_net_flows - alternatives_flows)
+            * better_category_voters_weights, axis=0)
+    # Case when soring is done with central profiles
+    else:
+        worse_category_distance = np.sum(
+            np.abs(worse_category_profiles_general_net_flows -
+                   alternatives_flows) * worse_category_voters_weights,
+            axis=0)
+        better_category_distance = np.sum(
+            np.abs(better_category_profiles_general_net_flows -
+                   alternatives_flows) * better_category_voters_weights,
+            axis=0)
+
+    # Assign alternative to category which has smaller distance
+    # to profile of that category
+    # If distances are the same, alternative is classified by using
+    # param 'assign_to_better_class'
+    ties = np.isclose(worse_category_distance, better_category_distance,
+                      rtol=0, atol=1e-6)
+    to_better = np.where(ties, assign_to_better_class,
+                         better_category_distance < worse_category_distance)
+
+    final_classification = classification['worse'].copy()
+    final_classification.name = 'better'
+    final_classification.iloc[not_classified] = np.array(
+        categories, dtype=object)[np.where(to_better, better_category,
+                                           worse_category)]
 
     return final_classification
 
@@ -353,10 +246,9 @@ def calculate_flowsort_gdss_sorted_alternatives(
                               dms_weights, comparison_with_profiles,
                               assign_to_better_class)
 
-    # Get alternatives, profiles and dms names
+    # Get alternatives and profiles names
     alternatives = alternatives_general_net_flows.index
     profiles = profiles_performances[0].index
-    dms = profiles_general_net_flows.index.get_level_values(0)
 
     # Multiply by -1 profiles performances on criteria which are
     # to be minimized. This is done to unify all criteria to be maximized.
@@ -368,20 +260,23 @@ def calculate_flowsort_gdss_sorted_alternatives(
     check_dominance_condition_GDSS(profiles, profiles_performances,
                                    criteria_directions)
 
+    dms, profiles_flows = _profiles_flows_layout(profiles,
+                                                 profiles_general_net_flows)
+    alternatives_flows = alternatives_general_net_flows.to_numpy(dtype=float)
+
+    # Calculate assignments of alternatives by all DMs
+    votes = _calculate_votes(alternatives_flows, profiles_flows, categories,
+                             comparison_with_profiles)
+
     # Calculate first classification (imprecise)
-    first_step_assignments, not_classified = \
-        _calculate_first_step_assignments(alternatives, dms,
-                                          alternatives_general_net_flows,
-                                          profiles,
-                                          profiles_general_net_flows,
-                                          categories,
-                                          comparison_with_profiles)
+    first_step_assignments = _calculate_first_step_assignments(
+        alternatives, votes, categories)
 
     # Calculate final classification (precise)
     final_step_assignments = _calculate_final_assignments(
-        alternatives_general_net_flows, profiles,
-        profiles_general_net_flows, categories, dms_weights,
+        alternatives_flows, profiles_flows, votes, categories,
+        dms_weights.reindex(dms).to_numpy(dtype=float),
         comparison_with_profiles, first_step_assignments,
-        not_classified, assign_to_better_class)
+        assign_to_better_class)
 
     return first_step_assignments, final_step_assignments
@@ -8,6 +8,7 @@
     Implementation and naming convention are taken from the
     :cite:p:'DamartDiasMousseau2007'
 """
+import numpy as np
 import pandas as pd
 from typing import List, Tuple
 from core.input_validation import group_class_acceptabilities_validation
@@ -31,24 +32,26 @@ def _calculate_votes(alternatives: pd.Index, categories: List[str],
     in each category
     """
 
-    # Create votes DataFrame with zeros
-    votes = pd.DataFrame([[0 for __ in categories] for _ in alternatives],
-                         index=alternatives,
-                         columns=categories)
+    # Stack assignments of all DMs
+    stacked_assignments = pd.concat(assignments)
+    rows = alternatives.get_indexer(stacked_assignments.index)
+    worse = pd.Index(categories).get_indexer(stacked_assignments['worse'])
+    better = pd.Index(categories).get_indexer(stacked_assignments['better'])
 
-    # Count votes
-    for DM_i, DM_assignments in enumerate(assignments):
-        for alternative, alternative_row in DM_assignments.iterrows():
-            # Handles precise assignments
-            if alternative_row['worse'] == alternative_row['better']:
-                votes.loc[alternative, alternative_row['worse']] += 1
-            # Handles imprecise assignments
-            else:
-                votes.loc[alternative,
-                          alternative_row['worse']:alternative_row['better']]\
-                    += 1
+    # Count votes as differences: +1 at the worse category and -1 after the
+    # better category, so cumulative sum over categories covers the whole
+    # range of imprecise assignment
+    valid = worse <= better
+    n_columns = len(categories) + 1
+    votes_differences = np.bincount(
+        np.concatenate([rows[valid] * n_columns + worse[valid],
+                        rows[valid] * n_columns + better[valid] + 1]),
+        weights=np.repeat([1, -1], valid.sum()),
+        minlength=len(alternatives) * n_columns)
+    votes = votes_differences.reshape(len(alternatives), n_columns).cumsum(
+        axis=1)[:, :-1].astype(np.int64)
 
-    return votes
+    return pd.DataFrame(votes, index=alternatives, columns=categories)
 
 
 def _calculate_alternatives_support(assignments: List[pd.DataFrame],
@@ -80,7 +83,8 @@ def _calculate_unimodal_alternatives_support(
         alternatives_support: pd.DataFrame) -> pd.DataFrame:
     """
     Calculates uni-modal alternatives support for each alternative
-     and category (percentage).
+     and category (percentage). Highest supports of worse and better
+     categories are taken from prefix and suffix cumulative maxima.
 
     :param alternatives_support: pd.DataFrame with alternatives as index
     and categories as columns. Contains for each alternative the percentage of
@@ -92,40 +96,20 @@ def _calculate_unimodal_alternatives_support(
 
     """
 
-    # Calculate unimodal alternatives support for single row of DataFrame
-    def unimodal_single_row(row: pd.Series) -> pd.Series:
-        """
-        Simple function with logic for calculating uni-modal support for
-        alternative.
-
-        :param row: pd.Series with categories as index and basic support
-        for alternative as values
-        :return: pd.Series with categories as index and uni-modal support
-        for alternative as values
-        """
-
-        # Get number of categories
-        row_len = len(row)
-
-        # Init uni-modal support row
-        unimodal_row = pd.Series([0 for _ in range(row_len)], index=row.index)
-
-        # Iterate over basic alternative support to detect specific cases
-        # and fix them
-        for i, (category, support) in enumerate(row.items()):
-            # Edge case - first or last category
-            if i == 0 or i == row_len - 1:
-                unimodal_row[category] = support
-            else:
-                unimodal_row[category] = max(support,
-                                             min(max(row.iloc[:i]),
-                                                 max(row.iloc[i + 1:])))
-        return unimodal_row
-
-    unimodal_alternatives_support = alternatives_support.apply(
-        unimodal_single_row, axis=1).astype(float)
-
-    return unimodal_alternatives_support
+    support = alternatives_support.to_numpy(dtype=float)
+    unimodal_support = support.copy()
+
+    # The highest support of categories worse (prefix) and better (suffix)
+    # than each category
+    prefix_max = np.maximum.accumulate(support, axis=1)
+    suffix_max = np.maximum.accumulate(support[:, ::-1], axis=1)[:, ::-1]
+
+    # Edge case - first and last category keep their support
+    unimodal_support[:, 1:-1] = np.maximum(
+        support[:, 1:-1], np.minimum(prefix_max[:, :-2], suffix_max[:, 2:]))
+
+    return pd.DataFrame(unimodal_support, index=alternatives_support.index,
+                        columns=alternatives_support.columns)
 
 
 def calculate_alternatives_support(categories: List[str],
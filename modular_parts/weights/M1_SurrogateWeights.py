@@ -7,19 +7,46 @@ The lowest rank is 1, and it represents the highest importance.
 Implementation and naming of conventions are taken from
 :cite:p:'SurrogateWeights' and :cite:p:'ROC'.
 """
-from core.aliases import NumericValue
-from core.enums import SurrogateMethod
-from typing import List
-from core.input_validation import surrogate_weights_validation
+import numpy as np
 import pandas as pd
+from core.enums import SurrogateMethod
+from core.input_validation import surrogate_weights_validation, \
+    surrogate_weights_batch_validation
 
-__all__ = ["surrogate_weights"]
+__all__ = ["surrogate_weights", "surrogate_weights_batch"]
+
+
+def _position_weights(n: int, method: SurrogateMethod) -> np.ndarray:
+    """
+    Calculates weights of consecutive positions (1, 2, ..., n) in the
+    ranking of criteria with chosen surrogate weights method.
+
+    :param n: number of criteria
+    :param method: chosen method of calculating weights
+    :return: np.ndarray with weights of positions
+    """
+    positions = np.arange(1, n + 1)
+    if method is SurrogateMethod.EW:
+        # all weights have the same value
+        return np.full(n, 1 / n)
+    if method is SurrogateMethod.RS:
+        # the more important the criterion is, the greater its weight
+        return 2 * (n + 1 - positions) / (n * (n + 1))
+    if method is SurrogateMethod.RR:
+        # reciprocals of ranks divided by the sum of these reciprocals
+        return (1 / positions) / (1 / positions).sum()
+    if method is SurrogateMethod.ROC:
+        # centroid of the simplex defined by ranking of the criteria
+        return np.cumsum((1 / positions)[::-1])[::-1] / n
+    raise TypeError("Method should be a SurrogateMethod Enum.")
 
 
 def surrogate_weights(criteria_ranks: pd.Series, method: SurrogateMethod,
                       decimal_place: int = 3) -> pd.Series:
     """
-    Calculates weights with chosen surrogate weights method.
+    Calculates weights with chosen surrogate weights method. Criteria are
+    ordered by their ranks and tied criteria get the average of weights of
+    positions they occupy (average ranks), so weights sum up to 1.
 
     :param criteria_ranks: Series with criteria as index and according ranks
      as values
@@ -28,115 +55,59 @@ def surrogate_weights(criteria_ranks: pd.Series, method: SurrogateMethod,
     :return: Series with criteria as index and according weights
      as values
     """
-
-    def _weight_order(rc: pd.Series, weights: List[NumericValue]
-                      ) -> pd.Series:
-        """
-        This method assigns weights to according criteria.
-
-        :param rc: Series with criteria as index and according ranks
-         as values
-        :param weights: list of calculated weights
-
-        :return: Series with criteria as index and according weights
-         as values
-        """
-        rank_summed = rc.replace([i + 1 for i in range(len(weights))],
-                                 weights)
-        return pd.Series(rank_summed.values, rank_summed.index,
-                         name="weights")
-
-    def equal_weights(rc: pd.Series, dp: NumericValue = 3) -> pd.Series:
-        """
-        In this method all weights are computed with the same value and sum
-        up to 1.
-
-        :param rc: Series with criteria as index and according ranks
-         as values
-        :param dp: the decimal place of the output numbers
-
-        :return: Series with criteria as index and according weights
-         as values
-        """
-        n = rc.size
-        weights = []
-        wi = round(1 / n, dp)
-        for i in range(1, n + 1):
-            weights.append(wi)
-        return pd.Series(weights, rc.index, name="weights")
-
-    def rank_sum(rc: pd.Series, dp: NumericValue = 3) -> pd.Series:
-        """
-        In this method the more important the criterion is, the greater
-        its weight.
-
-        :param rc: Series with criteria as index and according ranks
-         as values
-        :param dp: the decimal place of the output numbers
-
-        :return: Series with criteria as index and according weights
-         as values
-        """
-        n = rc.size
-        weights = []
-        for i in range(1, n + 1):
-            weights.append(round(2 * (n + 1 - i) / (n * (n + 1)), dp))
-        return _weight_order(rc, weights)
-
-    def reciprocal_of_ranks(rc: pd.Series, dp: NumericValue = 3) -> pd.Series:
-        """
-        This method computes weights by dividing each reciprocal of rank by
-        the sum of these reciprocals for all criteria.
-
-        :param rc: Series with criteria as index and according ranks
-         as values
-        :param dp: the decimal place of the output numbers
-
-        :return: Series with criteria as index and according weights
-         as values
-        """
-        n = rc.size
-        weights = []
-        sigma = 0
-        for j in range(1, n + 1):
-            sigma += 1 / j
-        for i in range(1, n + 1):
-            weights.append(round((1 / i) / sigma, dp))
-        return _weight_order(rc, weights)
-
-    def rank_order_centroid(rc: pd.Series, dp: NumericValue = 3) -> pd.Series:
-        """
-        The weights in this method reflect the centroid of the simplex
-        defined by ranking of the criteria.
-
-        :param rc: Series with criteria as index and according ranks
-         as values
-        :param dp: the decimal place of the output numbers
-
-        :return: Series with criteria as index and according weights
-         as values
-        """
-        n = rc.size
-        weights = []
-        for j in range(1, n + 1):
-            sigma = 0
-            for i in range(j, n + 1):
-                sigma += 1 / i
-            wi = round((1 / n) * sigma, dp)
-            weights.append(wi)
-        return _weight_order(rc, weights)
-
     # input data validation
     surrogate_weights_validation(criteria_ranks, decimal_place)
 
-    # choosing right method for calculations
-    if method is SurrogateMethod.EW:
-        return equal_weights(criteria_ranks, decimal_place)
-    if method is SurrogateMethod.RS:
-        return rank_sum(criteria_ranks, decimal_place)
-    if method is SurrogateMethod.RR:
-        return reciprocal_of_ranks(criteria_ranks, decimal_place)
-    if method is SurrogateMethod.ROC:
-        return rank_order_centroid(criteria_ranks, decimal_place)
-    else:
-        raise TypeError("Method should be a SurrogateMethod Enum.")
+    weights = surrogate_weights_batch(criteria_ranks.to_frame().T, method,
+                                      decimal_place)
+    return pd.Series(weights.iloc[0].to_numpy(), criteria_ranks.index,
+                     name="weights")
+
+
+def surrogate_weights_batch(criteria_ranks: pd.DataFrame,
+                            method: SurrogateMethod,
+                            decimal_place: int = 3) -> pd.DataFrame:
+    """
+    Calculates weights with chosen surrogate weights method for many
+    rankings of criteria (e.g. of many decision makers) at once. Tied
+    criteria share positions they occupy and get the average of weights of
+    these positions (average ranks), so weights of each ranking sum up
+    to 1. Rows of the result can be multiplied directly with single
+    criterion net flows to get net flows of every ranking.
+
+    :param criteria_ranks: DataFrame with rankings (e.g. DMs) as index,
+     criteria as columns and ranks as values
+    :param method: chosen method of calculating weights
+    :param decimal_place: the decimal place of the output numbers
+    :return: DataFrame with rankings as index, criteria as columns and
+     weights as values
+    """
+    # input data validation
+    surrogate_weights_batch_validation(criteria_ranks, decimal_place)
+
+    ranks = criteria_ranks.to_numpy()
+    m, n = ranks.shape
+    cumulative_weights = np.concatenate(
+        [[0], np.cumsum(_position_weights(n, method))])
+
+    order = np.argsort(ranks, axis=1, kind='stable')
+    sorted_ranks = np.take_along_axis(ranks, order, axis=1)
+    positions = np.broadcast_to(np.arange(n), (m, n))
+
+    # first and last position of group of tied criteria
+    new_group = np.ones((m, n), dtype=bool)
+    new_group[:, 1:] = sorted_ranks[:, 1:] != sorted_ranks[:, :-1]
+    starts = np.maximum.accumulate(np.where(new_group, positions, 0), axis=1)
+    group_end = np.ones((m, n), dtype=bool)
+    group_end[:, :-1] = new_group[:, 1:]
+    stops = np.minimum.accumulate(
+        np.where(group_end, positions, n - 1)[:, ::-1], axis=1)[:, ::-1] + 1
+
+    sorted_weights = (cumulative_weights[stops] -
+                      cumulative_weights[starts]) / (stops - starts)
+    weights = np.empty((m, n))
+    np.put_along_axis(weights, order, sorted_weights, axis=1)
+
+    return pd.DataFrame(np.round(weights, decimal_place),
+                        index=criteria_ranks.index,
+                        columns=criteria_ranks.columns)
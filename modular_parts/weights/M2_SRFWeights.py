@@ -6,11 +6,13 @@
     :cite:p:'FigueiraRoy2001'.
 """
 import math
+import numpy as np
 import pandas as pd
 
 from math import ceil, floor
 from core.aliases import NumericValue
 from core.input_validation import srf_weights_validation
+from core.weights_commons import srf_non_normalized_weights
 
 __all__ = ['calculate_srf_weights']
 
@@ -25,17 +27,12 @@ def _calculate_spaces_between_criteria_ranks(criteria_ranks: pd.Series
     :return: pd.Series with all criteria but last as index and amount of
     spaces between criteria ranks as values
     """
-    spaces_between_criteria_ranks = pd.Series(dtype=int)
-
     sorted_criteria_ranks = criteria_ranks.sort_values()
 
     # Calculate amount of spaces between criteria ranks by subtracting
     # the next pairs of ranks
-    for i, (criterion, rank) in enumerate(sorted_criteria_ranks[:-1].items()):
-        spaces_between_criteria_ranks[criterion] = \
-            sorted_criteria_ranks[i + 1] - rank
-
-    return spaces_between_criteria_ranks
+    return pd.Series(np.diff(sorted_criteria_ranks.to_numpy()),
+                     index=sorted_criteria_ranks.index[:-1])
 
 
 def _calculate_non_normalized_weights(criteria_ranks: pd.Series,
@@ -55,23 +52,17 @@ def _calculate_non_normalized_weights(criteria_ranks: pd.Series,
     :return: pd.Series with criteria as index and non-normalized weights
     as values
     """
-    non_normalized_weights = pd.Series(dtype=float)
+    sorted_criteria = criteria_ranks.sort_values().index
 
-    # Calculate cumulative sum of ranks (+1 for position)
-    cumulative_ranks = pd.Series(dtype=float)
-    for i, (criterion, rank) in enumerate(
-            criteria_ranks.sort_values().items()):
-        cumulative_ranks[criterion] = \
-            rank + sum((spaces_between_criteria_ranks + 1)[:i])
-
-    # Calculate non-normalized weights
-    for i, (criterion, rank) in enumerate(cumulative_ranks.items()):
-        non_normalized_weights[criterion] = \
-            round(1 + (criteria_weight_ratio - 1)
-                  * sum(spaces_between_criteria_ranks[:i]) /
-                  sum(spaces_between_criteria_ranks), 2)
+    # Position of every criterion is the sum of spaces before it
+    positions = np.concatenate(
+        [[0], np.cumsum(spaces_between_criteria_ranks.to_numpy())])
+    non_normalized_weights = srf_non_normalized_weights(
+        positions[np.newaxis, :], np.array([criteria_weight_ratio]))[0]
 
-    return non_normalized_weights
+    return pd.Series([round(weight, 2)
+                      for weight in non_normalized_weights.tolist()],
+                     index=sorted_criteria)
 
 
 def _normalize_weight_up_to_100(
@@ -0,0 +1,170 @@
+"""
+    This module performs stochastic multicriteria acceptability analysis
+    (SMAA) of Promethee II ranking. Weight vectors are sampled uniformly from
+    the space of weights consistent with the available information (no
+    information, ranking of criteria as in surrogate weights, where rank 1
+    is the most important, or ranking with the ratio of the most to the
+    least important criterion as in SRF method, where rank 1 is the least
+    important). Net flows are linear in weights, so for every chunk of samples
+    they are obtained as one product of weights and single criterion net
+    flows.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'SMAA2'.
+"""
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from core.aliases import NumericValue
+from core.input_validation import smaa_weights_validation, smaa_validation
+from core.weights_commons import rank_statistics
+
+__all__ = ["sample_smaa_weights", "calculate_smaa"]
+
+# Maximal number of net flows (samples x alternatives) kept in memory at once
+_FLOWS_CHUNK_SIZE = 2 ** 22
+
+
+def _weight_space_vertices(criteria: pd.Index,
+                           criteria_ranks: pd.Series = None,
+                           criteria_weight_ratio: NumericValue = None
+                           ) -> np.ndarray:
+    """
+    Calculates vertices of the space of feasible weights, which is
+    a simplex. Criteria with the same rank get equal weights. Weights
+    consistent with ranking are convex combinations of vectors with equal
+    weights of k most important groups of criteria. If the ratio z is given,
+    ranks follow SRF method (higher rank means more important criterion)
+    and vertices are vectors with weight z for k most important groups and
+    1 for the others.
+
+    :param criteria: pd.Index with criteria
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+     values (lower rank means more important criterion, unless the ratio is
+     given)
+    :param criteria_weight_ratio: ratio of the weight of the most important
+     criterion to the weight of the least important criterion
+    :return: 2D np.ndarray with vertices (normalized weights) in rows
+    """
+    if criteria_ranks is None:
+        return np.eye(len(criteria))
+
+    ranks = criteria_ranks.reindex(criteria).to_numpy()
+    groups = np.unique(ranks, return_inverse=True)[1]
+    n_groups = groups.max() + 1
+    if criteria_weight_ratio is not None:
+        # in SRF method the highest rank is the most important
+        groups = n_groups - 1 - groups
+    # vertex k includes k + 1 most important groups
+    included = np.arange(n_groups)[:, np.newaxis] >= groups[np.newaxis, :]
+    if criteria_weight_ratio is None:
+        vertices = included.astype(float)
+    else:
+        vertices = np.where(included[:-1], float(criteria_weight_ratio), 1.0)
+        vertices = np.concatenate([np.ones((1, len(criteria))), vertices])
+    return vertices / vertices.sum(axis=1, keepdims=True)
+
+
+def _sample_weights(vertices: np.ndarray, n_samples: int,
+                    generator: np.random.Generator) -> np.ndarray:
+    """
+    Samples weights uniformly from simplex with given vertices.
+
+    :param vertices: 2D np.ndarray with vertices in rows
+    :param n_samples: number of samples
+    :param generator: random numbers generator
+    :return: 2D np.ndarray with samples in rows
+    """
+    coefficients = generator.exponential(size=(n_samples, len(vertices)))
+    coefficients /= coefficients.sum(axis=1, keepdims=True)
+    return coefficients @ vertices
+
+
+def sample_smaa_weights(criteria: pd.Index, n_samples: int,
+                        criteria_ranks: pd.Series = None,
+                        criteria_weight_ratio: NumericValue = None,
+                        seed: int = None) -> pd.DataFrame:
+    """
+    Samples weight vectors uniformly from the space of weights consistent
+    with the ranking of criteria (and the ratio of the most to the least
+    important criterion, if given).
+
+    :param criteria: pd.Index with criteria
+    :param n_samples: number of samples
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+     values, if None all normalized weights are feasible. Rank 1 is the
+     most important criterion as in surrogate weights, or the least
+     important one as in SRF method if the ratio is given
+    :param criteria_weight_ratio: ratio of the weight of the most important
+     criterion to the weight of the least important criterion (as z in SRF
+     method)
+    :param seed: seed of random numbers generator
+    :return: pd.DataFrame with samples as index and criteria as columns
+    """
+    # input data validation
+    smaa_weights_validation(criteria, n_samples, criteria_ranks,
+                            criteria_weight_ratio)
+
+    vertices = _weight_space_vertices(pd.Index(criteria), criteria_ranks,
+                                      criteria_weight_ratio)
+    weights = _sample_weights(vertices, n_samples,
+                              np.random.default_rng(seed))
+    return pd.DataFrame(weights, columns=criteria)
+
+
+def calculate_smaa(single_criterion_net_flows: pd.DataFrame,
+                   n_samples: int = 10000, criteria_ranks: pd.Series = None,
+                   criteria_weight_ratio: NumericValue = None,
+                   seed: int = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calculates rank acceptability indices and central weights of
+    alternatives in Promethee II ranking. Samples are processed in chunks,
+    so memory does not depend on the number of samples.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+     index and criteria as columns
+    :param n_samples: number of sampled weight vectors
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+     values, if None all normalized weights are feasible. Rank 1 is the
+     most important criterion as in surrogate weights, or the least
+     important one as in SRF method if the ratio is given
+    :param criteria_weight_ratio: ratio of the weight of the most important
+     criterion to the weight of the least important criterion (as z in SRF
+     method)
+    :param seed: seed of random numbers generator
+    :return: Tuple of pd.DataFrame with rank acceptability indices
+     (alternatives as index, ranks as columns) and pd.DataFrame with
+     central weights (alternatives as index, criteria as columns, NaN if
+     alternative is never the best one)
+    """
+    # input data validation
+    smaa_validation(single_criterion_net_flows, n_samples, criteria_ranks,
+                    criteria_weight_ratio)
+
+    criteria = single_criterion_net_flows.columns
+    alternatives = single_criterion_net_flows.index
+    flows = single_criterion_net_flows.to_numpy(dtype=float).T
+    n, K = len(alternatives), len(criteria)
+    vertices = _weight_space_vertices(criteria, criteria_ranks,
+                                      criteria_weight_ratio)
+    generator = np.random.default_rng(seed)
+
+    rank_counts = np.zeros(n * n, dtype=np.int64)
+    weights_sums = np.zeros((n, K))
+    chunk = max(1, _FLOWS_CHUNK_SIZE // n)
+    for start in range(0, n_samples, chunk):
+        weights = _sample_weights(vertices, min(chunk, n_samples - start),
+                                  generator)
+        chunk_counts, chunk_sums = rank_statistics(weights, weights @ flows)
+        rank_counts += chunk_counts
+        weights_sums += chunk_sums
+
+    rank_counts = rank_counts.reshape(n, n)
+    acceptability = pd.DataFrame(rank_counts / n_samples, index=alternatives,
+                                 columns=np.arange(1, n + 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        central_weights = pd.DataFrame(
+            weights_sums / rank_counts[:, :1], index=alternatives,
+            columns=criteria)
+
+    return acceptability, central_weights
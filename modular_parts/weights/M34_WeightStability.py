@@ -0,0 +1,72 @@
+"""
+    This module computes stability intervals of criteria weights for
+    Promethee II ranking. When weight of one criterion changes, weights of
+    the other criteria are rescaled proportionally so that all weights still
+    sum up to 1. Net flows are then linear functions of the changed weight,
+    so the ranking changes exactly when two of these lines cross. The first
+    change of an order always involves two neighbouring alternatives, so
+    only crossings of adjacent alternatives have to be calculated.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'BransMareschal2005'.
+"""
+import numpy as np
+import pandas as pd
+from core.input_validation import weight_stability_validation
+
+__all__ = ["calculate_weight_stability_intervals"]
+
+
+def calculate_weight_stability_intervals(criteria_weights: pd.Series,
+                                         single_criterion_net_flows:
+                                         pd.DataFrame,
+                                         k: int = None) -> pd.DataFrame:
+    """
+    Calculates for every criterion the interval in which its weight can
+    change (with proportional rescaling of the other weights) without
+    changing Promethee II ranking or its k first positions.
+
+    :param criteria_weights: pd.Series with criteria as index and weights as
+     values
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+     index and criteria as columns
+    :param k: number of first positions of the ranking which should not
+     change, if None the whole ranking is considered
+    :return: pd.DataFrame with criteria as index and 'weight', 'lower' and
+     'upper' columns (normalized weights)
+    """
+    # input data validation
+    weight_stability_validation(criteria_weights, single_criterion_net_flows,
+                                k)
+
+    criteria = single_criterion_net_flows.columns
+    weights = criteria_weights.reindex(criteria).to_numpy(dtype=float)
+    weights = weights / weights.sum()
+    flows = single_criterion_net_flows.to_numpy(dtype=float)
+    net_flows = flows @ weights
+    n = len(net_flows)
+
+    order = np.argsort(-net_flows, kind='stable')
+    if k is None or k >= n:
+        better, worse = order[:-1], order[1:]
+    else:
+        # neighbours in k first positions and k-th alternative with all
+        # alternatives which could enter the k first positions
+        better = np.concatenate([order[:k - 1],
+                                 np.repeat(order[k - 1], n - k)])
+        worse = np.concatenate([order[1:k], order[k:]])
+
+    # derivatives of net flows with respect to weight of each criterion
+    slopes = (flows - net_flows[:, np.newaxis]) / (1 - weights)
+    gaps = (net_flows[better] - net_flows[worse])[:, np.newaxis]
+    slopes_differences = slopes[better] - slopes[worse]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        crossings = weights - gaps / slopes_differences
+
+    lower = np.where(slopes_differences > 0, crossings, 0).max(axis=0,
+                                                             initial=0)
+    upper = np.where(slopes_differences < 0, crossings, 1).min(axis=0,
+                                                             initial=1)
+
+    return pd.DataFrame({'weight': weights, 'lower': lower, 'upper': upper},
+                        index=criteria)
@@ -0,0 +1,164 @@
+"""
+    This module analyses sensitivity of Promethee II ranking to imprecise
+    parameters of the SRF (Simos-Roy-Figueira) method. The ratio z of the
+    weight of the most important criterion to the weight of the least
+    important criterion and the number of blank cards between consecutive
+    groups of criteria are sampled, SRF weights of all variants are computed
+    at once and propagated to net flows through single criterion net flows.
+
+    Implementation and naming of conventions are taken from
+    :cite:p:'FigueiraRoy2001'.
+"""
+from typing import Tuple
+import numpy as np
+import pandas as pd
+from core.aliases import NumericValue
+from core.input_validation import srf_perturbation_weights_validation, \
+    srf_perturbation_validation
+from core.weights_commons import rank_statistics, \
+    srf_non_normalized_weights
+
+__all__ = ["sample_srf_weights", "calculate_srf_perturbation"]
+
+# Maximal number of net flows (samples x alternatives) kept in memory at once
+_FLOWS_CHUNK_SIZE = 2 ** 22
+# Percentiles used in summaries of distributions
+_PERCENTILES = [0.05, 0.5, 0.95]
+
+
+def sample_srf_weights(criteria_ranks: pd.Series,
+                       criteria_weight_ratio: Tuple[NumericValue,
+                                                    NumericValue],
+                       n_samples: int, blank_cards_variation: int = 1,
+                       seed: int = None) -> pd.DataFrame:
+    """
+    Samples SRF weights for perturbed parameters. Ratio z is sampled
+    uniformly from the given range and the number of blank cards between
+    every pair of consecutive groups of criteria is changed by a random
+    integer from [-blank_cards_variation, blank_cards_variation] (it can not
+    be negative). Normalized weights (up to 100) are not rounded to the
+    decimal place.
+
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+     values
+    :param criteria_weight_ratio: tuple with the lowest and the highest
+     ratio of the weight of the most important criterion to the weight of
+     the least important criterion
+    :param n_samples: number of sampled variants
+    :param blank_cards_variation: maximal change of the number of blank cards
+    :param seed: seed of random numbers generator
+    :return: pd.DataFrame with variants as index and criteria as columns
+    """
+    # input data validation
+    srf_perturbation_weights_validation(criteria_ranks,
+                                        criteria_weight_ratio, n_samples,
+                                        blank_cards_variation)
+
+    generator = np.random.default_rng(seed)
+    ranks = criteria_ranks.to_numpy()
+    groups_ranks, groups = np.unique(ranks, return_inverse=True)
+
+    ratios = generator.uniform(criteria_weight_ratio[0],
+                               criteria_weight_ratio[1], n_samples)
+    spaces = np.diff(groups_ranks) + generator.integers(
+        -blank_cards_variation, blank_cards_variation + 1,
+        (n_samples, len(groups_ranks) - 1))
+    spaces = np.maximum(spaces, 1)
+    positions = np.concatenate([np.zeros((n_samples, 1)),
+                                np.cumsum(spaces, axis=1)], axis=1)
+
+    weights = np.round(srf_non_normalized_weights(positions, ratios), 2)
+    weights = weights[:, groups]
+    weights = weights / weights.sum(axis=1, keepdims=True) * 100
+
+    return pd.DataFrame(weights, columns=criteria_ranks.index)
+
+
+def _describe(values: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarizes distributions of columns.
+
+    :param values: pd.DataFrame with samples in rows
+    :return: pd.DataFrame with columns as index and statistics as columns
+    """
+    return values.describe(percentiles=_PERCENTILES).T.drop(columns='count')
+
+
+def _net_flows_summary(weights: np.ndarray, flows: np.ndarray,
+                       alternatives: pd.Index) -> pd.DataFrame:
+    """
+    Summarizes distributions of net flows. Net flows of all samples are
+    computed for a chunk of alternatives at once, so memory does not depend
+    on the number of alternatives.
+
+    :param weights: 2D np.ndarray with samples of weights in rows
+    :param flows: 2D np.ndarray with single criterion net flows (criteria x
+     alternatives)
+    :param alternatives: pd.Index with alternatives
+    :return: pd.DataFrame with alternatives as index and statistics as
+     columns
+    """
+    chunk = max(1, _FLOWS_CHUNK_SIZE // len(weights))
+    return pd.concat([
+        _describe(pd.DataFrame(weights @ flows[:, start:start + chunk],
+                               columns=alternatives[start:start + chunk]))
+        for start in range(0, len(alternatives), chunk)])
+
+
+def calculate_srf_perturbation(single_criterion_net_flows: pd.DataFrame,
+                               criteria_ranks: pd.Series,
+                               criteria_weight_ratio: Tuple[NumericValue,
+                                                            NumericValue],
+                               n_samples: int = 10000,
+                               blank_cards_variation: int = 1,
+                               seed: int = None
+                               ) -> Tuple[pd.DataFrame, pd.DataFrame,
+                                          pd.DataFrame]:
+    """
+    Samples SRF parameters and summarizes resulting weights, net flows and
+    Promethee II rankings. Net flows of a chunk of variants are obtained as
+    one product of weights and single criterion net flows and only rank
+    statistics are accumulated between chunks.
+
+    :param single_criterion_net_flows: pd.DataFrame with alternatives as
+     index and criteria as columns
+    :param criteria_ranks: pd.Series with criteria as index and ranks as
+     values
+    :param criteria_weight_ratio: tuple with the lowest and the highest
+     ratio of the weight of the most important criterion to the weight of
+     the least important criterion
+    :param n_samples: number of sampled variants
+    :param blank_cards_variation: maximal change of the number of blank cards
+    :param seed: seed of random numbers generator
+    :return: Tuple of pd.DataFrame with summary of weights (criteria as
+     index), pd.DataFrame with summary of net flows (alternatives as index)
+     and pd.DataFrame with rank acceptability indices (alternatives as index,
+     ranks as columns)
+    """
+    # input data validation
+    srf_perturbation_validation(single_criterion_net_flows, criteria_ranks,
+                                criteria_weight_ratio, n_samples,
+                                blank_cards_variation)
+
+    weights = sample_srf_weights(criteria_ranks, criteria_weight_ratio,
+                                 n_samples, blank_cards_variation, seed)
+    criteria = single_criterion_net_flows.columns
+    alternatives = single_criterion_net_flows.index
+    flows = single_criterion_net_flows.to_numpy(dtype=float).T
+    weights_values = weights[criteria].to_numpy() / 100
+    n = len(alternatives)
+
+    rank_counts = np.zeros(n * n, dtype=np.int64)
+    chunk = max(1, _FLOWS_CHUNK_SIZE // n)
+    for start in range(0, n_samples, chunk):
+        chunk_weights = weights_values[start:start + chunk]
+        rank_counts += rank_statistics(chunk_weights,
+                                       chunk_weights @ flows)[0]
+
+    net_flows_summary = _net_flows_summary(weights_values, flows,
+                                           alternatives)
+    acceptability = pd.DataFrame(rank_counts.reshape(n, n) / n_samples,
+                                 index=alternatives,
+                                 columns=np.arange(1, n + 1))
+
+    return _describe(weights), net_flows_summary, acceptability
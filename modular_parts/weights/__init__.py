@@ -1,4 +1,9 @@
 from .M1_SurrogateWeights import *
 from .M2_SRFWeights import *
+from .M33_SMAAWeights import *
+from .M34_WeightStability import *
+from .M35_SRFPerturbation import *
 
-__all__ = M1_SurrogateWeights.__all__ + M2_SRFWeights.__all__
+__all__ = M1_SurrogateWeights.__all__ + M2_SRFWeights.__all__ + \
+          M33_SMAAWeights.__all__ + M34_WeightStability.__all__ + \
+          M35_SRFPerturbation.__all__
@@ -3,7 +3,9 @@ import sys
 import pandas as pd
 from pandas.testing import assert_series_equal
 from modular_parts.alternatives_profiles import\
-    calculate_alternatives_profiles
+    calculate_alternatives_profiles, \
+    calculate_alternatives_profiles_from_performances
+from core.enums import GeneralCriterion, Direction
 
 sys.path.append('../..')
 
@@ -59,6 +61,39 @@ def test_promethee_alternatives_profiles(partial_preferences,
     assert_series_equal(expected, actual, atol=0.006)
 
 
+def test_promethee_alternatives_profiles_from_performances():
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6']
+    criteria = ['g1', 'g2', 'g3', 'g4']
+    alternatives_performances = pd.DataFrame([[80, 90, 6, 5.4],
+                                              [65, 58, 2, 9.7],
+                                              [83, 60, 4, 7.2],
+                                              [40, 80, 10, 7.5],
+                                              [52, 72, 6, 2.0],
+                                              [94, 96, 7, 3.6]],
+                                             index=alternatives,
+                                             columns=criteria)
+    preference_thresholds = pd.Series([None, 30, 5, 6], index=criteria)
+    indifference_thresholds = pd.Series([10, None, 0.5, 1], index=criteria)
+    s_parameters = pd.Series([None, None, None, None], index=criteria)
+    generalized_criteria = pd.Series([GeneralCriterion.U_SHAPE,
+                                      GeneralCriterion.V_SHAPE,
+                                      GeneralCriterion.V_SHAPE_INDIFFERENCE,
+                                      GeneralCriterion.LEVEL],
+                                     index=criteria)
+    directions = pd.Series([Direction.MAX, Direction.MAX, Direction.MIN,
+                            Direction.MAX], index=criteria)
+    criteria_weights = pd.Series([2, 0.8, 1.5, 1], index=criteria)
+    expected = pd.Series([1.07067, 0.944, 1.08667, -2.90533, -1.99467,
+                          1.79867], index=alternatives)
+
+    actual = calculate_alternatives_profiles_from_performances(
+        criteria_weights, alternatives_performances, preference_thresholds,
+        indifference_thresholds, s_parameters, generalized_criteria,
+        directions)
+
+    assert_series_equal(expected, actual, atol=0.006)
+
+
 if __name__ == '__main__':
     test_promethee_alternatives_profiles(partial_preferences,
                                          criteria_weights)
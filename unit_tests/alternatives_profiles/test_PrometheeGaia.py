@@ -0,0 +1,55 @@
+import pytest
+import sys
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+from modular_parts.alternatives_profiles import calculate_gaia_plane
+
+sys.path.append('../..')
+
+
+@pytest.fixture
+def single_criterion_net_flows():
+    alternatives = ['a1', 'a2', 'a3', 'a4']
+    criteria = ['g1', 'g2', 'g3']
+    return pd.DataFrame([[0.5, -1.0, 0.25],
+                         [-0.5, 0.5, 0.25],
+                         [1.0, 0.0, -0.75],
+                         [-1.0, 0.5, 0.25]],
+                        index=alternatives, columns=criteria)
+
+
+@pytest.fixture
+def criteria_weights():
+    return pd.Series([0.5, 0.3, 0.2], index=['g1', 'g2', 'g3'])
+
+
+def test_gaia_plane(single_criterion_net_flows, criteria_weights):
+    alternatives = ['a1', 'a2', 'a3', 'a4']
+    criteria = ['g1', 'g2', 'g3']
+    expected_alternatives = pd.DataFrame([[0.8292, -0.79052],
+                                          [-0.72851, 0.10519],
+                                          [1.03896, 0.69456],
+                                          [-1.13966, -0.00922]],
+                                         index=alternatives,
+                                         columns=['u', 'v'])
+    expected_criteria = pd.DataFrame([[0.82231, 0.22882],
+                                      [-0.49027, 0.74968],
+                                      [-0.28888, -0.62098]],
+                                     index=criteria, columns=['u', 'v'])
+    expected_decision_stick = pd.Series([0.2063, 0.21512],
+                                        index=['u', 'v'],
+                                        name='decision stick')
+
+    alternatives_coordinates, criteria_axes, decision_stick, \
+        retained_information = calculate_gaia_plane(
+            single_criterion_net_flows, criteria_weights, chunk_size=3)
+
+    assert_frame_equal(expected_alternatives, alternatives_coordinates,
+                       atol=0.006)
+    assert_frame_equal(expected_criteria, criteria_axes, atol=0.006)
+    assert_series_equal(expected_decision_stick, decision_stick, atol=0.006)
+    assert retained_information == pytest.approx(0.99264, abs=0.006)
+
+
+if __name__ == '__main__':
+    test_gaia_plane(single_criterion_net_flows, criteria_weights)
@@ -1,6 +1,12 @@
+import itertools
 import pytest
+import numpy as np
 import pandas as pd
-from core.constraint import Constraint, Relation
+import core.linear_solver as linear_solver
+import modular_parts.choice.M24_PrometheeV as promethee_v
+from core.constraint import Constraint, ConstraintSet, Relation, \
+    budget_constraint, cardinality_constraint, group_constraint
+from core.linear_solver import enumerate_linear_problem, solve_linear_problem
 from modular_parts.choice import compute_decision
 from pandas.testing import assert_series_equal
 
@@ -34,5 +40,147 @@ def test_compute_decision(flows, constraints):
     assert_series_equal(expected, actual)
 
 
+def test_compute_decision_exhaustive(flows, constraints):
+    expected = pd.Series(data=['a3', 'a4', 'a11', 'a19'],
+                         name='chosen alternatives')
+    actual = compute_decision(flows, constraints, exhaustive=True)
+
+    assert_series_equal(expected, actual)
+
+
+def test_compute_decision_many_alternatives():
+    alternatives = [f'a{i}' for i in range(1, 61)]
+    flows = pd.Series(data=[(i * 37 % 61 - 30) / 30 for i in range(1, 61)],
+                      index=alternatives)
+    constraints = [Constraint([1] * 60, Relation.EQ, 3),
+                   Constraint([1, 2] * 30, Relation.LEQ, 4)]
+    expected = pd.Series(data=['a23', 'a28', 'a51'],
+                         name='chosen alternatives')
+    actual = compute_decision(flows, constraints)
+
+    assert_series_equal(expected, actual)
+
+
+@pytest.mark.parametrize("exhaustive", [False, True])
+def test_compute_decision_constraint_set(flows, exhaustive):
+    budget = [27, 29, 20, 34, 32, 22, 34, 30, 28, 21, 32, 37, 26, 16, 13, 32,
+              35, 20, 40, 39]
+    constraints = ConstraintSet([budget_constraint(budget, 150),
+                                 group_constraint(20, [2, 3])], 20)
+    expected = pd.Series(data=['a4', 'a8', 'a11', 'a19'],
+                         name='chosen alternatives')
+    actual = compute_decision(flows, constraints, exhaustive)
+    assert_series_equal(expected, actual)
+
+    expected = pd.Series(data=['a4', 'a8', 'a11', 'a15', 'a19'],
+                         name='chosen alternatives')
+    actual = compute_decision(flows, constraints, exhaustive,
+                              c_optimality=True)
+    assert_series_equal(expected, actual)
+
+    constraints = ConstraintSet([budget_constraint(budget, 150),
+                                 group_constraint(20, [2, 3]),
+                                 cardinality_constraint(20, Relation.GEQ, 6)],
+                                20)
+    expected = pd.Series(data=['a4', 'a6', 'a9', 'a11', 'a15', 'a18'],
+                         name='chosen alternatives')
+    actual = compute_decision(flows, constraints, exhaustive)
+    assert_series_equal(expected, actual)
+
+
+def _random_problem(seed, n):
+    rng = np.random.default_rng(seed)
+    C = rng.uniform(-1, 1, n).round(3)
+    costs = rng.integers(1, 100, n)
+    constraints = [budget_constraint(costs, costs.sum() * 0.4),
+                   cardinality_constraint(n, Relation.GEQ, n // 4)]
+    for _ in range(n // 5):
+        constraints.append(group_constraint(
+            n, list(rng.choice(n, 3, replace=False))))
+    if seed % 3 == 0:
+        constraints.append(Constraint(list(rng.integers(0, 3, n)),
+                                      Relation.EQ, 4))
+    return constraints, C
+
+
+@pytest.mark.parametrize("lp_relaxation", [True, False])
+@pytest.mark.parametrize("seed", range(12))
+def test_branch_and_bound_matches_enumeration(monkeypatch, seed,
+                                              lp_relaxation):
+    monkeypatch.setattr(linear_solver, "milp", None)
+    if not lp_relaxation:
+        monkeypatch.setattr(linear_solver, "linprog", None)
+    constraints, C = _random_problem(seed, 12)
+
+    expected = solve_linear_problem(constraints, C, 12, exhaustive=True)
+    actual = solve_linear_problem(constraints, C, 12)
+
+    if not expected:
+        assert actual == ()
+    else:
+        assert ConstraintSet(constraints, 12).is_satisfied([actual])[0]
+        assert np.dot(C, actual) == pytest.approx(np.dot(C, expected))
+
+
+def test_branch_and_bound_many_components(monkeypatch):
+    pytest.importorskip("scipy")
+    constraints, C = _random_problem(1, 300)
+    expected = solve_linear_problem(constraints, C, 300, node_limit=0)
+
+    monkeypatch.setattr(linear_solver, "milp", None)
+    actual = solve_linear_problem(constraints, C, 300)
+
+    assert ConstraintSet(constraints, 300).is_satisfied([actual])[0]
+    assert np.dot(C, actual) == pytest.approx(np.dot(C, expected))
+
+
+@pytest.mark.parametrize("top, ties", [(1, False), (5, False), (1, True),
+                                       (5, True), (10000, False)])
+def test_enumerate_linear_problem_matches_product(top, ties):
+    n = 10
+    rng = np.random.default_rng(5)
+    # small integer goal coefficients give many equal solutions
+    C = rng.integers(-2, 4, n)
+    constraints = [budget_constraint(rng.integers(1, 10, n), 20),
+                   group_constraint(n, [0, 1, 2]),
+                   cardinality_constraint(n, Relation.GEQ, 2)]
+    # solutions with negative goal function are never better than the
+    # empty decision
+    combinations = [combination
+                    for combination in itertools.product([0, 1], repeat=n)
+                    if ConstraintSet(constraints, n).is_satisfied(
+                        [combination])[0] and np.dot(C, combination) >= 0]
+    # the best first, among equal solutions later combinations first
+    combinations = sorted(reversed(combinations),
+                          key=lambda combination: -np.dot(C, combination))
+    expected = combinations[:top]
+    if ties:
+        last_Z = np.dot(C, expected[-1])
+        expected = [combination for combination in combinations
+                    if np.dot(C, combination) >= last_Z]
+
+    actual = enumerate_linear_problem(constraints, C, n, top, ties)
+
+    assert actual == expected
+
+
+def test_constraint_set_is_satisfied():
+    constraints = ConstraintSet([Constraint([1, 1, 1], Relation.EQ, 2),
+                                 Constraint([1, 0, 2], Relation.GEQ, 1),
+                                 Constraint([3, 1, 0], Relation.LEQ, 3)], 3)
+    combinations = [(1, 1, 0), (0, 1, 1), (1, 0, 1), (0, 0, 1), (1, 0, 0)]
+
+    actual = constraints.is_satisfied(combinations)
+
+    assert actual.tolist() == [False, True, True, False, False]
+
+
+def test_compute_decision_checks_solution(monkeypatch, flows, constraints):
+    monkeypatch.setattr(promethee_v, "solve_linear_problem",
+                        lambda *args, **kwargs: (1,) * 20)
+    with pytest.raises(ValueError):
+        compute_decision(flows, constraints)
+
+
 if __name__ == '__main__':
     test_compute_decision(flows, constraints)
@@ -1,7 +1,7 @@
 import pytest
 import sys
 import pandas as pd
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_series_equal, assert_frame_equal
 from core.enums import ScoringFunction, ScoringFunctionDirection
 from modular_parts.flows import calculate_net_flows_score
 
@@ -62,6 +62,37 @@ def test_net_flow_score_max_difference(alternatives_preferences):
     assert_series_equal(expected, actual, atol=0.006)
 
 
+def test_net_flow_score_does_not_modify_preferences(
+        alternatives_preferences):
+    expected = alternatives_preferences.copy()
+
+    calculate_net_flows_score(alternatives_preferences,
+                              ScoringFunction.SUM,
+                              ScoringFunctionDirection.DIFFERENCE,
+                              avoid_same_scores=True)
+
+    assert_frame_equal(expected, alternatives_preferences)
+
+
+def test_net_flow_score_sum_favor_with_ties():
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5']
+    preferences = pd.DataFrame([[0, 0.5, 0.25, 0.25, 0],
+                                [0.25, 0, 0.5, 0.25, 0],
+                                [0, 0, 0, 0.125, 0],
+                                [0, 0, 0.125, 0, 0],
+                                [0.5, 0.25, 0, 0, 0]],
+                               index=alternatives, columns=alternatives)
+    expected = pd.Series([0.5, 0.25, 0.125, 0.125, 0.75],
+                         index=alternatives)
+
+    actual = calculate_net_flows_score(preferences,
+                                       ScoringFunction.SUM,
+                                       ScoringFunctionDirection.IN_FAVOR,
+                                       avoid_same_scores=True)
+
+    assert_series_equal(expected, actual)
+
+
 if __name__ == '__main__':
     test_net_flow_score_sum_favor(alternatives_preferences)
     test_net_flow_score_min_against(alternatives_preferences)
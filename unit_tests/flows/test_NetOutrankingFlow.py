@@ -2,7 +2,8 @@ import pytest
 import sys
 import pandas as pd
 from pandas.testing import assert_series_equal, assert_frame_equal
-from modular_parts.flows import calculate_net_outranking_flows
+from modular_parts.flows import calculate_net_outranking_flows, \
+    calculate_net_outranking_flows_batch
 
 sys.path.append('../..')
 
@@ -38,6 +39,27 @@ def test__net_outranking_flows_for_profile_based(flows):
     assert_frame_equal(expected, actual, atol=0.006)
 
 
+def test_net_outranking_flows_inplace(flows):
+    actual = calculate_net_outranking_flows(flows, True, inplace=True)
+
+    assert actual is flows
+    assert list(flows.columns) == ['positive', 'negative', 'net']
+
+
+def test_net_outranking_flows_batch(flows):
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6']
+    reversed_flows = flows.rename(columns={'positive': 'negative',
+                                           'negative': 'positive'})
+    net = [-0.45738, -0.10016, 0.18343, 0.55909, 0.17125, -0.35624]
+    expected = pd.Series(
+        net + [-value for value in net],
+        index=pd.MultiIndex.from_product([[0, 1], alternatives]),
+        dtype='float64', name='Net outranking flow')
+
+    actual = calculate_net_outranking_flows_batch([flows, reversed_flows])
+    assert_series_equal(expected, actual, atol=0.006)
+
+
 if __name__ == '__main__':
     test_net_outranking_flows(flows)
     test__net_outranking_flows_for_profile_based(flows)
@@ -1,9 +1,11 @@
 import pytest
 import sys
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_series_equal
 from core.enums import ScoringFunction, ScoringFunctionDirection
-from modular_parts.ranking import calculate_netflow_score_ranking
+from modular_parts.ranking import calculate_netflow_score_ranking, \
+    calculate_netflow_score_iterative_ranking
 
 sys.path.append('../..')
 
@@ -61,6 +63,30 @@ def test_net_flow_score_max_difference(alternatives_preferences):
     assert_series_equal(expected, actual, atol=0.006)
 
 
+def test_iterative_net_flow_score_sum_favor(alternatives_preferences):
+    expected = pd.Series(
+        [3.04672, 1.29162, 1.18961, 0.59849, 0.12798, 0.0],
+        index=['a4', 'a3', 'a5', 'a2', 'a6', 'a1'])
+    actual = calculate_netflow_score_iterative_ranking(
+        alternatives_preferences,
+        ScoringFunction.SUM,
+        ScoringFunctionDirection.IN_FAVOR)
+
+    assert_series_equal(expected, actual, atol=0.006)
+
+
+def test_iterative_net_flow_score_max_difference(alternatives_preferences):
+    expected = pd.Series(
+        [0.84706, 0.53675, 0.52386, 0.29769, 0.08428, np.NaN],
+        index=['a4', 'a3', 'a5', 'a2', 'a6', 'a1'])
+    actual = calculate_netflow_score_iterative_ranking(
+        alternatives_preferences,
+        ScoringFunction.MAX,
+        ScoringFunctionDirection.DIFFERENCE)
+
+    assert_series_equal(expected, actual, atol=0.006)
+
+
 if __name__ == '__main__':
     test_net_flow_score_sum_favor(alternatives_preferences)
     test_net_flow_score_min_against(alternatives_preferences)
@@ -0,0 +1,90 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from modular_parts.ranking import calculate_prometheeI_hasse_diagram, \
+    calculate_prometheeIII_hasse_diagram, hasse_diagram_to_dot
+
+sys.path.append('../..')
+
+
+@pytest.fixture
+def alternatives():
+    return ['a1', 'a2', 'a3', 'a4', 'a5', 'a6']
+
+
+@pytest.fixture
+def outranking_flows(alternatives):
+    return pd.DataFrame(
+        {'positive': [0.04151, 0.12188, 0.26870, 0.60934, 0.26058, 0.03652],
+         'negative': [0.49889, 0.22204, 0.08527, 0.05025, 0.08933, 0.39276]
+         }, index=alternatives)
+
+
+@pytest.fixture
+def intervals(alternatives):
+    return pd.DataFrame([[-3.25, -1.323],
+                         [-0.755, -0.247],
+                         [0.509, 1.326],
+                         [1.622, 3.969],
+                         [0.471, 1.241],
+                         [-2.537, -1.025]], index=alternatives,
+                        columns=["x", "y"])
+
+
+def test_prometheeI_hasse_diagram(outranking_flows):
+    expected = {('a2', 'a6'), ('a2', 'a1'), ('a5', 'a2'), ('a3', 'a5'),
+                ('a4', 'a3')}
+
+    actual = calculate_prometheeI_hasse_diagram(outranking_flows)
+
+    assert len(actual) == len(expected)
+    assert set(zip(actual['source'], actual['target'])) == expected
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_prometheeI_hasse_diagram_tied_flows(seed):
+    rng = np.random.default_rng(seed)
+    alternatives = [f'a{i}' for i in range(40)]
+    flows = pd.DataFrame({'positive': rng.integers(0, 6, 40) / 5,
+                          'negative': rng.integers(0, 6, 40) / 5},
+                         index=alternatives)
+    positive = flows['positive'].to_numpy()
+    negative = flows['negative'].to_numpy()
+    # strict Promethee I preference and its transitive reduction
+    preferred = (positive[:, np.newaxis] >= positive) & \
+        (negative[:, np.newaxis] <= negative) & \
+        ~((positive[:, np.newaxis] == positive) &
+          (negative[:, np.newaxis] == negative))
+    covering = preferred & ~((preferred.astype(int) @ preferred) > 0)
+    expected = {(alternatives[a], alternatives[b])
+                for a, b in zip(*np.nonzero(covering))}
+
+    actual = calculate_prometheeI_hasse_diagram(flows)
+
+    assert len(actual) == len(expected)
+    assert set(zip(actual['source'], actual['target'])) == expected
+
+
+def test_prometheeIII_hasse_diagram(intervals):
+    expected = {('a2', 'a1'), ('a2', 'a6'), ('a3', 'a2'), ('a4', 'a5'),
+                ('a4', 'a3'), ('a5', 'a2')}
+
+    actual = calculate_prometheeIII_hasse_diagram(intervals)
+
+    assert len(actual) == len(expected)
+    assert set(zip(actual['source'], actual['target'])) == expected
+
+
+def test_hasse_diagram_to_dot(intervals):
+    edges = calculate_prometheeIII_hasse_diagram(intervals).head(1)
+    expected = 'digraph {\n  "a1";\n  "a2";\n  "a3";\n  "a4";\n  "a5";\n' \
+               '  "a6";\n  "a2" -> "a1";\n}\n'
+
+    assert hasse_diagram_to_dot(edges) == expected
+
+
+if __name__ == '__main__':
+    test_prometheeI_hasse_diagram(outranking_flows)
+    test_prometheeIII_hasse_diagram(intervals)
+    test_hasse_diagram_to_dot(intervals)
@@ -1,7 +1,9 @@
 import pytest
 import pandas as pd
 from pandas.testing import assert_frame_equal
-from modular_parts.ranking import calculate_promethee_iii_ranking
+from modular_parts.ranking import calculate_promethee_iii_ranking, \
+    calculate_promethee_iii_relation_matrix, \
+    calculate_promethee_iii_relation_counts
 
 
 @pytest.fixture
@@ -50,5 +52,35 @@ def test_promethee_iii_ranking(flows, preferences, alternatives):
     assert_frame_equal(pairs, expected_pairs, atol=0.006)
 
 
+def test_promethee_iii_relation_matrix(flows, preferences, alternatives):
+    expected = pd.DataFrame([[0, -1, -1, -1, -1, 0],
+                             [1, 0, -1, -1, -1, 1],
+                             [1, 1, 0, -1, 0, 1],
+                             [1, 1, 1, 0, 1, 1],
+                             [1, 1, 0, -1, 0, 1],
+                             [0, -1, -1, -1, -1, 0]],
+                            index=alternatives, columns=alternatives,
+                            dtype='int8')
+
+    _, relation_matrix = calculate_promethee_iii_relation_matrix(
+        flows, preferences, 0.5)
+
+    assert_frame_equal(relation_matrix, expected)
+
+
+def test_promethee_iii_relation_counts(flows, preferences, alternatives):
+    expected = pd.DataFrame([[0, 4, 1], [2, 3, 0], [3, 1, 1],
+                             [5, 0, 0], [3, 1, 1], [0, 4, 1]],
+                            index=alternatives,
+                            columns=pd.MultiIndex.from_product(
+                                [[0.5], ['preferred_to', 'preferred_by',
+                                         'indifferent']]))
+
+    _, counts = calculate_promethee_iii_relation_counts(flows, preferences,
+                                                        [0.5, 1.0])
+
+    assert_frame_equal(counts[[0.5]], expected, check_dtype=False)
+
+
 if __name__ == '__main__':
     test_promethee_iii_ranking(flows, preferences, alternatives)
@@ -0,0 +1,43 @@
+import pytest
+import sys
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from modular_parts.ranking import calculate_leave_one_out_net_flows, \
+    calculate_promethee_ii_rank_reversal
+
+sys.path.append('../..')
+
+
+@pytest.fixture
+def preferences():
+    alternatives = ['a1', 'a2', 'a3', 'a4']
+    return pd.DataFrame([[0.0, 0.6, 0.3, 0.2],
+                         [0.3, 0.0, 0.9, 0.0],
+                         [0.5, 0.1, 0.0, 0.8],
+                         [0.4, 0.7, 0.1, 0.0]],
+                        index=alternatives, columns=alternatives)
+
+
+def test_leave_one_out_net_flows(preferences):
+    alternatives = ['a1', 'a2', 'a3', 'a4']
+    expected = pd.DataFrame([[np.nan, 0.05, -0.05, 0.0],
+                             [-0.2, np.nan, 0.45, -0.25],
+                             [0.05, -0.5, np.nan, 0.45],
+                             [0.05, 0.25, -0.3, np.nan]],
+                            index=alternatives, columns=alternatives)
+    actual = calculate_leave_one_out_net_flows(preferences)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+
+def test_prometheeII_rank_reversal(preferences):
+    expected = pd.DataFrame({
+        'removed': ['a1', 'a1', 'a2', 'a2', 'a4', 'a4', 'a4'],
+        'first': ['a4', 'a3', 'a4', 'a4', 'a3', 'a3', 'a1'],
+        'second': ['a2', 'a2', 'a3', 'a1', 'a1', 'a2', 'a2']
+    })
+    for n_jobs in [1, 2]:
+        actual, rate = calculate_promethee_ii_rank_reversal(preferences,
+                                                            n_jobs)
+        assert_frame_equal(expected, actual)
+        assert rate == pytest.approx(7 / 12)
@@ -1,8 +1,11 @@
 import pytest
 import sys
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_series_equal
-from modular_parts.ranking import calculate_promethee_ii_ranking
+from modular_parts.ranking import calculate_promethee_ii_ranking, \
+    calculate_promethee_ii_top_k, calculate_promethee_ii_top_k_stream, \
+    calculate_promethee_ii_ranks
 
 sys.path.append('../..')
 
@@ -24,5 +27,59 @@ def test_prometheeII_ranking(net_outranking_flows):
     assert_series_equal(expected, actual, atol=0.006)
 
 
+def test_prometheeII_top_k(net_outranking_flows):
+    expected = pd.Series(data=['a4', 'a2', 'a5'], index=[1, 2, 3],
+                         name='ranking')
+    actual = calculate_promethee_ii_top_k(net_outranking_flows, 3)
+    assert_series_equal(expected, actual)
+
+    expected = pd.Series(data=['a3', 'a6'], index=[5, 6], name='ranking')
+    actual = calculate_promethee_ii_top_k(net_outranking_flows, 2,
+                                          bottom=True)
+    assert_series_equal(expected, actual)
+
+
+def test_prometheeII_top_k_stream(net_outranking_flows):
+    chunks = [net_outranking_flows.iloc[:4], net_outranking_flows.iloc[4:]]
+    expected = pd.Series(data=['a4', 'a2', 'a5'], index=[1, 2, 3],
+                         name='ranking', dtype=object)
+    actual = calculate_promethee_ii_top_k_stream(iter(chunks), 3)
+    assert_series_equal(expected, actual)
+
+    expected = pd.Series(data=['a3', 'a6'], index=[5, 6], name='ranking',
+                         dtype=object)
+    actual = calculate_promethee_ii_top_k_stream(iter(chunks), 2,
+                                                 bottom=True)
+    assert_series_equal(expected, actual)
+
+
+def test_prometheeII_ranks(net_outranking_flows):
+    expected = pd.Series(data=[6, 1, 4], index=['a6', 'a4', 'a1'],
+                         name='ranking')
+    actual = calculate_promethee_ii_ranks(net_outranking_flows,
+                                          ['a6', 'a4', 'a1'])
+    assert_series_equal(expected, actual, check_dtype=False)
+
+
+
+@pytest.mark.parametrize("bottom", [False, True])
+def test_prometheeII_tied_flows(bottom):
+    rng = np.random.default_rng(0)
+    alternatives = [f'a{i}' for i in range(1, 101)]
+    flows = pd.DataFrame({'net': rng.integers(-3, 4, 100) / 4},
+                         index=alternatives)
+    ranking = calculate_promethee_ii_ranking(flows)
+    expected = ranking.iloc[-10:] if bottom else ranking.iloc[:10]
+
+    actual = calculate_promethee_ii_top_k(flows, 10, bottom)
+    assert_series_equal(expected, actual)
+    chunks = [flows.iloc[start:start + 30] for start in range(0, 100, 30)]
+    actual = calculate_promethee_ii_top_k_stream(iter(chunks), 10, bottom)
+    assert_series_equal(expected, actual, check_dtype=False)
+    actual = calculate_promethee_ii_ranks(flows, list(expected))
+    assert list(actual) == list(expected.index)
+    actual = calculate_promethee_ii_ranks(flows, alternatives)
+    assert (ranking[actual].to_numpy() == np.array(alternatives)).all()
+
 if __name__ == '__main__':
     test_prometheeII_ranking(net_outranking_flows)
@@ -1,7 +1,9 @@
 import pytest
 import sys
 import pandas as pd
-from modular_parts.ranking import calculate_prometheeI_ranking
+from pandas.testing import assert_frame_equal
+from modular_parts.ranking import calculate_prometheeI_ranking, \
+    calculate_prometheeI_relation_matrix, calculate_prometheeI_dominance
 from core.enums import RelationType
 # from mcda.core.sorting import RelationType -> ścieżka francuza
 
@@ -57,5 +59,39 @@ def test_prometheeI_ranking(outranking_flows):
     assert actual == expected
 
 
+def test_prometheeI_relation_matrix(outranking_flows):
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6']
+    expected = pd.DataFrame([[0, 3, 3, 3, 3, 3],
+                             [1, 0, 3, 3, 3, 1],
+                             [1, 1, 0, 3, 1, 1],
+                             [1, 1, 1, 0, 1, 1],
+                             [1, 1, 3, 3, 0, 1],
+                             [3, 3, 3, 3, 3, 0]],
+                            index=alternatives, columns=alternatives,
+                            dtype='int8')
+
+    actual = calculate_prometheeI_relation_matrix(outranking_flows)
+
+    assert_frame_equal(expected, actual)
+
+
+def test_prometheeI_dominance(outranking_flows):
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5', 'a6']
+    expected = pd.DataFrame([[0, 4, 0, 1, 5],
+                             [2, 3, 0, 0, 4],
+                             [4, 1, 0, 0, 2],
+                             [5, 0, 0, 0, 1],
+                             [3, 2, 0, 0, 3],
+                             [0, 4, 0, 1, 5]],
+                            index=alternatives,
+                            columns=['outranks', 'outranked', 'indifferent',
+                                     'incomparable', 'layer'])
+
+    actual, maximal = calculate_prometheeI_dominance(outranking_flows)
+
+    assert_frame_equal(expected, actual)
+    assert list(maximal) == ['a4']
+
+
 if __name__ == '__main__':
     test_prometheeI_ranking(outranking_flows)
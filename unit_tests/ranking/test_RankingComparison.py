@@ -0,0 +1,67 @@
+import pytest
+import sys
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+from modular_parts.ranking import calculate_ranking_positions, \
+    calculate_kendall_tau, calculate_spearman_rho, calculate_top_k_overlap, \
+    calculate_kendall_tau_matrix, calculate_spearman_rho_matrix, \
+    calculate_top_k_overlap_matrix
+
+sys.path.append('../..')
+
+
+@pytest.fixture
+def rankings():
+    alternatives = ['a1', 'a2', 'a3', 'a4', 'a5']
+    return pd.DataFrame({
+        'DM1': [1, 2, 3, 4, 5],
+        'DM2': [2, 1, 3, 5, 4],
+        'DM3': [1, 1, 3, 3, 5]
+    }, index=alternatives)
+
+
+def test_ranking_positions():
+    ranking = pd.Series(data=['a4', 'a2', 'a5'], index=[1, 2, 3],
+                        name='ranking')
+    expected = pd.Series(data=[1, 2, 3], index=['a4', 'a2', 'a5'],
+                         name='ranking')
+    assert_series_equal(expected, calculate_ranking_positions(ranking))
+
+
+def test_kendall_tau_matrix(rankings):
+    expected = pd.DataFrame([[1.0, 0.6, 0.8944],
+                             [0.6, 1.0, 0.6708],
+                             [0.8944, 0.6708, 1.0]],
+                            index=rankings.columns, columns=rankings.columns)
+    actual = calculate_kendall_tau_matrix(rankings)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+
+def test_spearman_rho_matrix(rankings):
+    expected = pd.DataFrame([[1.0, 0.8, 0.9487],
+                             [0.8, 1.0, 0.7906],
+                             [0.9487, 0.7906, 1.0]],
+                            index=rankings.columns, columns=rankings.columns)
+    actual = calculate_spearman_rho_matrix(rankings)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+
+def test_top_k_overlap_matrix(rankings):
+    expected = pd.DataFrame([[1.0, 1.0, 1.0],
+                             [1.0, 1.0, 1.0],
+                             [1.0, 1.0, 1.0]],
+                            index=rankings.columns, columns=rankings.columns)
+    actual = calculate_top_k_overlap_matrix(rankings, 2)
+    assert_frame_equal(expected, actual)
+
+
+def test_pairwise_comparison(rankings):
+    shuffled = rankings['DM2'].iloc[::-1]
+    assert calculate_kendall_tau(rankings['DM1'], shuffled) == \
+        pytest.approx(0.6)
+    assert calculate_spearman_rho(rankings['DM1'], shuffled) == \
+        pytest.approx(0.8)
+    assert calculate_top_k_overlap(rankings['DM1'], shuffled, 3) == \
+        pytest.approx(1.0)
+    assert calculate_kendall_tau(rankings['DM1'], rankings['DM3']) == \
+        pytest.approx(0.8944, abs=0.006)
@@ -1,7 +1,7 @@
 import pytest
 import sys
 import pandas as pd
-from pandas.testing import assert_series_equal
+from pandas.testing import assert_series_equal, assert_frame_equal
 from core.enums import CompareProfiles, Direction
 from modular_parts.sorting import calculate_flowsort_gdss_sorted_alternatives
 
@@ -155,6 +155,125 @@ def test_calculate_flowsort_gdss_sorted_alternatives(
     assert_series_equal(expected, actual, atol=0.006)
 
 
+@pytest.mark.parametrize("dms_weights, expected_a1", [
+    (pd.Series([0.6, 0.4], index=["DM1", "DM2"]), 'C2'),
+    (pd.Series([0.8, 0.2], index=["DM1", "DM2"]), 'C2'),
+    (pd.Series([0.4, 0.6], index=["DM1", "DM2"]), 'C3')])
+def test_flowsort_gdss_central_profiles(criteria_directions, dms_weights,
+                                        expected_a1):
+    alternatives = ["a1", "a2"]
+    profiles = [f"p{i}" for i in range(1, 4)]
+    criteria = [f"g{i}" for i in range(1, 4)]
+    alternatives_general_net_flows = pd.Series([0.3, -0.5],
+                                               index=alternatives)
+    profiles_general_net_flows = pd.concat([
+        pd.DataFrame([[-0.5, -0.5], [0.0, 0.0], [0.5, 0.5]],
+                     index=profiles, columns=alternatives),
+        pd.DataFrame([[-0.4, -0.4], [0.1, 0.1], [0.6, 0.6]],
+                     index=profiles, columns=alternatives)],
+        keys=["DM1", "DM2"])
+    profiles_performances = [
+        pd.DataFrame([[30, 8, 7], [20, 6, 5], [10, 4, 3]],
+                     index=profiles, columns=criteria)] * 2
+
+    first_step, final_step = calculate_flowsort_gdss_sorted_alternatives(
+        alternatives_general_net_flows, profiles_general_net_flows,
+        ["C1", "C2", "C3"], criteria_directions, profiles_performances,
+        dms_weights, CompareProfiles.CENTRAL_PROFILES)
+
+    assert_frame_equal(pd.DataFrame({'worse': ['C2', 'C1'],
+                                     'better': ['C3', 'C1']},
+                                    index=alternatives), first_step)
+    assert_series_equal(pd.Series([expected_a1, 'C1'], index=alternatives,
+                                  name='better'), final_step)
+
+
+def _sort_with_central_profiles(criteria_directions, alternative_flow,
+                                dms_profiles_flows, dms_weights,
+                                assign_to_better_class=True):
+    profiles = [f"p{i}" for i in range(1, 4)]
+    criteria = [f"g{i}" for i in range(1, 4)]
+    dms = [f"DM{i}" for i in range(1, len(dms_profiles_flows) + 1)]
+    profiles_general_net_flows = pd.concat(
+        [pd.DataFrame({"a1": profiles_flows}, index=profiles)
+         for profiles_flows in dms_profiles_flows], keys=dms)
+    profiles_performances = [
+        pd.DataFrame([[30, 8, 7], [20, 6, 5], [10, 4, 3]],
+                     index=profiles, columns=criteria)] * len(dms)
+
+    return calculate_flowsort_gdss_sorted_alternatives(
+        pd.Series([alternative_flow], index=["a1"]),
+        profiles_general_net_flows, ["C1", "C2", "C3"], criteria_directions,
+        profiles_performances, pd.Series(dms_weights, index=dms),
+        CompareProfiles.CENTRAL_PROFILES, assign_to_better_class)
+
+
+@pytest.mark.parametrize("assign_to_better_class, expected",
+                         [(True, 'C3'), (False, 'C2')])
+def test_flowsort_gdss_distance_tie(criteria_directions,
+                                    assign_to_better_class, expected):
+    # DM1 votes C2 (distance 0.25), DM2 votes C3 (distance 0.15), weighted
+    # distances are equal
+    _, final_step = _sort_with_central_profiles(
+        criteria_directions, 0.25, [[-0.5, 0.0, 0.6], [-0.5, 0.0, 0.4]],
+        [0.375, 0.625], assign_to_better_class)
+
+    assert_series_equal(pd.Series([expected], index=["a1"], name='better'),
+                        final_step)
+
+
+def test_flowsort_gdss_three_distinct_votes(criteria_directions):
+    # DMs vote C2, C1 and C3, the alternative is the closest to C3 profile
+    first_step, final_step = _sort_with_central_profiles(
+        criteria_directions, 0.0,
+        [[-0.5, 0.0, 0.5], [-0.1, 0.6, 0.9], [-0.9, -0.6, 0.05]],
+        [1 / 3, 1 / 3, 1 / 3])
+
+    assert_frame_equal(pd.DataFrame({'worse': ['C1'], 'better': ['C3']},
+                                    index=["a1"]), first_step)
+    assert_series_equal(pd.Series(['C3'], index=["a1"], name='better'),
+                        final_step)
+
+
+def test_flowsort_gdss_partly_equal_weights(criteria_directions):
+    # DM1, DM2 and DM3 vote C2 (distance 0.2 each), DM4 votes C3 (distance
+    # 0.15), weights of all voters are counted, also the equal ones
+    _, final_step = _sort_with_central_profiles(
+        criteria_directions, 0.3,
+        [[-0.5, 0.1, 0.6], [-0.5, 0.1, 0.6], [-0.5, 0.1, 0.6],
+         [-0.5, 0.0, 0.45]],
+        [0.2, 0.2, 0.3, 0.3])
+
+    assert_series_equal(pd.Series(['C3'], index=["a1"], name='better'),
+                        final_step)
+
+
+@pytest.mark.parametrize("dm2_profiles", [["p1", "p2", "p4"],
+                                          ["p1", "p1", "p2"]])
+def test_flowsort_gdss_unknown_profiles(criteria_directions, dm2_profiles):
+    alternatives = ["a1", "a2"]
+    profiles = [f"p{i}" for i in range(1, 4)]
+    criteria = [f"g{i}" for i in range(1, 4)]
+    alternatives_general_net_flows = pd.Series([0.3, -0.5],
+                                               index=alternatives)
+    profiles_general_net_flows = pd.concat([
+        pd.DataFrame([[-0.5, -0.5], [0.0, 0.0], [0.5, 0.5]],
+                     index=profiles, columns=alternatives),
+        pd.DataFrame([[-0.4, -0.4], [0.1, 0.1], [0.6, 0.6]],
+                     index=dm2_profiles, columns=alternatives)],
+        keys=["DM1", "DM2"])
+    profiles_performances = [
+        pd.DataFrame([[30, 8, 7], [20, 6, 5], [10, 4, 3]],
+                     index=profiles, columns=criteria)] * 2
+
+    with pytest.raises(ValueError):
+        calculate_flowsort_gdss_sorted_alternatives(
+            alternatives_general_net_flows, profiles_general_net_flows,
+            ["C1", "C2", "C3"], criteria_directions, profiles_performances,
+            pd.Series([0.5, 0.5], index=["DM1", "DM2"]),
+            CompareProfiles.CENTRAL_PROFILES)
+
+
 if __name__ == '__main__':
     test_calculate_flowsort_gdss_sorted_alternatives(
         alternatives_general_net_flows, profiles_general_net_flows,
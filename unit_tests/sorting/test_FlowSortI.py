@@ -68,6 +68,33 @@ def test(categories, category_profiles_performances, criteria_directions,
     assert_frame_equal(expected_classification, actual_classification)
 
 
+@pytest.mark.parametrize("comparison, worse, better", [
+    (CompareProfiles.BOUNDARY_PROFILES, ['C2', 'C2', 'C2'],
+     ['C3', 'C2', 'C3']),
+    (CompareProfiles.CENTRAL_PROFILES, ['C2', 'C1', 'C2'],
+     ['C2', 'C1', 'C3'])])
+def test_boundary_and_central_profiles(categories, criteria_directions,
+                                       alternatives_flows, comparison, worse,
+                                       better):
+    profiles = [f"r{i}" for i in range(1, 5)]
+    criteria = [f"g{i}" for i in range(1, 6)]
+    category_profiles = pd.DataFrame(
+        [[0, 0, 0, 0, 0], [25, 25, 25, 25, 25], [50, 50, 50, 50, 50],
+         [75, 75, 75, 75, 75]], index=profiles, columns=criteria)
+    category_profiles_flows = pd.DataFrame(
+        {'positive': [0.0, 0.4, 0.6, 0.866667],
+         'negative': [1.0, 0.466667, 0.333333, 0.0]
+         }, index=profiles)
+
+    actual_classification = calculate_flowsortI_sorted_alternatives(
+        categories, category_profiles, criteria_directions,
+        alternatives_flows, category_profiles_flows, comparison)
+
+    expected_classification = pd.DataFrame(
+        {'worse': worse, 'better': better}, index=alternatives_flows.index)
+    assert_frame_equal(expected_classification, actual_classification)
+
+
 if __name__ == '__main__':
     test(categories, category_profiles_performances, criteria_directions,
          alternatives_flows,
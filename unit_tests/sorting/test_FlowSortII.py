@@ -130,6 +130,23 @@ def test_flowsortII_central(categories_central,
     assert_frame_equal(actual_classification, expected_classification)
 
 
+def test_flowsortII_boundary(category_profiles_performances_central,
+                             criteria_directions,
+                             prometheeII_flows_central):
+    actual_classification = calculate_flowsortII_sorted_alternatives(
+        [f"C{i}" for i in range(1, 6)],
+        category_profiles_performances_central,
+        criteria_directions, prometheeII_flows_central,
+        CompareProfiles.BOUNDARY_PROFILES)
+
+    alternatives = [f"a{i}" for i in range(1, 4)]
+    expected_classification = pd.DataFrame({'positive': ['C3', 'C2', 'C3'],
+                                            'negative': ['C3', 'C2', 'C3'],
+                                            'net': ['C4', 'C2', 'C3']},
+                                           index=alternatives)
+    assert_frame_equal(actual_classification, expected_classification)
+
+
 if __name__ == '__main__':
     test_flowsortII_limiting(categories_limiting,
                              category_profiles_performances_limiting,
@@ -81,5 +81,29 @@ def test_calculate_alternatives_support(categories, assignments):
     assert_frame_equal(expected_unimodal_support, actual_unimodal_support)
 
 
+def test_unimodal_support_fills_gaps(categories):
+    alternatives = ["a1"]
+    assignments = [
+        pd.DataFrame({'worse': ['C1'], 'better': ['C1']},
+                     index=alternatives),
+        pd.DataFrame({'worse': ['C4'], 'better': ['C4']},
+                     index=alternatives),
+        pd.DataFrame({'worse': ['C3'], 'better': ['C4']},
+                     index=alternatives),
+        pd.DataFrame({'worse': ['C1'], 'better': ['C1']},
+                     index=alternatives)]
+
+    actual_support, actual_unimodal_support = calculate_alternatives_support(
+        categories, assignments)
+
+    expected_support = pd.DataFrame([[50.0, 0.0, 25.0, 50.0]],
+                                    index=alternatives, columns=categories)
+    expected_unimodal_support = pd.DataFrame([[50.0, 50.0, 50.0, 50.0]],
+                                             index=alternatives,
+                                             columns=categories)
+    assert_frame_equal(expected_support, actual_support)
+    assert_frame_equal(expected_unimodal_support, actual_unimodal_support)
+
+
 if __name__ == '__main__':
     test_calculate_alternatives_support(categories, assignments)
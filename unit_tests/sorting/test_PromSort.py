@@ -1,8 +1,10 @@
 import pytest
 import sys
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_series_equal, assert_frame_equal
-from modular_parts.sorting import calculate_promsort_sorted_alternatives
+from modular_parts.sorting import calculate_promsort_sorted_alternatives, \
+    calculate_promsort_cut_points_assignments
 from core.enums import Direction
 
 sys.path.append('../..')
@@ -109,6 +111,60 @@ def test_calculate_promsort_sorted_alternatives(
     assert_series_equal(expected_final_assigments, actual_final_assigments)
 
 
+@pytest.mark.parametrize("cut_points", [[-0.5, 0, 0.5],
+                                        np.array([-0.5, 0, 0.5]),
+                                        (-0.5, 0, 0.5)])
+def test_calculate_promsort_cut_points_assignments(
+        categories,
+        alternatives_flows,
+        category_profiles_flows,
+        criteria_thresholds,
+        category_profiles_performances,
+        criteria_directions,
+        assign_to_better_class,
+        cut_points):
+    alternatives_flows.loc['a13'] = [0.35, 0.8]
+
+    actual_first_assigments, actual_final_assigments = \
+        calculate_promsort_cut_points_assignments(
+            categories, alternatives_flows,
+            category_profiles_flows,
+            criteria_thresholds,
+            category_profiles_performances,
+            criteria_directions,
+            cut_points,
+            assign_to_better_class)
+
+    assert actual_first_assigments.loc['a13'].tolist() == ['C1', 'C2']
+    assert actual_final_assigments.loc['a13'].tolist() == ['C2', 'C2', 'C1']
+    assert (actual_final_assigments.drop('a13').nunique(axis=1) == 1).all()
+    assert_series_equal(actual_first_assigments['worse'].drop('a13'),
+                        actual_final_assigments[0].drop('a13'),
+                        check_names=False)
+
+
+@pytest.mark.parametrize("cut_points", [[], np.array([[0.0, 0.5]]),
+                                        ['a', 'b'], 0.5])
+def test_calculate_promsort_cut_points_assignments_invalid(
+        categories,
+        alternatives_flows,
+        category_profiles_flows,
+        criteria_thresholds,
+        category_profiles_performances,
+        criteria_directions,
+        assign_to_better_class,
+        cut_points):
+    with pytest.raises(ValueError):
+        calculate_promsort_cut_points_assignments(
+            categories, alternatives_flows,
+            category_profiles_flows,
+            criteria_thresholds,
+            category_profiles_performances,
+            criteria_directions,
+            cut_points,
+            assign_to_better_class)
+
+
 if __name__ == '__main__':
     test_calculate_promsort_sorted_alternatives(
         categories,
@@ -182,6 +182,38 @@ def test_calculate_prometheetri_sorted_alternatives(
     assert_series_equal(expected, actual)
 
 
+@pytest.mark.parametrize("assign_to_better_class, use_marginal_value, "
+                         "expected", [
+                             (True, True, ['C1', 'C2', 'C2']),
+                             (False, True, ['C1', 'C2', 'C3']),
+                             (True, False, ['C3', 'C3', 'C3']),
+                             (False, False, ['C3', 'C3', 'C3'])])
+def test_prometheetri_minimal_deviation(assign_to_better_class,
+                                        use_marginal_value, expected):
+    alternatives = ["a1", "a2", "a3"]
+    profiles = ["p1", "p2", "p3"]
+    alternatives_vs_profiles = pd.DataFrame(
+        [[0.0, 0.0, 0.0], [0.5, 0.0, 0.0], [1.0, 1.0, 0.0]],
+        index=alternatives, columns=profiles)
+    profiles_vs_alternatives = pd.DataFrame(
+        [[0.0, 0.0, 0.5], [1.0, 0.0, 0.0], [1.0, 0.5, 0.0]],
+        index=profiles, columns=alternatives)
+    profiles_preferences = pd.DataFrame(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0]],
+        index=profiles, columns=profiles)
+
+    # a1 is closest to p1, a2 is equal to p2 and a3 is equally distant
+    # from p2 and p3
+    actual = calculate_prometheetri_sorted_alternatives(
+        ["C1", "C2", "C3"], pd.Series([1.0], index=["g1"]),
+        (pd.concat([alternatives_vs_profiles], keys=["g1"]),
+         pd.concat([profiles_vs_alternatives], keys=["g1"])),
+        pd.concat([profiles_preferences], keys=["g1"]),
+        assign_to_better_class, use_marginal_value)
+
+    assert_series_equal(pd.Series(expected, index=alternatives), actual)
+
+
 if __name__ == '__main__':
     test_calculate_prometheetri_sorted_alternatives(
         categories,
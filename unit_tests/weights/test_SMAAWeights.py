@@ -0,0 +1,58 @@
+import pytest
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+from modular_parts.weights import sample_smaa_weights, calculate_smaa, \
+    calculate_srf_weights
+
+
+@pytest.fixture
+def single_criterion_net_flows():
+    return pd.DataFrame({
+        'c1': [0.8, 0.5, -0.5],
+        'c2': [0.7, -0.5, 0.5]
+    }, index=['a1', 'a2', 'a3'])
+
+
+@pytest.fixture
+def criteria_ranks():
+    return pd.Series({'c1': 1, 'c2': 2})
+
+
+def test_sample_smaa_weights(criteria_ranks):
+    weights = sample_smaa_weights(criteria_ranks.index, 1000, criteria_ranks,
+                                  criteria_weight_ratio=3, seed=0)
+    assert weights.shape == (1000, 2)
+    assert weights.sum(axis=1).round(9).eq(1).all()
+    # with the ratio ranks follow SRF method (rank 1 is the least important)
+    assert (weights['c2'] >= weights['c1']).all()
+    assert (weights['c2'] <= 3 * weights['c1'] + 1e-9).all()
+
+
+def test_sample_smaa_weights_srf_order():
+    criteria_ranks = pd.Series({'c1': 1, 'c2': 2, 'c3': 2, 'c4': 4})
+    srf_weights = calculate_srf_weights(criteria_ranks, 6, 2)
+    weights = sample_smaa_weights(criteria_ranks.index, 1000,
+                                  criteria_ranks, criteria_weight_ratio=6,
+                                  seed=0)
+    srf_order = srf_weights.sort_values(kind='stable').index
+    for _, sample in weights.iterrows():
+        assert sample[srf_order].is_monotonic_increasing
+    assert (weights['c4'] <= 6 * weights['c1'] + 1e-9).all()
+
+
+def test_smaa(single_criterion_net_flows, criteria_ranks):
+    expected_acceptability = pd.DataFrame([[1.0, 0.0, 0.0],
+                                           [0.0, 1.0, 0.0],
+                                           [0.0, 0.0, 1.0]],
+                                          index=['a1', 'a2', 'a3'],
+                                          columns=[1, 2, 3])
+    acceptability, central_weights = calculate_smaa(
+        single_criterion_net_flows, 20000, criteria_ranks, seed=0)
+    assert_frame_equal(expected_acceptability, acceptability,
+                       check_dtype=False)
+
+    expected_central_weights = pd.Series({'c1': 0.75, 'c2': 0.25},
+                                         name='a1')
+    assert_series_equal(expected_central_weights, central_weights.loc['a1'],
+                        atol=0.006)
+    assert central_weights.loc[['a2', 'a3']].isnull().all().all()
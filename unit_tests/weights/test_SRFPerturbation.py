@@ -0,0 +1,81 @@
+import pytest
+import pandas as pd
+from pandas.testing import assert_series_equal, assert_frame_equal
+import modular_parts.weights.M35_SRFPerturbation as srf_perturbation
+from modular_parts.weights import calculate_srf_weights, \
+    sample_srf_weights, calculate_srf_perturbation
+
+
+@pytest.fixture
+def single_criterion_net_flows():
+    return pd.DataFrame({
+        'c1': [0.8, 0.5, -0.5],
+        'c2': [0.7, -0.5, 0.5],
+        'c3': [0.1, 0.2, 0.3],
+        'c4': [-0.5, 0.5, 0.0]
+    }, index=['a1', 'a2', 'a3'])
+
+
+@pytest.fixture
+def criteria_ranks():
+    return pd.Series({'c1': 1, 'c2': 2, 'c3': 2, 'c4': 4})
+
+
+def test_sample_srf_weights_without_perturbation(criteria_ranks):
+    weights = sample_srf_weights(criteria_ranks, (3, 3), 10, 0, seed=0)
+    expected = calculate_srf_weights(criteria_ranks, 3, 2)
+    for _, sample in weights.iterrows():
+        assert_series_equal(expected, sample, check_names=False, atol=0.01)
+
+
+def test_sample_srf_weights(criteria_ranks):
+    weights = sample_srf_weights(criteria_ranks, (2, 6), 1000, 1, seed=0)
+    assert weights.shape == (1000, 4)
+    assert weights.sum(axis=1).round(9).eq(100).all()
+    assert (weights['c2'] == weights['c3']).all()
+    assert (weights['c1'] < weights['c2']).all()
+    assert (weights['c2'] < weights['c4']).all()
+
+
+def test_srf_perturbation(single_criterion_net_flows, criteria_ranks):
+    weights_summary, net_flows_summary, acceptability = \
+        calculate_srf_perturbation(single_criterion_net_flows,
+                                   criteria_ranks, (3, 3), 100, 0, seed=0)
+    weights = calculate_srf_weights(criteria_ranks, 3, 2)
+    assert_series_equal(weights, weights_summary['mean'], check_names=False,
+                        atol=0.01)
+
+    expected_net_flows = single_criterion_net_flows @ weights / 100
+    assert_series_equal(expected_net_flows, net_flows_summary['50%'],
+                        check_names=False, atol=0.006)
+    assert acceptability.loc['a2', 1] == 1.0
+    assert acceptability.loc['a3', 2] == 1.0
+    assert acceptability.loc['a1', 3] == 1.0
+
+
+def test_srf_perturbation_acceptability(single_criterion_net_flows,
+                                        criteria_ranks):
+    _, _, acceptability = calculate_srf_perturbation(
+        single_criterion_net_flows, criteria_ranks, (2, 6), 2000, 1, seed=0)
+    assert acceptability.shape == (3, 3)
+    assert acceptability.sum(axis=0).round(9).eq(1).all()
+    assert acceptability.sum(axis=1).round(9).eq(1).all()
+
+
+def test_srf_perturbation_chunks(monkeypatch, single_criterion_net_flows,
+                                 criteria_ranks):
+    expected = calculate_srf_perturbation(
+        single_criterion_net_flows, criteria_ranks, (2, 6), 500, 1, seed=0)
+    # one alternative (or two samples) at once
+    monkeypatch.setattr(srf_perturbation, "_FLOWS_CHUNK_SIZE", 6)
+    actual = calculate_srf_perturbation(
+        single_criterion_net_flows, criteria_ranks, (2, 6), 500, 1, seed=0)
+    for expected_summary, actual_summary in zip(expected, actual):
+        assert_frame_equal(expected_summary, actual_summary)
+
+
+def test_srf_perturbation_validation(criteria_ranks):
+    with pytest.raises(ValueError):
+        sample_srf_weights(criteria_ranks, (6, 2), 10)
+    with pytest.raises(ValueError):
+        sample_srf_weights(criteria_ranks, (2, 6), 10, -1)
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
-from pandas.testing import assert_series_equal
-from modular_parts.weights import surrogate_weights
+from pandas.testing import assert_series_equal, assert_frame_equal
+from modular_parts.weights import surrogate_weights, surrogate_weights_batch
 from core.enums import SurrogateMethod
 
 
@@ -34,10 +34,10 @@ def test_equal_weights(criteria_ranks, decimal_place):
 
 def test_rank_sum(criteria_ranks, decimal_place):
     expected = pd.Series({
-        'a': 0.09, 'b': 0.115, 'c': 0.154,
-        'd': 0.141, 'e': 0.103, 'f': 0.115,
-        'g': 0.154, 'h': 0.09, 'i': 0.115,
-        'j': 0.115, 'k': 0.077, 'l': 0.154,
+        'a': 0.032, 'b': 0.083, 'c': 0.141,
+        'd': 0.115, 'e': 0.051, 'f': 0.083,
+        'g': 0.141, 'h': 0.032, 'i': 0.083,
+        'j': 0.083, 'k': 0.013, 'l': 0.141,
     }, name="weights")
     actual = surrogate_weights(criteria_ranks, SurrogateMethod.RS,
                                decimal_place)
@@ -46,10 +46,10 @@ def test_rank_sum(criteria_ranks, decimal_place):
 
 def test_reciprocal_of_ranks(criteria_ranks, decimal_place):
     expected = pd.Series({
-        'a': 0.054, 'b': 0.081, 'c': 0.322,
-        'd': 0.161, 'e': 0.064, 'f': 0.081,
-        'g': 0.322, 'h': 0.054, 'i': 0.081,
-        'j': 0.081, 'k': 0.046, 'l': 0.322,
+        'a': 0.031, 'b': 0.051, 'c': 0.197,
+        'd': 0.081, 'e': 0.036, 'f': 0.051,
+        'g': 0.197, 'h': 0.031, 'i': 0.051,
+        'j': 0.051, 'k': 0.027, 'l': 0.197,
     }, name="weights")
     actual = surrogate_weights(criteria_ranks, SurrogateMethod.RR,
                                decimal_place)
@@ -58,16 +58,57 @@ def test_reciprocal_of_ranks(criteria_ranks, decimal_place):
 
 def test_rank_order_centroid(criteria_ranks, decimal_place):
     expected = pd.Series({
-        'a': 0.068, 'b': 0.106, 'c': 0.259,
-        'd': 0.175, 'e': 0.085, 'f': 0.106,
-        'g': 0.259, 'h': 0.068, 'i': 0.106,
-        'j': 0.106, 'k': 0.054, 'l': 0.259,
+        'a': 0.019, 'b': 0.063, 'c': 0.189,
+        'd': 0.106, 'e': 0.032, 'f': 0.063,
+        'g': 0.189, 'h': 0.019, 'i': 0.063,
+        'j': 0.063, 'k': 0.007, 'l': 0.189,
     }, name="weights")
     actual = surrogate_weights(criteria_ranks, SurrogateMethod.ROC,
                                decimal_place)
     assert_series_equal(expected, actual, atol=0.006)
 
 
+def test_surrogate_weights_batch(decimal_place):
+    criteria_ranks = pd.DataFrame({
+        'c1': [1, 2, 1],
+        'c2': [2, 1, 1],
+        'c3': [3, 3, 2]
+    }, index=['DM1', 'DM2', 'DM3'])
+    expected = pd.DataFrame({
+        'c1': [0.5, 0.333, 0.417],
+        'c2': [0.333, 0.5, 0.417],
+        'c3': [0.167, 0.167, 0.167]
+    }, index=['DM1', 'DM2', 'DM3'])
+    actual = surrogate_weights_batch(criteria_ranks, SurrogateMethod.RS,
+                                     decimal_place)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+    expected = pd.DataFrame({
+        'c1': [0.611, 0.278, 0.444],
+        'c2': [0.278, 0.611, 0.444],
+        'c3': [0.111, 0.111, 0.111]
+    }, index=['DM1', 'DM2', 'DM3'])
+    actual = surrogate_weights_batch(criteria_ranks, SurrogateMethod.ROC,
+                                     decimal_place)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+
+@pytest.mark.parametrize("method, expected", [
+    (SurrogateMethod.RS, [0.417, 0.417, 0.167]),
+    (SurrogateMethod.RR, [0.409, 0.409, 0.182]),
+    (SurrogateMethod.ROC, [0.444, 0.444, 0.111])])
+def test_tied_ranks(method, expected, decimal_place):
+    criteria_ranks = pd.Series({'c1': 1, 'c2': 1, 'c3': 3})
+    actual = surrogate_weights(criteria_ranks, method, decimal_place)
+    assert_series_equal(pd.Series(expected, index=criteria_ranks.index,
+                                  name="weights"), actual, atol=0.006)
+    assert actual.sum() == pytest.approx(1, abs=0.006)
+
+    batch_weights = surrogate_weights_batch(criteria_ranks.to_frame().T,
+                                            method, decimal_place)
+    assert_series_equal(batch_weights.iloc[0], actual, check_names=False)
+
+
 if __name__ == '__main__':
     test_equal_weights(criteria_ranks, decimal_place)
     test_rank_sum(criteria_ranks, decimal_place)
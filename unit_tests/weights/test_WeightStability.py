@@ -0,0 +1,42 @@
+import pytest
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from modular_parts.weights import calculate_weight_stability_intervals
+
+
+@pytest.fixture
+def criteria_weights():
+    return pd.Series({'c1': 0.5, 'c2': 0.3, 'c3': 0.2})
+
+
+@pytest.fixture
+def single_criterion_net_flows():
+    return pd.DataFrame({
+        'c1': [0.6, 0.2, -0.3, -0.5],
+        'c2': [-0.4, 0.1, 0.5, -0.2],
+        'c3': [0.1, -0.3, 0.2, 0.0]
+    }, index=['a1', 'a2', 'a3', 'a4'])
+
+
+def test_weight_stability_intervals(criteria_weights,
+                                    single_criterion_net_flows):
+    expected = pd.DataFrame({
+        'weight': [0.5, 0.3, 0.2],
+        'lower': [0.468, 0.0, 0.0],
+        'upper': [1.0, 0.349, 0.245]
+    }, index=['c1', 'c2', 'c3'])
+    actual = calculate_weight_stability_intervals(
+        criteria_weights, single_criterion_net_flows)
+    assert_frame_equal(expected, actual, atol=0.006)
+
+
+def test_weight_stability_intervals_top_k(criteria_weights,
+                                          single_criterion_net_flows):
+    expected = pd.DataFrame({
+        'weight': [0.5, 0.3, 0.2],
+        'lower': [0.392, 0.0, 0.0],
+        'upper': [1.0, 0.406, 0.692]
+    }, index=['c1', 'c2', 'c3'])
+    actual = calculate_weight_stability_intervals(
+        criteria_weights, single_criterion_net_flows, k=1)
+    assert_frame_equal(expected, actual, atol=0.006)